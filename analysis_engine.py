@@ -4,7 +4,7 @@ Analysis Engine - Valuation, Technical Analysis, and Buy Signal Detection
 import pandas as pd
 import numpy as np
 from scipy import stats
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Union
 import ta
 import logging
 from zero_fcf_valuation import ZeroFCFValuationEngine
@@ -16,6 +16,7 @@ from src.core.constants import (
     RSI_OVERSOLD,
     RSI_OVERBOUGHT
 )
+from src.core.types import TechnicalIndicators, ValuationResult
 
 logger = logging.getLogger(__name__)
 
@@ -1115,45 +1116,69 @@ class GoodBuyAnalyzer:
     
     def analyze_buy_opportunity(self, 
                                 ticker: str,
-                                valuation: Dict,
-                                technical: Dict,
+                                valuation: Union[ValuationResult, Dict],
+                                technical: Union[TechnicalIndicators, Dict],
                                 sentiment: Dict,
                                 info: Dict,
                                 df: pd.DataFrame) -> Dict:
-        """Determine if stock is a good buy and at what price"""
+        """
+        Determine if stock is a good buy and at what price
+        
+        valuation/technical may be the service layer's ValuationResult and
+        TechnicalIndicators (read directly) or the legacy analyzer dicts.
+        """
         
         scores = {}
         signals = []
         
+        # Read the inputs once, whichever form they come in
+        if isinstance(valuation, ValuationResult):
+            upside, fair_value = valuation.upside_pct, valuation.fair_value
+        else:
+            upside, fair_value = valuation.get("upside"), valuation.get("fair_value")
+        
+        rsi, macd_bullish, near_support, volume_ratio, resistance = 50, False, False, 1, None
+        if isinstance(technical, TechnicalIndicators):
+            # Support/resistance and volume ratio aren't part of TechnicalIndicators
+            rsi = technical.rsi
+            macd_bullish = technical.macd > technical.macd_signal
+        elif technical:
+            resistance = technical.get("support_resistance", {}).get("resistance")
+            if "error" not in technical:
+                rsi = technical.get("rsi", {}).get("value", 50)
+                macd_bullish = technical.get("macd", {}).get("bullish", False)
+                near_support = technical.get("support_resistance", {}).get("near_support", False)
+                volume_ratio = technical.get("volume", {}).get("ratio", 1)
+        
         # 1. Valuation Score
         val_score = 0
-        if "upside" in valuation and valuation["upside"] > 15:
-            val_score = min(100, valuation["upside"] * 2)
-            signals.append(f"Undervalued by {valuation['upside']:.1f}%")
+        if upside is not None and upside > 15:
+            val_score = min(100, upside * 2)
+            signals.append(f"Undervalued by {upside:.1f}%")
         scores["valuation"] = val_score
         
         # 2. Technical Score
         tech_score = 0
-        if technical and "error" not in technical:
-            # RSI oversold
-            if technical.get("rsi", {}).get("value", 50) < 35:
-                tech_score += 30
-                signals.append(f"RSI oversold at {technical['rsi']['value']:.1f}")
-            
-            # MACD bullish
-            if technical.get("macd", {}).get("bullish", False):
-                tech_score += 20
-                signals.append("MACD bullish crossover")
-            
-            # Near support
-            if technical.get("support_resistance", {}).get("near_support", False):
-                tech_score += 30
-                signals.append("Near support level")
-            
-            # Volume surge
-            if technical.get("volume", {}).get("ratio", 1) > 1.5:
-                tech_score += 20
-                signals.append("Volume surge detected")
+        
+        # RSI oversold
+        if rsi < 35:
+            tech_score += 30
+            signals.append(f"RSI oversold at {rsi:.1f}")
+        
+        # MACD bullish
+        if macd_bullish:
+            tech_score += 20
+            signals.append("MACD bullish crossover")
+        
+        # Near support
+        if near_support:
+            tech_score += 30
+            signals.append("Near support level")
+        
+        # Volume surge
+        if volume_ratio > 1.5:
+            tech_score += 20
+            signals.append("Volume surge detected")
         
         scores["technical"] = min(100, tech_score)
         
@@ -1219,11 +1244,11 @@ class GoodBuyAnalyzer:
             confidence = "LOW"
         
         # Target price
-        if "fair_value" in valuation:
-            target_price = valuation["fair_value"]
+        if fair_value is not None:
+            target_price = fair_value
         else:
             # Use technical resistance
-            target_price = technical.get("support_resistance", {}).get("resistance", current_price * 1.15)
+            target_price = resistance if resistance is not None else current_price * 1.15
         
         return {
             "ticker": ticker,
@@ -4,6 +4,7 @@ Validates the service with live market data
 """
 import sys
 import io
+from operator import attrgetter
 from typing import Dict
 
 # Fix Windows console encoding for emojis
@@ -221,7 +222,7 @@ def demo_options_analysis():
             
             # Vertical Spread
             if len(calls) >= 2:
-                calls_sorted = sorted(calls, key=lambda c: c.strike)
+                calls_sorted = sorted(calls, key=attrgetter('strike'))
                 long_call = calls_sorted[0]
                 short_call = calls_sorted[1]
                 
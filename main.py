@@ -10,6 +10,8 @@ import streamlit as st
 # Import custom modules
 from data_fetcher import MarketDataFetcher, SentimentScraper
 from analysis_engine import ValuationEngine, TechnicalAnalyzer, GoodBuyAnalyzer, OptionsAnalyzer
+from src.core.file_cache import FileCache
+from src.services.stocks_analysis_service import STOCKS_CACHE_DIR
 
 # Import dashboards
 from dashboard_selector import show_selector, show_dashboard_switcher
@@ -76,7 +78,8 @@ def init_components():
         "valuation": ValuationEngine(),
         "technical": TechnicalAnalyzer(),
         "goodbuy": GoodBuyAnalyzer(),
-        "options": OptionsAnalyzer()
+        "options": OptionsAnalyzer(),
+        "file_cache": FileCache(STOCKS_CACHE_DIR)
     }
 
 components = init_components()
@@ -7,7 +7,10 @@ import streamlit as st
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
+from collections import deque
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -98,10 +101,72 @@ API_RATE_LIMITS = {
         "requests_per_day": 5000,
         "requests_per_hour": 200,
         "requests_per_minute": 10
+    },
+    
+    # Alpha Vantage: 5 requests per minute, 500 per day (free tier)
+    "alpha_vantage": {
+        "requests_per_day": 500,
+        "requests_per_minute": 5
+    },
+    
+    # Finnhub: 60 requests per minute (free tier) - budget 55 to leave headroom
+    "finnhub": {
+        "requests_per_minute": 55
     }
 }
 
 
+class RateLimiter:
+    """
+    Thread-safe sliding-window limiter shared by every caller of one API.
+    
+    acquire() blocks until a request slot is free, so bursts of cache misses
+    are queued instead of failing with 429s.
+    """
+    
+    def __init__(self, max_calls: int, period: float = 60.0, name: str = "api"):
+        self.max_calls = max_calls
+        self.period = period
+        self.name = name
+        self._calls = deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """Wait for a free request slot; returns the seconds spent throttled."""
+        waited = 0.0
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return waited
+                
+                wait = self.period - (now - self._calls[0])
+            
+            if waited == 0.0:
+                logger.info(f"{self.name} rate limit reached ({self.max_calls}/{self.period:.0f}s) - "
+                            f"throttling for {wait:.1f}s")
+            time.sleep(wait)
+            waited += wait
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(api_name: str) -> RateLimiter:
+    """Get the process-wide RateLimiter for an API, sized from API_RATE_LIMITS."""
+    with _rate_limiters_lock:
+        if api_name not in _rate_limiters:
+            per_minute = API_RATE_LIMITS.get(api_name, {}).get("requests_per_minute", 60)
+            _rate_limiters[api_name] = RateLimiter(per_minute, 60.0, api_name)
+        return _rate_limiters[api_name]
+
+
 # ============================================================================
 # ESTIMATED LOAD TIMES (seconds) - Full Analysis Mode
 # ============================================================================
@@ -362,5 +427,7 @@ __all__ = [
     "get_historical_period",
     "get_max_sentiment_sources",
     "APIUsageTracker",
-    "API_RATE_LIMITS"
+    "API_RATE_LIMITS",
+    "RateLimiter",
+    "get_rate_limiter"
 ]
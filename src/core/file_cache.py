@@ -0,0 +1,129 @@
+"""
+Disk Cache
+TTL'd file cache shared by the data pipelines and services - NO Streamlit dependencies
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _json_safe_keys(value: Any) -> Any:
+    """Stringify non-primitive dict keys (e.g. Timestamp columns from DataFrame.to_dict())"""
+    if isinstance(value, dict):
+        return {
+            k if isinstance(k, (str, int, float, bool)) or k is None else str(k): _json_safe_keys(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_json_safe_keys(v) for v in value]
+    return value
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write data to a temp file beside path, then os.replace it into place,
+    so concurrent readers see either the old file or the new one - never a partial write."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class FileCache:
+    """
+    Disk cache that survives app restarts.
+
+    DataFrames are stored as zstd-compressed parquet (dtypes preserved, and
+    readers can project just the columns they need) and dicts as JSON under
+    <root>/<endpoint>/<md5(endpoint, ticker, period)>; freshness is judged
+    by file age against the TTL passed to get().
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def _path(self, endpoint: str, ticker: str, period: str, suffix: str) -> Path:
+        key = hashlib.md5(f"{endpoint}|{ticker}|{period}".encode()).hexdigest()
+        return self.root / endpoint / f"{key}{suffix}"
+
+    def get(self, endpoint: str, ticker: str, ttl: int, period: str = '',
+            columns: Optional[List[str]] = None) -> Optional[Union[pd.DataFrame, Dict]]:
+        """
+        Return the cached value if one exists and is younger than ttl seconds.
+
+        columns restricts a parquet read to those columns (e.g. close-only
+        strategies skip open/high/low on disk).
+        """
+        for suffix in ('.parquet', '.json'):
+            path = self._path(endpoint, ticker, period, suffix)
+            try:
+                if path.exists() and time.time() - path.stat().st_mtime < ttl:
+                    if suffix == '.parquet':
+                        return pd.read_parquet(path, engine='pyarrow', columns=columns)
+                    return json.loads(path.read_text())
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+        return None
+
+    def set(self, endpoint: str, ticker: str, value: Union[pd.DataFrame, Dict],
+            period: str = '') -> None:
+        """Persist a DataFrame (parquet) or dict (JSON); failures are logged, not raised."""
+        if value is None:
+            return
+
+        is_frame = isinstance(value, pd.DataFrame)
+        path = self._path(endpoint, ticker, period, '.parquet' if is_frame else '.json')
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if is_frame:
+                data = value.to_parquet(None, engine='pyarrow', compression='zstd',
+                                        compression_level=3)
+            else:
+                data = json.dumps(_json_safe_keys(value), default=str).encode()
+            atomic_write(path, data)
+        except Exception as e:
+            logger.warning(f"Could not write cache file {path}: {e}")
+
+    def get_or_fetch(self, endpoint: str, ticker: str, ttl: int,
+                     fetch: Callable[[str], Any], period: str = '') -> Any:
+        """
+        Return the cached value, or call fetch(ticker) and persist its result.
+
+        Empty or error results are returned but not written, so a failed
+        request is retried on the next call instead of being served for ttl.
+
+        Args:
+            endpoint: Cache namespace (e.g. 'quote', 'fundamentals')
+            ticker: Stock symbol
+            ttl: Maximum age of a usable cache entry, in seconds
+            fetch: Network call to make on a miss
+            period: Extra key component (e.g. history period)
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        cached = self.get(endpoint, ticker, ttl, period=period)
+        if cached is not None:
+            return cached
+
+        value = fetch(ticker)
+        if isinstance(value, pd.DataFrame):
+            usable = not value.empty
+        else:
+            usable = bool(value) and not (isinstance(value, dict) and "error" in value)
+        if usable:
+            self.set(endpoint, ticker, value, period=period)
+        return value
@@ -0,0 +1,58 @@
+"""
+Script Context
+Carry the caller's Streamlit ScriptRunContext into worker threads - Streamlit is optional
+"""
+from concurrent.futures import Executor, Future
+from functools import wraps
+from typing import Callable
+import threading
+
+try:
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+    STREAMLIT_AVAILABLE = True
+except ImportError:
+    STREAMLIT_AVAILABLE = False
+
+
+def with_script_ctx(fn: Callable) -> Callable:
+    """
+    Bind the caller's ScriptRunContext to fn for running on another thread.
+
+    Without it, st.cache_data lookups, st.session_state writes and st.* UI
+    calls made in the worker miss the session (and log a missing-context
+    warning per call). Outside Streamlit fn is returned unchanged.
+
+    The context stays on the worker thread afterwards, so use this with pools
+    scoped to the call (or the session), not one shared across sessions.
+
+    Args:
+        fn: Callable that will run on a worker thread
+
+    Returns:
+        fn, or a wrapper attaching the context before calling it
+    """
+    ctx = get_script_run_ctx(suppress_warning=True) if STREAMLIT_AVAILABLE else None
+    if ctx is None:
+        return fn
+
+    @wraps(fn)
+    def run(*args, **kwargs):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args, **kwargs)
+
+    return run
+
+
+def submit_with_ctx(executor: Executor, fn: Callable, *args, **kwargs) -> Future:
+    """
+    executor.submit(fn, ...) with the caller's ScriptRunContext attached (see with_script_ctx)
+
+    Args:
+        executor: Pool to run fn on
+        fn: Callable to run
+        *args, **kwargs: Passed through to fn
+
+    Returns:
+        Future for fn's result
+    """
+    return executor.submit(with_script_ctx(fn), *args, **kwargs)
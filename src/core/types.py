@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
 
 
 class Signal(str, Enum):
@@ -277,7 +278,7 @@ class StockAnalysisResult:
         """Get highest confidence signal"""
         if not self.signals:
             return None
-        return max(self.signals, key=lambda s: s.confidence)
+        return max(self.signals, key=attrgetter('confidence'))
     
     def get_overall_score(self) -> float:
         """Calculate overall investment score (0-100)"""
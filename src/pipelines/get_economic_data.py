@@ -9,11 +9,15 @@ Free APIs:
 - EIA: https://www.eia.gov/opendata/register.php (Free, instant approval)
 """
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
 import logging
+import time
 
 try:
     from fredapi import Fred
@@ -27,10 +31,206 @@ try:
 except ImportError:
     EIA_AVAILABLE = False
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
 import requests
 
 logger = logging.getLogger(__name__)
 
+FRED_OBSERVATIONS_URL = 'https://api.stlouisfed.org/fred/series/observations'
+
+# Value column -> (FRED series id, YoY periods, start-date alignment, drop NaN rows)
+FRED_SPECS = {
+    'cpi': ('CPIAUCSL', 12, 'M', False),                # CPI for All Urban Consumers, monthly
+    'fed_funds_rate': ('FEDFUNDS', None, 'M', False),   # Effective Federal Funds Rate, monthly
+    'unemployment_rate': ('UNRATE', None, 'M', False),  # Civilian Unemployment Rate, monthly
+    'gdp': ('GDPC1', 4, 'M', False),                    # Real GDP (chained 2017 $), quarterly
+    'treasury_10y': ('DGS10', None, 'D', True),         # 10-Year Treasury Constant Maturity, daily
+}
+
+# Parquet copies of fetched series so app restarts don't re-download everything
+DISK_CACHE_DIR = Path(__file__).parent.parent.parent / '.cache' / 'econ'
+
+# Cache lifetime (seconds) per series, matched to the publisher's release cadence.
+# Used by both the in-memory TTL buckets and the parquet disk cache.
+DEFAULT_TTL = 86400
+
+SERIES_TTLS = {
+    'CPIAUCSL': 7 * 86400,      # CPI - monthly release
+    'FEDFUNDS': 7 * 86400,      # Fed Funds - monthly average
+    'UNRATE': 7 * 86400,        # Unemployment - monthly release
+    'GDPC1': 30 * 86400,        # Real GDP - quarterly release
+    'DGS10': 86400,             # 10Y Treasury - daily
+    'LNS11300000': 7 * 86400,   # BLS participation - monthly release
+    'RWTC': 86400,              # EIA WTI spot - weekly, checked daily
+    'NATGAS': 86400,            # EIA natural gas futures - daily
+}
+
+
+def _disk_cached(series_id: str, years: int,
+                 fetcher: Callable[[], Optional[pd.DataFrame]]) -> Optional[pd.DataFrame]:
+    """
+    Serve a series from the parquet disk cache, fetching and persisting on a miss.
+    
+    Args:
+        series_id: Upstream series identifier (also selects the TTL)
+        years: Requested history length (part of the cache key)
+        fetcher: Zero-arg callable that downloads the series
+        
+    Returns:
+        Cached or freshly fetched DataFrame (None if the fetch failed)
+    """
+    path = DISK_CACHE_DIR / f"{series_id}_{years}.parquet"
+    ttl = SERIES_TTLS.get(series_id, DEFAULT_TTL)
+    
+    try:
+        if path.exists() and time.time() - path.stat().st_mtime < ttl:
+            return pd.read_parquet(path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable disk cache {path}: {e}")
+    
+    df = fetcher()
+    
+    if df is not None and len(df) > 0:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(path, compression='zstd', index=False)
+        except Exception as e:
+            logger.warning(f"Could not write disk cache {path}: {e}")
+    
+    return df
+
+
+def _stream_eia_columns(response: requests.Response) -> Tuple[List[str], List]:
+    """
+    Pull (period, value) columns out of an EIA v2 response.
+    
+    With ijson installed the records under response.data are parsed one at a
+    time straight off the socket, so the full JSON tree and the intermediate
+    list of dicts are never materialized. Falls back to response.json().
+    
+    Args:
+        response: Streamed (stream=True) EIA API response
+        
+    Returns:
+        Tuple of (periods, values) lists; both empty if no data was returned
+    """
+    periods, values = [], []
+    
+    if IJSON_AVAILABLE:
+        response.raw.decode_content = True  # Let urllib3 undo gzip before parsing
+        records = ijson.items(response.raw, 'response.data.item', use_float=True)
+    else:
+        records = response.json().get('response', {}).get('data', [])
+    
+    for record in records:
+        periods.append(record['period'])
+        values.append(record['value'])
+    
+    return periods, values
+
+
+class _FetchFailed(Exception):
+    """Raised inside a TTL bucket so a failed fetch is not cached."""
+
+
+# One cached function per TTL bucket: st.cache_resource's TTL is fixed per function
+@st.cache_resource(ttl=DEFAULT_TTL, show_spinner=False)
+def _cache_1d(cache_key: Tuple, _fetch: Callable[[], Optional[pd.DataFrame]]) -> pd.DataFrame:
+    return _fetch_or_raise(_fetch)
+
+
+@st.cache_resource(ttl=7 * 86400, show_spinner=False)
+def _cache_7d(cache_key: Tuple, _fetch: Callable[[], Optional[pd.DataFrame]]) -> pd.DataFrame:
+    return _fetch_or_raise(_fetch)
+
+
+@st.cache_resource(ttl=30 * 86400, show_spinner=False)
+def _cache_30d(cache_key: Tuple, _fetch: Callable[[], Optional[pd.DataFrame]]) -> pd.DataFrame:
+    return _fetch_or_raise(_fetch)
+
+
+_TTL_BUCKETS = {
+    DEFAULT_TTL: _cache_1d,
+    7 * 86400: _cache_7d,
+    30 * 86400: _cache_30d,
+}
+
+
+def _fetch_or_raise(fetch: Callable[[], Optional[pd.DataFrame]]) -> pd.DataFrame:
+    """Run a fetch, raising _FetchFailed instead of returning None."""
+    df = fetch()
+    if df is None:
+        raise _FetchFailed()
+    return df
+
+
+def _cached_by_ttl(series_id: str, years: int,
+                   fetcher: Callable[[], Optional[pd.DataFrame]]) -> Optional[pd.DataFrame]:
+    """
+    Serve a series from the in-memory cache bucket matching its release cadence.
+    
+    Misses fall through to the parquet disk cache and then the upstream API.
+    Failed fetches (None) are not cached, so they are retried on the next call.
+    
+    Args:
+        series_id: Upstream series identifier (selects the TTL bucket)
+        years: Requested history length (part of the cache key)
+        fetcher: Zero-arg callable that downloads the series
+        
+    Returns:
+        DataFrame shared by reference across reruns (read-only), or None
+    """
+    bucket = _TTL_BUCKETS[SERIES_TTLS.get(series_id, DEFAULT_TTL)]
+    
+    try:
+        return bucket((series_id, years), lambda: _disk_cached(series_id, years, fetcher))
+    except _FetchFailed:
+        return None
+
+
+@lru_cache(maxsize=16)
+def _start_date(years: int, align: str = 'D', today: Optional[date] = None) -> str:
+    """
+    Compute a stable observation start date for a lookback window.
+    
+    Monthly/quarterly series ('M') snap to the first of the month so the
+    start date (and therefore every cache key built from it) stays fixed
+    all month; daily series ('D') use a leap-year-aware day count.
+    
+    Args:
+        years: Lookback length in years
+        align: 'M' for month-aligned, 'D' for day-aligned
+        today: Reference date (defaults to today; part of the memo key)
+        
+    Returns:
+        ISO formatted start date (YYYY-MM-DD)
+    """
+    today = today or date.today()
+    
+    if align == 'M':
+        first_of_month = today.replace(day=1)
+        return first_of_month.replace(year=first_of_month.year - years).isoformat()
+    
+    return (today - timedelta(days=int(years * 365.25))).isoformat()
+
+
+@lru_cache(maxsize=1)
+def _make_fred(api_key: str) -> 'Fred':
+    """Build the process-wide Fred client (shared by every pipeline instance)."""
+    return Fred(api_key=api_key)
+
 
 class EconomicDataPipeline:
     """
@@ -46,6 +246,8 @@ class EconomicDataPipeline:
         """Initialize with API keys from Streamlit secrets or environment variables."""
         self.fred_client = None
         self.eia_api_key = None
+        self._fred_key = None
+        self._http = requests.Session()
         
         # Try to get API keys
         try:
@@ -58,7 +260,8 @@ class EconomicDataPipeline:
                 self.eia_api_key = os.getenv('EIA_API_KEY')
                 
             if fred_key and FRED_AVAILABLE:
-                self.fred_client = Fred(api_key=fred_key)
+                self._fred_key = fred_key
+                self.fred_client = _make_fred(fred_key)
                 logger.info("FRED API initialized successfully")
             else:
                 logger.warning("FRED API key not found or fredapi not installed")
@@ -72,59 +275,73 @@ class EconomicDataPipeline:
         except Exception as e:
             logger.error(f"Error initializing economic data APIs: {e}")
     
+    def _fred_json(self, series_id: str, start: str, end: Optional[str] = None) -> pd.Series:
+        """
+        Fetch a FRED series from the JSON observations endpoint.
+        
+        Bypasses fredapi's XML + ElementTree path: the payload is parsed with
+        orjson (when installed) and the Series is built from two NumPy arrays.
+        
+        Args:
+            series_id: FRED series identifier (e.g. 'CPIAUCSL')
+            start: Observation start date (YYYY-MM-DD)
+            end: Optional observation end date (YYYY-MM-DD)
+            
+        Returns:
+            Series of observation values indexed by date (missing values are NaN)
+        """
+        params = {
+            'series_id': series_id,
+            'api_key': self._fred_key,
+            'file_type': 'json',
+            'observation_start': start,
+        }
+        if end:
+            params['observation_end'] = end
+        
+        response = self._http.get(FRED_OBSERVATIONS_URL, params=params, timeout=10)
+        response.raise_for_status()
+        obs = _json_loads(response.content)['observations']
+        
+        dates = np.fromiter((o['date'] for o in obs), dtype='U10', count=len(obs))
+        vals = np.fromiter((o['value'] for o in obs), dtype='U20', count=len(obs))
+        
+        # FRED reports missing observations as '.', which coerces to NaN
+        return pd.Series(
+            pd.to_numeric(vals, errors='coerce', downcast='float'),
+            index=pd.to_datetime(dates, format='%Y-%m-%d')
+        )
+    
     # =========================================================================
     # FRED API Methods (Federal Reserve Economic Data)
     # =========================================================================
     
     def get_inflation_data(self, years: int = 10) -> Optional[pd.DataFrame]:
-        """Get inflation data (mode-aware)"""
-        from src.config.performance_config import should_fetch_economic, get_adjusted_ttl
-        
-        if not should_fetch_economic():
-            return None
-        
-        ttl = get_adjusted_ttl(86400)  # Base 24 hours
-        return self._get_inflation_data_cached(years, ttl)
-    
-    @st.cache_data(ttl=86400, show_spinner=False)  # Cache for 24 hours
-    def _get_inflation_data_cached(_self, years: int, ttl: int) -> Optional[pd.DataFrame]:
         """
-        Fetch Consumer Price Index (CPI) data - core inflation metric.
+        Fetch Consumer Price Index (CPI) data - core inflation metric (mode-aware).
         
         Args:
             years: Number of years of historical data
             
         Returns:
             DataFrame with columns: date, cpi, yoy_change
+            Cached by reference and shared across reruns - treat as read-only.
         """
-        if not _self.fred_client:
-            st.warning("⚠️ FRED API not configured. Get free key at: https://fred.stlouisfed.org/docs/api/api_key.html")
+        from src.config.performance_config import should_fetch_economic
+        
+        if not should_fetch_economic():
             return None
-            
-        try:
-            # CPIAUCSL = Consumer Price Index for All Urban Consumers: All Items
-            series_id = 'CPIAUCSL'
-            start_date = (datetime.now() - timedelta(days=years*365)).strftime('%Y-%m-%d')
-            
-            data = _self.fred_client.get_series(series_id, observation_start=start_date)
-            
-            df = pd.DataFrame({
-                'date': data.index,
-                'cpi': data.values
-            })
-            
-            # Calculate year-over-year change
-            df['yoy_change'] = df['cpi'].pct_change(periods=12) * 100  # Monthly data, so 12 periods = 1 year
-            
-            return df.reset_index(drop=True)
-            
-        except Exception as e:
-            logger.error(f"Error fetching CPI data: {e}")
-            st.error(f"❌ Error fetching inflation data: {str(e)}")
+        
+        if not self.fred_client:
+            st.warning("⚠️ FRED API not configured. Get free key at: https://fred.stlouisfed.org/docs/api/api_key.html")
             return None
+        
+        df = self._get_fred_indicator('cpi', years)
+        if df is None:
+            st.error("❌ Error fetching inflation data")
+        return df
     
-    @st.cache_data(ttl=86400, show_spinner=False)
-    def get_interest_rate_data(_self, years: int = 10) -> Optional[pd.DataFrame]:
+    def get_interest_rate_data(self, years: int = 10) -> Optional[pd.DataFrame]:
         """
         Fetch Federal Funds Rate - the rate banks charge each other for overnight loans.
         Critical for REIT valuations, bond yields, mortgage rates.
@@ -134,30 +351,11 @@ class EconomicDataPipeline:
             
         Returns:
             DataFrame with columns: date, fed_funds_rate
+            Cached by reference and shared across reruns - treat as read-only.
         """
-        if not _self.fred_client:
-            return None
-            
-        try:
-            # FEDFUNDS = Effective Federal Funds Rate
-            series_id = 'FEDFUNDS'
-            start_date = (datetime.now() - timedelta(days=years*365)).strftime('%Y-%m-%d')
-            
-            data = _self.fred_client.get_series(series_id, observation_start=start_date)
-            
-            df = pd.DataFrame({
-                'date': data.index,
-                'fed_funds_rate': data.values
-            })
-            
-            return df.reset_index(drop=True)
-            
-        except Exception as e:
-            logger.error(f"Error fetching interest rate data: {e}")
-            return None
+        return self._get_fred_indicator('fed_funds_rate', years)
     
-    @st.cache_data(ttl=86400, show_spinner=False)
-    def get_unemployment_data(_self, years: int = 10) -> Optional[pd.DataFrame]:
+    def get_unemployment_data(self, years: int = 10) -> Optional[pd.DataFrame]:
         """
         Fetch Unemployment Rate - critical labor market indicator.
         High unemployment = consumer weakness = bad for consumer discretionary stocks.
@@ -167,30 +365,11 @@ class EconomicDataPipeline:
             
         Returns:
             DataFrame with columns: date, unemployment_rate
+            Cached by reference and shared across reruns - treat as read-only.
         """
-        if not _self.fred_client:
-            return None
-            
-        try:
-            # UNRATE = Civilian Unemployment Rate
-            series_id = 'UNRATE'
-            start_date = (datetime.now() - timedelta(days=years*365)).strftime('%Y-%m-%d')
-            
-            data = _self.fred_client.get_series(series_id, observation_start=start_date)
-            
-            df = pd.DataFrame({
-                'date': data.index,
-                'unemployment_rate': data.values
-            })
-            
-            return df.reset_index(drop=True)
-            
-        except Exception as e:
-            logger.error(f"Error fetching unemployment data: {e}")
-            return None
+        return self._get_fred_indicator('unemployment_rate', years)
     
-    @st.cache_data(ttl=86400, show_spinner=False)
-    def get_gdp_data(_self, years: int = 10) -> Optional[pd.DataFrame]:
+    def get_gdp_data(self, years: int = 10) -> Optional[pd.DataFrame]:
         """
         Fetch Real GDP - the total economic output.
         GDP growth = bullish for equities, GDP contraction = recession risk.
@@ -200,33 +379,11 @@ class EconomicDataPipeline:
             
         Returns:
             DataFrame with columns: date, gdp, yoy_change
+            Cached by reference and shared across reruns - treat as read-only.
         """
-        if not _self.fred_client:
-            return None
-            
-        try:
-            # GDPC1 = Real Gross Domestic Product (Billions of Chained 2017 Dollars, Quarterly)
-            series_id = 'GDPC1'
-            start_date = (datetime.now() - timedelta(days=years*365)).strftime('%Y-%m-%d')
-            
-            data = _self.fred_client.get_series(series_id, observation_start=start_date)
-            
-            df = pd.DataFrame({
-                'date': data.index,
-                'gdp': data.values
-            })
-            
-            # Calculate year-over-year change
-            df['yoy_change'] = df['gdp'].pct_change(periods=4) * 100  # Quarterly data, so 4 periods = 1 year
-            
-            return df.reset_index(drop=True)
-            
-        except Exception as e:
-            logger.error(f"Error fetching GDP data: {e}")
-            return None
+        return self._get_fred_indicator('gdp', years)
     
-    @st.cache_data(ttl=86400, show_spinner=False)
-    def get_10year_treasury_yield(_self, years: int = 10) -> Optional[pd.DataFrame]:
+    def get_10year_treasury_yield(self, years: int = 10) -> Optional[pd.DataFrame]:
         """
         Fetch 10-Year Treasury Yield - risk-free rate used in DCF models.
         Rising yields = lower stock valuations (higher discount rate).
@@ -236,37 +393,62 @@ class EconomicDataPipeline:
             
         Returns:
             DataFrame with columns: date, treasury_10y
+            Cached by reference and shared across reruns - treat as read-only.
         """
-        if not _self.fred_client:
-            return None
+        return self._get_fred_indicator('treasury_10y', years)
+    
+    def _get_fred_indicator(self, key: str, years: int) -> Optional[pd.DataFrame]:
+        """
+        Fetch one FRED indicator described by FRED_SPECS.
+        
+        Args:
+            key: FRED_SPECS key (also the value column name)
+            years: Number of years of historical data
             
+        Returns:
+            DataFrame with columns: date, <key>[, yoy_change]
+            Cached by reference and shared across reruns - treat as read-only.
+        """
+        if not self.fred_client:
+            return None
+        
+        series_id, yoy_periods, align, drop_missing = FRED_SPECS[key]
+        
         try:
-            # DGS10 = 10-Year Treasury Constant Maturity Rate
-            series_id = 'DGS10'
-            start_date = (datetime.now() - timedelta(days=years*365)).strftime('%Y-%m-%d')
-            
-            data = _self.fred_client.get_series(series_id, observation_start=start_date)
+            start_date = _start_date(years, align, date.today())
             
-            df = pd.DataFrame({
-                'date': data.index,
-                'treasury_10y': data.values
-            })
-            
-            # Remove NaN values (market holidays)
-            df = df.dropna()
+            def fetch() -> Optional[pd.DataFrame]:
+                data = self._fred_json(series_id, start_date)
+                dates, vals = data.index.values, data.values
+                
+                if drop_missing:
+                    # Remove NaN values (market holidays) before building the frame
+                    mask = ~np.isnan(vals)
+                    dates, vals = dates[mask], vals[mask]
+                
+                # Built from arrays, so the index is already a clean RangeIndex
+                df = pd.DataFrame({
+                    'date': dates,
+                    key: vals
+                })
+                
+                if yoy_periods:
+                    # Year-over-year change (12 periods for monthly, 4 for quarterly)
+                    df['yoy_change'] = df[key].pct_change(periods=yoy_periods) * 100
+                
+                return df
             
-            return df.reset_index(drop=True)
+            return _cached_by_ttl(series_id, years, fetch)
             
         except Exception as e:
-            logger.error(f"Error fetching 10-year treasury data: {e}")
+            logger.error(f"Error fetching FRED series {series_id}: {e}")
             return None
     
     # =========================================================================
     # BLS API Methods (Bureau of Labor Statistics)
     # =========================================================================
     
-    @st.cache_data(ttl=86400, show_spinner=False)
-    def get_bls_employment_data(_self, years: int = 5) -> Optional[pd.DataFrame]:
+    def get_bls_employment_data(self, years: int = 5) -> Optional[pd.DataFrame]:
         """
         Fetch detailed employment data from BLS.
         No API key required for basic access.
@@ -276,6 +458,7 @@ class EconomicDataPipeline:
             
         Returns:
             DataFrame with employment metrics
+            Cached by reference and shared across reruns - treat as read-only.
         """
         try:
             # BLS Series ID: LNS11300000 = Labor Force Participation Rate
@@ -292,21 +475,25 @@ class EconomicDataPipeline:
                 'endyear': str(end_year)
             }
             
-            response = requests.post(url, json=payload, timeout=10)
+            def fetch() -> Optional[pd.DataFrame]:
+                response = self._http.post(url, json=payload, timeout=10)
             
-            if response.status_code == 200:
-                data = response.json()
+                if response.status_code == 200:
+                    data = response.json()
                 
-                if 'Results' in data and 'series' in data['Results']:
-                    series = data['Results']['series'][0]['data']
+                    if 'Results' in data and 'series' in data['Results']:
+                        series = data['Results']['series'][0]['data']
                     
-                    df = pd.DataFrame(series)
-                    df['date'] = pd.to_datetime(df['year'] + '-' + df['period'].str.replace('M', '') + '-01')
-                    df['labor_force_participation'] = pd.to_numeric(df['value'])
+                        df = pd.DataFrame(series)
+                        df['date'] = pd.to_datetime(df['year'] + '-' + df['period'].str.replace('M', '') + '-01')
+                        df['labor_force_participation'] = pd.to_numeric(df['value'], downcast='float')
                     
-                    return df[['date', 'labor_force_participation']].sort_values('date').reset_index(drop=True)
+                        # Project away the raw year/period/value strings before caching
+                        return df[['date', 'labor_force_participation']].sort_values('date').reset_index(drop=True)
             
-            return None
+                return None
+            
+            return _cached_by_ttl(series_id, years, fetch)
             
         except Exception as e:
             logger.error(f"Error fetching BLS data: {e}")
@@ -316,8 +503,7 @@ class EconomicDataPipeline:
     # EIA API Methods (Energy Information Administration)
     # =========================================================================
     
-    @st.cache_data(ttl=86400, show_spinner=False)
-    def get_crude_oil_prices(_self, years: int = 5) -> Optional[pd.DataFrame]:
+    def get_crude_oil_prices(self, years: int = 5) -> Optional[pd.DataFrame]:
         """
         Fetch WTI Crude Oil prices from EIA.
         Correlates with XLE (energy sector ETF) and inflation expectations.
@@ -327,8 +513,9 @@ class EconomicDataPipeline:
             
         Returns:
             DataFrame with columns: date, wti_price
+            Cached by reference and shared across reruns - treat as read-only.
         """
-        if not _self.eia_api_key or not EIA_AVAILABLE:
+        if not self.eia_api_key or not EIA_AVAILABLE:
             st.warning("⚠️ EIA API not configured. Get free key at: https://www.eia.gov/opendata/register.php")
             return None
             
@@ -337,40 +524,45 @@ class EconomicDataPipeline:
             series_id = 'PET.RWTC.W'
             
             url = f'https://api.eia.gov/v2/petroleum/pri/spt/data/'
+            start_date = _start_date(years, 'D', date.today())
             
             params = {
-                'api_key': _self.eia_api_key,
+                'api_key': self.eia_api_key,
                 'frequency': 'weekly',
                 'data[0]': 'value',
                 'facets[series][]': 'RWTC',
                 'sort[0][column]': 'period',
-                'sort[0][direction]': 'desc',
+                'sort[0][direction]': 'desc',  # Newest first so the length cap trims the oldest rows
+                'start': start_date,
                 'offset': 0,
                 'length': years * 52  # Weekly data
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            def fetch() -> Optional[pd.DataFrame]:
+                response = self._http.get(url, params=params, timeout=10)
             
-            if response.status_code == 200:
-                data = response.json()
+                if response.status_code == 200:
+                    data = response.json()
                 
-                if 'response' in data and 'data' in data['response']:
-                    records = data['response']['data']
+                    if 'response' in data and 'data' in data['response']:
+                        records = data['response']['data']
                     
-                    df = pd.DataFrame(records)
-                    df['date'] = pd.to_datetime(df['period'])
-                    df['wti_price'] = pd.to_numeric(df['value'])
+                        df = pd.DataFrame(records)
+                        df['date'] = pd.to_datetime(df['period'])
+                        df['wti_price'] = pd.to_numeric(df['value'], downcast='float')
                     
-                    return df[['date', 'wti_price']].sort_values('date').reset_index(drop=True)
+                        # Flip the newest-first response to chronological order
+                        return df[['date', 'wti_price']].iloc[::-1].reset_index(drop=True)
             
-            return None
+                return None
+            
+            return _cached_by_ttl('RWTC', years, fetch)
             
         except Exception as e:
             logger.error(f"Error fetching oil price data: {e}")
             return None
     
-    @st.cache_data(ttl=86400, show_spinner=False)
-    def get_natural_gas_prices(_self, years: int = 5) -> Optional[pd.DataFrame]:
+    def get_natural_gas_prices(self, years: int = 5) -> Optional[pd.DataFrame]:
         """
         Fetch Natural Gas prices from EIA.
         Important for utilities sector and European energy crisis monitoring.
@@ -380,38 +572,42 @@ class EconomicDataPipeline:
             
         Returns:
             DataFrame with columns: date, nat_gas_price
+            Cached by reference and shared across reruns - treat as read-only.
         """
-        if not _self.eia_api_key or not EIA_AVAILABLE:
+        if not self.eia_api_key or not EIA_AVAILABLE:
             return None
             
         try:
             url = f'https://api.eia.gov/v2/natural-gas/pri/fut/data/'
+            start_date = _start_date(years, 'D', date.today())
             
             params = {
-                'api_key': _self.eia_api_key,
+                'api_key': self.eia_api_key,
                 'frequency': 'daily',
                 'data[0]': 'value',
                 'sort[0][column]': 'period',
-                'sort[0][direction]': 'desc',
+                'sort[0][direction]': 'desc',  # Newest first so the length cap trims the oldest rows
+                'start': start_date,
                 'offset': 0,
                 'length': years * 252  # Daily trading data
             }
             
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
+            def fetch() -> Optional[pd.DataFrame]:
+                # Context manager releases the streamed connection even when the body isn't read
+                with self._http.get(url, params=params, timeout=10, stream=True) as response:
+                    if response.status_code == 200:
+                        periods, values = _stream_eia_columns(response)
                 
-                if 'response' in data and 'data' in data['response']:
-                    records = data['response']['data']
-                    
-                    df = pd.DataFrame(records)
-                    df['date'] = pd.to_datetime(df['period'])
-                    df['nat_gas_price'] = pd.to_numeric(df['value'])
-                    
-                    return df[['date', 'nat_gas_price']].sort_values('date').reset_index(drop=True)
+                        if periods:
+                            # Flip the newest-first response to chronological order
+                            return pd.DataFrame({
+                                'date': pd.to_datetime(periods),
+                                'nat_gas_price': pd.to_numeric(values, downcast='float')
+                            }).iloc[::-1].reset_index(drop=True)
             
-            return None
+                return None
+            
+            return _cached_by_ttl('NATGAS', years, fetch)
             
         except Exception as e:
             logger.error(f"Error fetching natural gas data: {e}")
@@ -432,60 +628,72 @@ class EconomicDataPipeline:
             Dictionary with keys: 'inflation', 'interest_rates', 'unemployment', 
             'gdp', 'treasury_10y', 'oil', 'natgas'
         """
+        # BLS needs no key, so it is always fetched
+        tasks = {'labor_participation': self.get_bls_employment_data}
+        
+        # Check each source once here instead of inside every fetcher
+        if self.fred_client is not None:
+            tasks.update({
+                'inflation': self.get_inflation_data,
+                'interest_rates': self.get_interest_rate_data,
+                'unemployment': self.get_unemployment_data,
+                'gdp': self.get_gdp_data,
+                'treasury_10y': self.get_10year_treasury_yield,
+            })
+        else:
+            logger.warning("FRED API not configured - skipping FRED indicators")
+        
+        if self.eia_api_key and EIA_AVAILABLE:
+            tasks.update({
+                'oil': self.get_crude_oil_prices,
+                'natgas': self.get_natural_gas_prices,
+            })
+        else:
+            logger.warning("EIA API not configured - skipping energy prices")
+        
         data_dict = {}
         
         with st.spinner("Fetching macroeconomic data..."):
-            # FRED data
-            data_dict['inflation'] = self.get_inflation_data(years)
-            data_dict['interest_rates'] = self.get_interest_rate_data(years)
-            data_dict['unemployment'] = self.get_unemployment_data(years)
-            data_dict['gdp'] = self.get_gdp_data(years)
-            data_dict['treasury_10y'] = self.get_10year_treasury_yield(years)
-            
-            # BLS data
-            data_dict['labor_participation'] = self.get_bls_employment_data(years)
-            
-            # EIA data
-            data_dict['oil'] = self.get_crude_oil_prices(years)
-            data_dict['natgas'] = self.get_natural_gas_prices(years)
-        
-        # Filter out None values
-        data_dict = {k: v for k, v in data_dict.items() if v is not None}
+            for name, fetcher in tasks.items():
+                df = fetcher(years)
+                if df is not None:
+                    data_dict[name] = df
         
         return data_dict
     
-    def get_current_snapshot(self) -> Dict[str, float]:
+    def get_current_snapshot(self, years: int = 5) -> Dict[str, float]:
         """
         Get the most recent value for each macro indicator.
         Useful for quick dashboard display.
         
+        Reads the last row of the full-horizon frames from get_all_macro_data,
+        so a warm cache serves the snapshot without any extra API calls.
+        
+        Args:
+            years: Horizon passed to get_all_macro_data (shares its cache keys)
+        
         Returns:
             Dictionary with current values
         """
         snapshot = {}
         
+        # (data key, column, snapshot key) - latest value of each column
+        latest_fields = [
+            ('inflation', 'cpi', 'cpi'),
+            ('inflation', 'yoy_change', 'inflation_yoy'),
+            ('interest_rates', 'fed_funds_rate', 'fed_funds_rate'),
+            ('unemployment', 'unemployment_rate', 'unemployment_rate'),
+            ('treasury_10y', 'treasury_10y', 'treasury_10y'),
+            ('oil', 'wti_price', 'wti_oil'),
+        ]
+        
         try:
-            # Get latest data points
-            inflation_df = self.get_inflation_data(years=1)
-            if inflation_df is not None and len(inflation_df) > 0:
-                snapshot['cpi'] = inflation_df['cpi'].iloc[-1]
-                snapshot['inflation_yoy'] = inflation_df['yoy_change'].iloc[-1]
-            
-            rates_df = self.get_interest_rate_data(years=1)
-            if rates_df is not None and len(rates_df) > 0:
-                snapshot['fed_funds_rate'] = rates_df['fed_funds_rate'].iloc[-1]
-            
-            unemployment_df = self.get_unemployment_data(years=1)
-            if unemployment_df is not None and len(unemployment_df) > 0:
-                snapshot['unemployment_rate'] = unemployment_df['unemployment_rate'].iloc[-1]
-            
-            treasury_df = self.get_10year_treasury_yield(years=1)
-            if treasury_df is not None and len(treasury_df) > 0:
-                snapshot['treasury_10y'] = treasury_df['treasury_10y'].iloc[-1]
-            
-            oil_df = self.get_crude_oil_prices(years=1)
-            if oil_df is not None and len(oil_df) > 0:
-                snapshot['wti_oil'] = oil_df['wti_price'].iloc[-1]
+            data = self.get_all_macro_data(years=years)
+            
+            for data_key, column, snapshot_key in latest_fields:
+                df = data.get(data_key)
+                if df is not None and len(df) > 0:
+                    snapshot[snapshot_key] = df[column].iat[-1]
                 
         except Exception as e:
             logger.error(f"Error getting current snapshot: {e}")
@@ -494,6 +702,7 @@ class EconomicDataPipeline:
 
 
 # Convenience function for easy import
+@st.cache_resource
 def get_economic_data_pipeline() -> EconomicDataPipeline:
-    """Factory function to get configured pipeline instance."""
+    """Factory function to get the shared, configured pipeline instance."""
     return EconomicDataPipeline()
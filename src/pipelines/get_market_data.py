@@ -10,14 +10,29 @@ Data Sources:
 Use Cases:
 - Centralized data fetching with caching
 - Multi-exchange crypto data for arbitrage detection
+  (collect get_multi_exchange_prices results and pass them to to_dataframe()
+  for a compact table with categorical symbol/exchange columns)
 - Historical and real-time price data
 """
 
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+import numpy as np
 import pandas as pd
+import requests
 import streamlit as st
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.core.file_cache import FileCache
+from src.core.script_context import submit_with_ctx
 
 try:
     import yfinance as yf
@@ -27,10 +42,23 @@ except ImportError:
 
 try:
     import ccxt
+    import ccxt.async_support as ccxt_async
     CCXT_AVAILABLE = True
 except ImportError:
     CCXT_AVAILABLE = False
 
+try:
+    import ccxt.pro as ccxt_pro
+    CCXT_PRO_AVAILABLE = True
+except ImportError:
+    CCXT_PRO_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
 try:
     from alpha_vantage.timeseries import TimeSeries
     from alpha_vantage.fundamentaldata import FundamentalData
@@ -40,6 +68,334 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Copy-on-write lets frames returned by yfinance/ccxt be sliced and filtered
+# without defensive .copy() calls. Always on from pandas 3.0 (where the option
+# is deprecated), so only opt in on 2.x.
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# Shared keep-alive pool for yfinance and Alpha Vantage HTTP calls, sized for
+# concurrent Streamlit reruns during market-open bursts
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=40,
+    pool_maxsize=100,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+
+def _ttl_cache(ttl: int, maxsize: int = 128):
+    """
+    In-process lru_cache whose entries expire at the next ttl-second boundary.
+    
+    Unlike st.cache_data, hits hand back the cached object without a pickle
+    round-trip, so use it for small, hot, read-only results.
+    """
+    def decorator(func):
+        @lru_cache(maxsize=maxsize)
+        def cached(time_bucket: int, *args, **kwargs):
+            return func(*args, **kwargs)
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return cached(int(time.time() // ttl), *args, **kwargs)
+        
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
+
+ALPHA_VANTAGE_URL = 'https://www.alphavantage.co/query'
+
+# .info field name -> yfinance fast_info key (served by a single quote request)
+FAST_INFO_FIELDS = {
+    'currentPrice': 'lastPrice',
+    'regularMarketPrice': 'lastPrice',
+    'previousClose': 'previousClose',
+    'open': 'open',
+    'dayHigh': 'dayHigh',
+    'dayLow': 'dayLow',
+    'volume': 'lastVolume',
+    'marketCap': 'marketCap',
+    'sharesOutstanding': 'shares',
+    'fiftyTwoWeekHigh': 'yearHigh',
+    'fiftyTwoWeekLow': 'yearLow',
+    'fiftyDayAverage': 'fiftyDayAverage',
+    'twoHundredDayAverage': 'twoHundredDayAverage',
+    'averageVolume': 'threeMonthAverageVolume',
+    'averageVolume10days': 'tenDayAverageVolume',
+    'currency': 'currency',
+    'exchange': 'exchange',
+    'quoteType': 'quoteType',
+}
+
+# Cross-session cache for endpoints that change at most daily
+MARKET_CACHE_DIR = Path(__file__).parent.parent.parent / '.cache' / 'market'
+
+OVERVIEW_DISK_TTL = 90 * 86400   # Fundamentals move with quarterly reports
+EARNINGS_DISK_TTL = 90 * 86400   # Earnings history - quarterly
+OPTIONS_DISK_TTL = 86400         # Options chains - daily
+
+
+_FILE_CACHE = FileCache(MARKET_CACHE_DIR)
+
+# One ccxt client per exchange per process, so keep-alive connections are reused
+_EXCHANGE_POOL: Dict[str, 'ccxt.Exchange'] = {}
+_EXCHANGE_POOL_LOCK = threading.Lock()
+
+
+def _get_exchange(name: str) -> 'ccxt.Exchange':
+    """
+    Get the shared ccxt client for an exchange, creating it on first use.
+    
+    Args:
+        name: ccxt exchange name (binance, coinbase, kraken, etc.)
+        
+    Returns:
+        Pooled ccxt exchange instance
+    """
+    exchange = _EXCHANGE_POOL.get(name)
+    if exchange is not None:
+        return exchange
+    
+    # Streamlit reruns on multiple threads - build each client only once
+    with _EXCHANGE_POOL_LOCK:
+        if name not in _EXCHANGE_POOL:
+            exchange = getattr(ccxt, name)({'enableRateLimit': True})
+            
+            # Load markets up front so no caller pays the (sometimes 10s+) lazy load,
+            # and concurrent first calls can't each trigger it
+            try:
+                exchange.load_markets()
+            except Exception as e:
+                logger.warning(f"Could not preload markets for {name}: {e}")
+            
+            _EXCHANGE_POOL[name] = exchange
+        return _EXCHANGE_POOL[name]
+
+
+def _format_ticker(ticker: Dict, exchange_name: str) -> Dict:
+    """Reduce a raw ccxt ticker to the fields the dashboards display."""
+    return {
+        'symbol': ticker['symbol'],
+        'last': ticker['last'],
+        'bid': ticker['bid'],
+        'ask': ticker['ask'],
+        'volume': ticker['quoteVolume'],
+        'change_24h': ticker.get('percentage', 0),
+        'exchange': exchange_name
+    }
+
+
+def to_dataframe(results: Dict[str, Dict]) -> pd.DataFrame:
+    """
+    Flatten get_multi_exchange_prices output into a compact table.
+    
+    symbol and exchange repeat across rows, so they are stored as categoricals
+    (integer codes + one copy of each string) instead of object columns.
+    
+    Args:
+        results: Dictionary mapping exchange_name -> ticker_data
+        
+    Returns:
+        DataFrame with one row per exchange quote
+    """
+    df = pd.DataFrame(list(results.values()))
+    
+    for col in ('symbol', 'exchange'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    
+    return df
+
+
+def _downcast_ohlcv(df: pd.DataFrame, dtype: str = 'float32') -> pd.DataFrame:
+    """
+    Shrink an OHLCV frame for caching by casting float price columns to `dtype`.
+    
+    Volume is left as-is (int64 for stocks, float64 for fractional crypto volume)
+    so downstream sums and products can't overflow or lose precision.
+    Pass dtype='float64' to leave prices untouched.
+    """
+    if dtype == 'float64':
+        return df
+    
+    volume_cols = [c for c in df.columns if str(c).lower() == 'volume']
+    price_cols = df.select_dtypes('float64').columns.difference(volume_cols)
+    df[price_cols] = df[price_cols].astype(dtype)
+    
+    return df
+
+
+async def _async_clients(exchanges: List[str]) -> List['ccxt_async.Exchange']:
+    """
+    Build async ccxt clients seeded with the pooled clients' preloaded markets.
+    
+    Async clients are bound to the event loop that asyncio.run() creates per
+    call, so they can't be pooled themselves - but copying the markets means
+    a fresh client never reloads the exchange's full market list.
+    
+    Args:
+        exchanges: ccxt exchange names
+        
+    Returns:
+        One async client per exchange, in order (caller closes them)
+    """
+    # First use loads markets synchronously - keep that off the event loop, in parallel
+    pooled = await asyncio.gather(*(asyncio.to_thread(_get_exchange, name) for name in exchanges))
+    
+    clients = []
+    for name, exchange in zip(exchanges, pooled):
+        client = getattr(ccxt_async, name)({'enableRateLimit': True})
+        if exchange.markets:
+            client.set_markets(exchange.markets)
+        clients.append(client)
+    return clients
+
+
+async def _async_multi_fetch(symbol: str, exchanges: List[str]) -> Dict[str, Dict]:
+    """
+    Fetch one trading pair from several exchanges concurrently.
+    
+    Args:
+        symbol: Trading pair (e.g., 'BTC/USDT')
+        exchanges: ccxt exchange names
+        
+    Returns:
+        Dictionary mapping exchange_name -> ticker_data (failed exchanges omitted)
+    """
+    clients = await _async_clients(exchanges)
+    
+    try:
+        tickers = await asyncio.gather(
+            *(client.fetch_ticker(symbol) for client in clients),
+            return_exceptions=True
+        )
+    finally:
+        await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+    
+    results = {}
+    for exchange_name, ticker in zip(exchanges, tickers):
+        if isinstance(ticker, Exception):
+            logger.error(f"Error fetching {symbol} from {exchange_name}: {ticker}")
+            continue
+        results[exchange_name] = _format_ticker(ticker, exchange_name)
+    
+    return results
+
+
+async def _async_fetch_all_tickers(exchanges: List[str]) -> Dict[str, Dict]:
+    """
+    Fetch the full ticker book of several exchanges concurrently.
+    
+    One fetch_tickers() request per exchange covers every symbol it lists,
+    so multi-symbol scans index the result locally instead of issuing one
+    request per symbol per exchange. For a single symbol _async_multi_fetch
+    is far cheaper.
+    
+    Args:
+        exchanges: ccxt exchange names
+        
+    Returns:
+        Dictionary mapping exchange_name -> {symbol: raw ccxt ticker}
+        (exchanges without fetchTickers support, or that failed, are omitted)
+    """
+    clients = await _async_clients(exchanges)
+    
+    try:
+        books = await asyncio.gather(
+            *(client.fetch_tickers() for client in clients if client.has.get('fetchTickers')),
+            return_exceptions=True
+        )
+    finally:
+        await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+    
+    supported = [name for name, client in zip(exchanges, clients) if client.has.get('fetchTickers')]
+    
+    results = {}
+    for exchange_name, book in zip(supported, books):
+        if isinstance(book, Exception):
+            logger.error(f"Error fetching tickers from {exchange_name}: {book}")
+            continue
+        results[exchange_name] = book
+    
+    return results
+
+
+async def stream_crypto_ticker(symbol: str, exchange_name: str = 'binance'):
+    """
+    Async generator yielding live tickers pushed over the exchange websocket.
+    
+    Args:
+        symbol: Trading pair (e.g., 'BTC/USDT')
+        exchange_name: ccxt.pro exchange name (binance, coinbase, kraken, etc.)
+        
+    Yields:
+        Raw ccxt ticker dictionaries as the exchange publishes them
+    """
+    exchange = getattr(ccxt_pro, exchange_name)({'enableRateLimit': True})
+    
+    try:
+        while True:
+            yield await exchange.watch_ticker(symbol)
+    finally:
+        await exchange.close()
+
+
+# Latest websocket tick per (exchange, symbol), written by one background stream each
+_LIVE_TICKERS: Dict[Tuple[str, str], Dict] = {}
+_LIVE_STREAMS: Dict[Tuple[str, str], threading.Thread] = {}
+_LIVE_LOCK = threading.Lock()
+STREAM_RECONNECT_DELAY = 5  # seconds
+
+
+async def _pump_ticker_stream(symbol: str, exchange_name: str):
+    """Copy ticks from stream_crypto_ticker() into _LIVE_TICKERS, reconnecting on errors."""
+    key = (exchange_name, symbol)
+    
+    while True:
+        try:
+            async for ticker in stream_crypto_ticker(symbol, exchange_name):
+                formatted = _format_ticker(ticker, exchange_name)
+                with _LIVE_LOCK:
+                    _LIVE_TICKERS[key] = formatted
+        except Exception as e:
+            logger.warning(f"Ticker stream {symbol}@{exchange_name} dropped: {e}")
+            # Don't serve a frozen price while reconnecting
+            with _LIVE_LOCK:
+                _LIVE_TICKERS.pop(key, None)
+            await asyncio.sleep(STREAM_RECONNECT_DELAY)
+
+
+def start_ticker_stream(symbol: str, exchange_name: str = 'binance') -> bool:
+    """
+    Start a background websocket stream for a pair (no-op if already running).
+    
+    Args:
+        symbol: Trading pair (e.g., 'BTC/USDT')
+        exchange_name: ccxt.pro exchange name
+        
+    Returns:
+        True if a stream is running for the pair, False if ccxt.pro is unavailable
+    """
+    if not CCXT_PRO_AVAILABLE:
+        return False
+    
+    key = (exchange_name, symbol)
+    
+    with _LIVE_LOCK:
+        if key not in _LIVE_STREAMS:
+            thread = threading.Thread(
+                target=asyncio.run,
+                args=(_pump_ticker_stream(symbol, exchange_name),),
+                name=f"ticker-stream-{exchange_name}-{symbol}",
+                daemon=True
+            )
+            _LIVE_STREAMS[key] = thread
+            thread.start()
+            logger.info(f"Started ticker stream for {symbol} on {exchange_name}")
+    
+    return True
+
 
 class MarketDataPipeline:
     """
@@ -49,6 +405,8 @@ class MarketDataPipeline:
     def __init__(self):
         """Initialize with API keys from Streamlit secrets or environment."""
         self.alpha_vantage_key = None
+        self._ts_client = None
+        self._fd_client = None
         
         try:
             if hasattr(st, 'secrets'):
@@ -57,28 +415,41 @@ class MarketDataPipeline:
                 import os
                 self.alpha_vantage_key = os.getenv('ALPHA_VANTAGE_API_KEY')
             
-            if self.alpha_vantage_key and ALPHA_VANTAGE_AVAILABLE:
-                self.ts_client = TimeSeries(key=self.alpha_vantage_key, output_format='pandas')
-                self.fd_client = FundamentalData(key=self.alpha_vantage_key, output_format='pandas')
-                logger.info("Alpha Vantage API initialized")
-            else:
+            if not (self.alpha_vantage_key and ALPHA_VANTAGE_AVAILABLE):
                 logger.warning("Alpha Vantage API key not found")
                 
         except Exception as e:
             logger.error(f"Error initializing Alpha Vantage: {e}")
     
+    # Alpha Vantage clients are built on first use - most sessions never touch them
+    @property
+    def ts_client(self) -> Optional['TimeSeries']:
+        """Alpha Vantage TimeSeries client (None if not configured)."""
+        if self._ts_client is None and self.alpha_vantage_key and ALPHA_VANTAGE_AVAILABLE:
+            self._ts_client = TimeSeries(key=self.alpha_vantage_key, output_format='pandas')
+        return self._ts_client
+    
+    @property
+    def fd_client(self) -> Optional['FundamentalData']:
+        """Alpha Vantage FundamentalData client (None if not configured)."""
+        if self._fd_client is None and self.alpha_vantage_key and ALPHA_VANTAGE_AVAILABLE:
+            self._fd_client = FundamentalData(key=self.alpha_vantage_key, output_format='pandas')
+        return self._fd_client
+    
     # =========================================================================
     # Stock Data (yfinance)
     # =========================================================================
     
     @st.cache_data(ttl=300, show_spinner=False)  # 5-minute cache for real-time data
-    def get_stock_data(_self, ticker: str, period: str = '1y') -> Optional[pd.DataFrame]:
+    def get_stock_data(_self, ticker: str, period: str = '1y',
+                       dtype: str = 'float32') -> Optional[pd.DataFrame]:
         """
         Fetch historical stock price data.
         
         Args:
             ticker: Stock ticker symbol
             period: Data period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+            dtype: Float dtype for price columns ('float64' keeps full precision)
             
         Returns:
             DataFrame with OHLCV data
@@ -88,62 +459,172 @@ class MarketDataPipeline:
             return None
         
         try:
-            stock = yf.Ticker(ticker)
+            stock = yf.Ticker(ticker, session=_HTTP_SESSION)
             df = stock.history(period=period)
             
             if len(df) == 0:
                 logger.warning(f"No data found for {ticker}")
                 return None
             
-            return df
+            return _downcast_ohlcv(df, dtype)
             
         except Exception as e:
             logger.error(f"Error fetching stock data for {ticker}: {e}")
             return None
     
-    @st.cache_data(ttl=3600, show_spinner=False)  # 1-hour cache
-    def get_stock_info(_self, ticker: str) -> Optional[Dict]:
+    @st.cache_data(ttl=300, show_spinner=False)
+    def get_stock_data_batch(_self, tickers: List[str], period: str = '1y') -> Dict[str, pd.DataFrame]:
+        """
+        Fetch historical price data for many tickers in one batched download.
+        
+        yfinance fetches the symbols in parallel behind a single call, so use
+        this instead of looping over get_stock_data.
+        
+        Args:
+            tickers: Stock ticker symbols
+            period: Data period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+            
+        Returns:
+            Dictionary mapping ticker -> OHLCV DataFrame (tickers with no data omitted)
+        """
+        if not YFINANCE_AVAILABLE or not tickers:
+            return {}
+        
+        try:
+            raw = yf.download(tickers, period=period, group_by='ticker', auto_adjust=True,
+                              threads=True, progress=False, session=_HTTP_SESSION)
+            
+            if raw is None or len(raw) == 0:
+                return {}
+            
+            results = {}
+            
+            for ticker in tickers:
+                if isinstance(raw.columns, pd.MultiIndex):
+                    if ticker not in raw.columns.get_level_values(0):
+                        continue
+                    df = raw[ticker]
+                else:
+                    df = raw  # Single ticker without a ticker column level
+                
+                df = df.dropna(how='all')
+                
+                if len(df) == 0:
+                    logger.warning(f"No data found for {ticker}")
+                    continue
+                
+                results[ticker] = df
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error batch fetching stock data for {tickers}: {e}")
+            return {}
+    
+    def get_stock_info(self, ticker: str, fields: Optional[List[str]] = None) -> Optional[Dict]:
         """
         Fetch stock fundamentals and company info.
         
+        By default the full .info scrape is returned. When every requested
+        field is in FAST_INFO_FIELDS, they are served by yfinance's fast_info
+        instead (one quote request, no scrape).
+        
+        Args:
+            ticker: Stock ticker symbol
+            fields: .info-style field names to return (None = full .info)
+        
         Returns:
-            Dictionary with company info, metrics, fundamentals
+            Dictionary with company info, metrics, fundamentals.
+            Shared cached object - treat as read-only.
         """
+        return self._get_stock_info_cached(ticker, tuple(fields) if fields else None)
+    
+    @_ttl_cache(ttl=3600, maxsize=256)  # 1-hour cache
+    def _get_stock_info_cached(self, ticker: str, fields: Optional[Tuple[str, ...]]) -> Optional[Dict]:
         if not YFINANCE_AVAILABLE:
             return None
         
         try:
-            stock = yf.Ticker(ticker)
+            stock = yf.Ticker(ticker, session=_HTTP_SESSION)
+            
+            if fields is None:
+                return stock.info
+            
+            if all(f in FAST_INFO_FIELDS for f in fields):
+                fast = stock.fast_info
+                info = {}
+                for field in fields:
+                    try:
+                        info[field] = fast[FAST_INFO_FIELDS[field]]
+                    except Exception:
+                        continue  # Not available for this instrument
+                return info
+            
+            # Slow path: full scrape, trimmed to what was asked for
             info = stock.info
-            return info
+            return {f: info.get(f) for f in fields}
             
         except Exception as e:
             logger.error(f"Error fetching info for {ticker}: {e}")
             return None
     
     @st.cache_data(ttl=3600, show_spinner=False)
-    def get_options_chain(_self, ticker: str) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+    def get_options_chain(_self, ticker: str,
+                          all_expirations: bool = False) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
         """
         Fetch options chain data.
         
+        Args:
+            ticker: Stock ticker symbol
+            all_expirations: If True, fetch every listed expiration (concurrently)
+                and tag rows with an 'expiration' column; otherwise nearest only
+            
         Returns:
             Tuple of (calls_df, puts_df)
         """
         if not YFINANCE_AVAILABLE:
             return None
         
+        scope = 'all' if all_expirations else ''
+        calls = _FILE_CACHE.get('options_calls', ticker, OPTIONS_DISK_TTL, period=scope)
+        puts = _FILE_CACHE.get('options_puts', ticker, OPTIONS_DISK_TTL, period=scope)
+        if calls is not None and puts is not None:
+            return (calls, puts)
+        
         try:
-            stock = yf.Ticker(ticker)
+            stock = yf.Ticker(ticker, session=_HTTP_SESSION)
             expirations = stock.options
             
             if len(expirations) == 0:
                 return None
             
-            # Get nearest expiration
-            nearest_exp = expirations[0]
-            opt_chain = stock.option_chain(nearest_exp)
+            if all_expirations:
+                # Each option_chain call is one HTTP round-trip; overlap them
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    chains = list(executor.map(stock.option_chain, expirations))
+                
+                calls_list, puts_list = [], []
+                for exp, chain in zip(expirations, chains):
+                    calls_list.append(chain.calls.assign(expiration=exp))
+                    puts_list.append(chain.puts.assign(expiration=exp))
+                
+                # One concat per side instead of growing a frame per expiration
+                calls = pd.concat(calls_list, ignore_index=True)
+                puts = pd.concat(puts_list, ignore_index=True)
+                
+                # A handful of expiration strings repeated across thousands of rows
+                calls['expiration'] = calls['expiration'].astype('category')
+                puts['expiration'] = puts['expiration'].astype('category')
+            else:
+                # Get nearest expiration
+                nearest_exp = expirations[0]
+                opt_chain = stock.option_chain(nearest_exp)
+                calls, puts = opt_chain.calls, opt_chain.puts
+            
+            _FILE_CACHE.set('options_calls', ticker, calls, period=scope)
+            _FILE_CACHE.set('options_puts', ticker, puts, period=scope)
             
-            return (opt_chain.calls, opt_chain.puts)
+            return (calls, puts)
             
         except Exception as e:
             logger.error(f"Error fetching options for {ticker}: {e}")
@@ -153,36 +634,44 @@ class MarketDataPipeline:
     # Crypto Data (ccxt)
     # =========================================================================
     
-    @st.cache_data(ttl=60, show_spinner=False)  # 1-minute cache for crypto
-    def get_crypto_ticker(_self, symbol: str, exchange_name: str = 'binance') -> Optional[Dict]:
+    def get_crypto_ticker(self, symbol: str, exchange_name: str = 'binance',
+                          live: bool = False) -> Optional[Dict]:
         """
         Fetch current crypto ticker data from exchange.
         
+        Pairs with a running websocket stream are answered from the latest
+        pushed tick; everything else falls back to the 1-minute REST cache.
+        
         Args:
             symbol: Trading pair (e.g., 'BTC/USDT')
             exchange_name: Exchange name (binance, coinbase, kraken, etc.)
+            live: Start a background ccxt.pro stream for this pair (if installed)
             
         Returns:
-            Dictionary with price, volume, bid/ask
+            Dictionary with price, volume, bid/ask.
+            Shared cached object - treat as read-only.
         """
+        tick = _LIVE_TICKERS.get((exchange_name, symbol))
+        if tick is not None:
+            return tick
+        
+        if live:
+            start_ticker_stream(symbol, exchange_name)
+        
+        return self._fetch_crypto_ticker(symbol, exchange_name)
+    
+    @_ttl_cache(ttl=60, maxsize=512)  # 1-minute cache for crypto
+    def _fetch_crypto_ticker(self, symbol: str, exchange_name: str) -> Optional[Dict]:
+        """REST fallback for get_crypto_ticker()."""
         if not CCXT_AVAILABLE:
             st.warning("⚠️ ccxt not installed. Run: pip install ccxt")
             return None
         
         try:
-            exchange_class = getattr(ccxt, exchange_name)
-            exchange = exchange_class()
+            exchange = _get_exchange(exchange_name)
             ticker = exchange.fetch_ticker(symbol)
             
-            return {
-                'symbol': ticker['symbol'],
-                'last': ticker['last'],
-                'bid': ticker['bid'],
-                'ask': ticker['ask'],
-                'volume': ticker['quoteVolume'],
-                'change_24h': ticker.get('percentage', 0),
-                'exchange': exchange_name
-            }
+            return _format_ticker(ticker, exchange_name)
             
         except Exception as e:
             logger.error(f"Error fetching {symbol} from {exchange_name}: {e}")
@@ -207,18 +696,106 @@ class MarketDataPipeline:
         if exchanges is None:
             exchanges = ['binance', 'coinbase', 'kraken', 'bybit', 'okx']
         
-        results = {}
+        # All exchanges are queried concurrently: wall time ~ slowest exchange, not the sum
+        try:
+            return asyncio.run(_async_multi_fetch(symbol, list(exchanges)))
+        except Exception as e:
+            logger.error(f"Error fetching {symbol} across exchanges: {e}")
+            return {}
+    
+    def get_multi_exchange_prices_batch(self, symbols: List[str],
+                                        exchanges: List[str] = None) -> Dict[str, Dict[str, Dict]]:
+        """
+        Fetch several trading pairs across multiple exchanges.
+        
+        With more than one symbol, each exchange's full ticker book is fetched
+        once (cached 60s) and indexed locally instead of one request per
+        symbol per exchange; a single symbol uses get_multi_exchange_prices.
         
-        for exchange_name in exchanges:
-            ticker = _self.get_crypto_ticker(symbol, exchange_name)
-            if ticker:
-                results[exchange_name] = ticker
+        Args:
+            symbols: Trading pairs (e.g., ['BTC/USDT', 'ETH/USDT'])
+            exchanges: List of exchange names (default: same as get_multi_exchange_prices)
+            
+        Returns:
+            Dictionary mapping symbol -> {exchange_name -> ticker_data}
+        """
+        if not CCXT_AVAILABLE or not symbols:
+            return {}
+        
+        if exchanges is None:
+            exchanges = ['binance', 'coinbase', 'kraken', 'bybit', 'okx']
+        
+        if len(symbols) == 1:
+            return {symbols[0]: self.get_multi_exchange_prices(symbols[0], exchanges)}
+        
+        books = self._get_ticker_books(tuple(exchanges))
+        
+        results = {}
+        for symbol in symbols:
+            quotes = {}
+            for exchange_name in exchanges:
+                book = books.get(exchange_name)
+                
+                if book is None:
+                    # Exchange has no bulk endpoint (or it failed) - fall back to a single request
+                    ticker = self.get_crypto_ticker(symbol, exchange_name)
+                    if ticker:
+                        quotes[exchange_name] = ticker
+                elif symbol in book:
+                    quotes[exchange_name] = _format_ticker(book[symbol], exchange_name)
+            results[symbol] = quotes
         
         return results
     
+    @st.cache_resource(ttl=60, show_spinner=False)
+    def _get_ticker_books(_self, exchanges: Tuple[str, ...]) -> Dict[str, Dict]:
+        """
+        Fetch and cache full ticker books for a set of exchanges.
+        
+        All exchanges are queried concurrently, so wall time is the slowest
+        exchange rather than the sum. Cached by reference - treat as read-only.
+        """
+        try:
+            return asyncio.run(_async_fetch_all_tickers(list(exchanges)))
+        except Exception as e:
+            logger.error(f"Error fetching ticker books from {exchanges}: {e}")
+            return {}
+    
+    @st.cache_resource(ttl=60, show_spinner=False)
+    def get_all_tickers(_self, exchange_name: str = 'binance') -> Optional[Dict[str, Dict]]:
+        """
+        Fetch every ticker an exchange lists in a single request.
+        
+        Use this for multi-symbol scans on one exchange instead of calling
+        get_crypto_ticker per symbol.
+        
+        Args:
+            exchange_name: Exchange name (binance, coinbase, kraken, etc.)
+            
+        Returns:
+            Dictionary mapping symbol -> raw ccxt ticker (None if unsupported or failed).
+            Cached by reference - treat as read-only.
+        """
+        if not CCXT_AVAILABLE:
+            return None
+        
+        try:
+            exchange = _get_exchange(exchange_name)
+            
+            if not exchange.has.get('fetchTickers'):
+                return None
+            
+            return exchange.fetch_tickers()
+            
+        except Exception as e:
+            logger.error(f"Error fetching all tickers from {exchange_name}: {e}")
+            return None
+    
     @st.cache_data(ttl=300, show_spinner=False)
     def get_crypto_ohlcv(_self, symbol: str, exchange_name: str = 'binance', 
-                         timeframe: str = '1d', limit: int = 365) -> Optional[pd.DataFrame]:
+                         timeframe: str = '1d', limit: int = 365,
+                         dtype: str = 'float32',
+                         to_pandas: bool = True) -> Optional[Union[pd.DataFrame, 'pl.DataFrame']]:
         """
         Fetch historical OHLCV data for cryptocurrency.
         
@@ -227,6 +804,10 @@ class MarketDataPipeline:
             exchange_name: Exchange name
             timeframe: Candle timeframe (1m, 5m, 15m, 1h, 4h, 1d, 1w)
             limit: Number of candles to fetch
+            dtype: Float dtype for price columns ('float64' keeps full precision)
+            to_pandas: Return a pandas DataFrame indexed by timestamp (default).
+                False returns a columnar Polars DataFrame with a 'timestamp'
+                column when polars is installed.
             
         Returns:
             DataFrame with OHLCV data
@@ -235,14 +816,35 @@ class MarketDataPipeline:
             return None
         
         try:
-            exchange_class = getattr(ccxt, exchange_name)
-            exchange = exchange_class()
+            exchange = _get_exchange(exchange_name)
             
             ohlcv = exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
             
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
+            # One typed allocation for the whole [timestamp, o, h, l, c, v] block
+            arr = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+            
+            if not to_pandas:
+                if POLARS_AVAILABLE:
+                    return pl.DataFrame({
+                        'timestamp': pl.from_epoch(pl.Series(arr[:, 0].astype(np.int64)), time_unit='ms'),
+                        'open': arr[:, 1].astype(dtype),
+                        'high': arr[:, 2].astype(dtype),
+                        'low': arr[:, 3].astype(dtype),
+                        'close': arr[:, 4].astype(dtype),
+                        'volume': arr[:, 5],
+                    })
+                logger.warning("polars not installed - returning pandas OHLCV")
+            
+            df = pd.DataFrame(
+                {
+                    'open': arr[:, 1].astype(dtype),
+                    'high': arr[:, 2].astype(dtype),
+                    'low': arr[:, 3].astype(dtype),
+                    'close': arr[:, 4].astype(dtype),
+                    'volume': arr[:, 5],
+                },
+                index=pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms').rename('timestamp')
+            )
             
             return df
             
@@ -264,15 +866,37 @@ class MarketDataPipeline:
             ticker: Stock ticker symbol
             
         Returns:
-            Dictionary with fundamental metrics
+            Flat dictionary of fundamental metrics (field -> value, as Alpha Vantage strings)
         """
         if not _self.alpha_vantage_key or not ALPHA_VANTAGE_AVAILABLE:
             st.warning("⚠️ Alpha Vantage API key not configured")
             return None
         
+        cached = _FILE_CACHE.get('overview', ticker, OVERVIEW_DISK_TTL)
+        if cached is not None:
+            return cached
+        
         try:
-            data, _ = _self.fd_client.get_company_overview(ticker)
-            return data.to_dict()
+            from src.config.performance_config import get_rate_limiter
+            get_rate_limiter('alpha_vantage').acquire()
+            
+            # Flat JSON object - no tabular processing needed, so skip pandas entirely
+            response = _HTTP_SESSION.get(
+                ALPHA_VANTAGE_URL,
+                params={'function': 'OVERVIEW', 'symbol': ticker, 'apikey': _self.alpha_vantage_key},
+                timeout=10
+            )
+            response.raise_for_status()
+            overview = response.json()
+            
+            # Unknown symbols return {}; rate limiting returns a 'Note'/'Information' message
+            if 'Symbol' not in overview:
+                message = overview.get('Note') or overview.get('Information') or 'empty response'
+                logger.warning(f"No company overview for {ticker}: {message}")
+                return None
+            
+            _FILE_CACHE.set('overview', ticker, overview)
+            return overview
             
         except Exception as e:
             logger.error(f"Error fetching company overview for {ticker}: {e}")
@@ -292,8 +916,16 @@ class MarketDataPipeline:
         if not _self.alpha_vantage_key or not ALPHA_VANTAGE_AVAILABLE:
             return None
         
+        cached = _FILE_CACHE.get('earnings', ticker, EARNINGS_DISK_TTL)
+        if cached is not None:
+            return cached
+        
         try:
-            data, _ = _self.fd_client.get_earnings(ticker)
+            from src.config.performance_config import get_rate_limiter
+            get_rate_limiter('alpha_vantage').acquire()
+            
+            data, _ = _self.fd_client.get_earnings_quarterly(ticker)
+            _FILE_CACHE.set('earnings', ticker, data)
             return data
             
         except Exception as e:
@@ -315,23 +947,31 @@ class MarketDataPipeline:
         Returns:
             Dictionary with all available data
         """
-        result = {}
-        
         if is_crypto:
-            result['current_price'] = self.get_crypto_ticker(ticker)
-            result['historical_data'] = self.get_crypto_ohlcv(ticker)
-            result['multi_exchange'] = self.get_multi_exchange_prices(ticker)
+            calls = {
+                'current_price': self.get_crypto_ticker,
+                'historical_data': self.get_crypto_ohlcv,
+                'multi_exchange': self.get_multi_exchange_prices,
+            }
         else:
-            result['historical_data'] = self.get_stock_data(ticker)
-            result['info'] = self.get_stock_info(ticker)
-            result['options'] = self.get_options_chain(ticker)
-            result['fundamentals'] = self.get_company_overview(ticker)
-            result['earnings'] = self.get_earnings_history(ticker)
+            calls = {
+                'historical_data': self.get_stock_data,
+                'info': self.get_stock_info,
+                'options': self.get_options_chain,
+                'fundamentals': self.get_company_overview,
+                'earnings': self.get_earnings_history,
+            }
+        
+        # Independent I/O-bound fetches: wall time ~ slowest call, not the sum
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = {key: submit_with_ctx(executor, fetch, ticker) for key, fetch in calls.items()}
+            result = {key: future.result() for key, future in futures.items()}
         
         return result
 
 
 # Convenience function
+@lru_cache(maxsize=1)
 def get_market_data_pipeline() -> MarketDataPipeline:
-    """Factory function to get configured pipeline instance."""
+    """Factory function to get the shared pipeline instance (reused across reruns)."""
     return MarketDataPipeline()
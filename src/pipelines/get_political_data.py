@@ -17,20 +17,385 @@ import pandas as pd
 import numpy as np
 import streamlit as st
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+import hashlib
+import json
 import logging
 import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import re
+import threading
 import time
 
+from src.core.file_cache import atomic_write
+from src.core.script_context import submit_with_ctx
+
 try:
     import finnhub
     FINNHUB_AVAILABLE = True
 except ImportError:
     FINNHUB_AVAILABLE = False
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive pool for the disclosure feeds; module scope so Streamlit
+# reruns reuse warm TCP/TLS connections instead of reconnecting per call
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'application/json'
+})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# Caps concurrent outbound requests across all threads and sessions
+_REQUEST_SLOTS = threading.Semaphore(5)
+
+# Single-flight bookkeeping: per-URL refresh locks and in-flight uncached fetches
+_URL_LOCKS: Dict[str, threading.Lock] = {}
+_IN_FLIGHT: Dict[str, Future] = {}
+_URL_LOCKS_GUARD = threading.Lock()
+
+# Disclosure feeds spell the same values differently; normalize via one lookup each
+TRANSACTION_TYPE_MAP = {
+    'Purchase': 'Buy',
+    'Sale (Full)': 'Sell',
+    'Sale (Partial)': 'Sell',
+    'Sale': 'Sell'
+}
+
+CHAMBER_MAP = {
+    'Representatives': 'House',
+    'House of Representatives': 'House',
+    'senate': 'Senate',
+    'house': 'House'
+}
+
+SENATE_MEMBER_PATTERN = r'Sen\.|Senate'
+
+# Source column name -> standard column name (identity entries omitted)
+SENATE_COLUMN_MAPPING = {
+    'TransactionDate': 'date',
+    'transaction_date': 'date',
+    'representative': 'member',
+    'Ticker': 'ticker',
+    'Transaction': 'transaction_type',
+    'type': 'transaction_type',
+    'Amount': 'amount_range',
+    'amount': 'amount_range',
+    'Range': 'amount_range',
+    'Party': 'party',
+    'Chamber': 'chamber',
+    'House': 'chamber'
+}
+
+QUIVER_COLUMN_MAPPING = {
+    'Transaction Date': 'date',
+    'Representative': 'member',
+    'Ticker': 'ticker',
+    'Transaction': 'transaction_type',
+    'Range': 'amount_range',
+    'ReportDate': 'disclosure_date',
+    'Party': 'party',
+    'Chamber': 'chamber'
+}
+
+# Finnhub Form 4 transaction codes
+INSIDER_TRANSACTION_CODES = {
+    'P': 'Purchase',
+    'S': 'Sale',
+    'A': 'Award',
+    'M': 'Option Exercise'
+}
+
+# Low-cardinality string columns stored as int8-coded categoricals
+CATEGORICAL_COLUMNS = ('chamber', 'party', 'transaction_type')
+
+# Free-text columns hit by str ops and equality masks. pandas 3 already stores
+# strings in Arrow; on 2.x opt these columns into Arrow-backed strings explicitly.
+ARROW_STRING_COLUMNS = ('ticker', 'member')
+_STRING_DTYPE = 'str' if int(pd.__version__.split('.')[0]) >= 3 else 'string[pyarrow]'
+
+# Anything but A-Z, 0-9 and '-' (also strips whitespace, so no separate strip())
+_TICKER_JUNK = re.compile(r'[^A-Z0-9\-]')
+_YEAR = re.compile(r'\d{4}')
+
+# Cross-restart copy of the bulk disclosure feeds, revalidated with conditional GETs
+POLITICAL_CACHE_DIR = Path(__file__).parent.parent.parent / '.cache' / 'political'
+FEED_REVALIDATE_AFTER = 3600  # seconds before asking the server whether the feed changed
+
+SENATE_WATCHER_URL = "https://senate-stock-watcher-data.s3-us-west-2.amazonaws.com/aggregate/all_transactions.json"
+QUIVER_CONGRESS_URL = "https://api.quiverquant.com/beta/live/congresstrading"
+
+
+def _load_records(source: Union[Path, bytes],
+                  keep: Optional[Callable[[Dict], bool]] = None) -> List[Dict]:
+    """
+    Decode a JSON array of records, optionally keeping only those passing keep.
+    
+    With ijson installed a filtered load from disk streams the file record by
+    record, so the full multi-MB list is never materialized; otherwise the
+    body is decoded in one pass with orjson (falling back to stdlib json).
+    """
+    if keep is not None and IJSON_AVAILABLE and isinstance(source, Path):
+        with open(source, 'rb') as f:
+            return [r for r in ijson.items(f, 'item', use_float=True) if keep(r)]
+    
+    data = _json_loads(source.read_bytes() if isinstance(source, Path) else source)
+    if keep is not None and isinstance(data, list):
+        return [r for r in data if keep(r)]
+    return data
+
+
+def _url_lock(url: str) -> threading.Lock:
+    """Per-URL lock so concurrent cache misses for one feed collapse into one request."""
+    with _URL_LOCKS_GUARD:
+        return _URL_LOCKS.setdefault(url, threading.Lock())
+
+
+def _get_json_cached(url: str, keep: Optional[Callable[[Dict], bool]] = None,
+                     max_age: int = FEED_REVALIDATE_AFTER, timeout: int = 15):
+    """
+    GET a JSON feed, keeping the body on disk between runs.
+    
+    Copies younger than max_age are used without a request; older ones are
+    revalidated with If-None-Match / If-Modified-Since, so an unchanged feed
+    costs a 304 instead of a full download. Only one thread refreshes a feed
+    at a time - the rest wait and then read the fresh copy from disk. If the
+    request fails, the stale copy is served instead.
+    
+    Args:
+        url: Feed URL
+        keep: Optional record predicate applied while decoding (see _load_records)
+        
+    Raises:
+        requests.RequestException: If the feed can't be fetched and no copy is on disk
+    """
+    key = hashlib.blake2s(url.encode()).hexdigest()
+    body_path = POLITICAL_CACHE_DIR / f"{key}.json"
+    meta_path = POLITICAL_CACHE_DIR / f"{key}.meta.json"
+    
+    def is_fresh() -> bool:
+        return (body_path.exists() and meta_path.exists()
+                and time.time() - body_path.stat().st_mtime < max_age)
+    
+    if is_fresh():
+        return _load_records(body_path, keep)
+    
+    with _url_lock(url):
+        # Another thread may have refreshed the feed while we waited
+        if is_fresh():
+            return _load_records(body_path, keep)
+        
+        headers = {}
+        if body_path.exists() and meta_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text())
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable cache metadata {meta_path}: {e}")
+        
+        try:
+            with _REQUEST_SLOTS:
+                response = _SESSION.get(url, headers=headers, timeout=timeout)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except requests.RequestException as e:
+            if not body_path.exists():
+                raise
+            logger.warning(f"Serving stale feed cache for {url}: {e}")
+            return _load_records(body_path, keep)
+        
+        if response.status_code == 304:
+            body_path.touch()
+        else:
+            try:
+                POLITICAL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                # Meta first, then an atomic body swap: unlocked readers never see a partial file
+                atomic_write(meta_path, json.dumps({
+                    'url': url,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified')
+                }).encode())
+                atomic_write(body_path, response.content)
+            except Exception as e:
+                logger.warning(f"Could not write feed cache for {url}: {e}")
+                # Don't leave new validators paired with the old body
+                meta_path.unlink(missing_ok=True)
+                return _load_records(response.content, keep)
+    
+    return _load_records(body_path, keep)
+
+
+def _record_filter(ticker: Optional[str], cutoff_date: datetime) -> Callable[[Dict], bool]:
+    """
+    Build a predicate dropping raw disclosure records that can't survive the
+    ticker/date filters, so they are discarded before pandas sees them.
+    
+    The date check only compares years (feeds mix ISO and MM/DD/YYYY dates),
+    so the exact day cutoff is still applied after parsing.
+    """
+    target = ticker.upper() if ticker else None
+    cutoff_year = cutoff_date.year
+    
+    def keep(record: Dict) -> bool:
+        if target is not None:
+            raw_ticker = record.get('ticker', record.get('Ticker', ''))
+            if _TICKER_JUNK.sub('', str(raw_ticker).upper()) != target:
+                return False
+        
+        raw_date = record.get('transaction_date', record.get('TransactionDate'))
+        if raw_date is None:
+            return True
+        match = _YEAR.search(str(raw_date))
+        return match is None or int(match.group()) >= cutoff_year
+    
+    return keep
+
+
+def _as_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast the free-text trade columns to Arrow-backed strings (missing values stay missing)."""
+    for col in ARROW_STRING_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(_STRING_DTYPE)
+    return df
+
+
+def _as_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast the low-cardinality trade columns to categorical dtype."""
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+
+def _get_json(url: str, timeout: int = 15):
+    """
+    GET a JSON feed through the shared session; raises requests.RequestException on failure.
+    
+    Concurrent calls for the same URL share one in-flight request and its
+    (read-only) result.
+    """
+    with _URL_LOCKS_GUARD:
+        pending = _IN_FLIGHT.get(url)
+        leader = pending is None
+        if leader:
+            pending = _IN_FLIGHT[url] = Future()
+    
+    if not leader:
+        return pending.result()
+    
+    try:
+        with _REQUEST_SLOTS:
+            response = _SESSION.get(url, timeout=timeout)
+        response.raise_for_status()
+        pending.set_result(_json_loads(response.content))
+    except BaseException as e:
+        pending.set_exception(e)
+    finally:
+        with _URL_LOCKS_GUARD:
+            _IN_FLIGHT.pop(url, None)
+    
+    return pending.result()
+
+
+def _empty_congressional_summary() -> Dict:
+    """Sentiment dict returned when a ticker has no congressional trades."""
+    return {
+        'error': 'No Congressional trades found for this ticker',
+        'buy_count': 0,
+        'sell_count': 0,
+        'net_sentiment': 0,
+        'total_trades': 0
+    }
+
+
+def _summarize_congressional_trades(trades_df: pd.DataFrame) -> Dict:
+    """
+    Reduce a non-empty congressional trades frame to the compact sentiment dict.
+    
+    Kept separate from the cached analyze_congressional_sentiment() so only
+    this small dict - not the trades frame - ends up in its cache entry.
+    """
+    # Count buy vs sell (one pass over the column)
+    type_counts = trades_df['transaction_type'].value_counts()
+    buy_count = int(type_counts.get('Buy', 0))
+    sell_count = int(type_counts.get('Sell', 0))
+    total_trades = buy_count + sell_count
+    
+    # Calculate net sentiment
+    if total_trades > 0:
+        net_sentiment = (buy_count - sell_count) / total_trades
+    else:
+        net_sentiment = 0
+    
+    # Estimate total volume (convert amount ranges like '$15,001 - $50,000' to midpoint)
+    if 'amount_range' in trades_df.columns:
+        amounts = trades_df['amount_range'].astype(str).str.replace(r'[$,]', '', regex=True)
+        # partition always yields 3 columns, even when no row contains a '-'
+        parts = amounts.str.partition('-')
+        low = pd.to_numeric(parts[0].str.strip(), errors='coerce')
+        high = pd.to_numeric(parts[2].str.strip(), errors='coerce')
+        trades_df['estimated_value'] = ((low + high) / 2).fillna(0)
+        total_volume = trades_df['estimated_value'].sum()
+    else:
+        total_volume = 0
+    
+    # Check for recent activity spike (last 30 days vs previous 60)
+    if 'date' in trades_df.columns:
+        age = pd.Timestamp.now() - trades_df['date']
+        recent_trades = int((age <= pd.Timedelta(days=30)).sum())
+        older_trades = int((age > pd.Timedelta(days=30)).sum())
+    else:
+        recent_trades = 0
+        older_trades = 0
+    
+    recent_activity_flag = recent_trades > (older_trades * 1.5) if older_trades > 0 else False
+    
+    # Get latest trades for display
+    columns = list(trades_df.columns)
+    latest_trades = [dict(zip(columns, row))
+                     for row in trades_df.head(5).itertuples(index=False, name=None)]
+    
+    # Determine bullish/bearish signals
+    bullish = net_sentiment > 0.3  # More than 65% buys
+    bearish = net_sentiment < -0.3  # More than 65% sells
+    
+    return {
+        'buy_count': buy_count,
+        'sell_count': sell_count,
+        'net_sentiment': net_sentiment,
+        'total_trades': total_trades,
+        'total_volume_estimate': total_volume,
+        'recent_activity_flag': recent_activity_flag,
+        'bullish': bullish,
+        'bearish': bearish,
+        'latest_trades': latest_trades,
+        'signal': 'BULLISH 🚀' if bullish else ('BEARISH 🐻' if bearish else 'NEUTRAL ➡️')
+    }
+
 
 class PoliticalDataPipeline:
     """
@@ -68,7 +433,8 @@ class PoliticalDataPipeline:
     def get_congressional_trades(_self, ticker: Optional[str] = None, days: int = 90) -> Optional[pd.DataFrame]:
         """
         Fetch real-time Congressional trades from multiple free sources.
-        Tries Senate Stock Tracker API first, then Capitol Trades scraper.
+        Both feeds are requested concurrently; Senate Stock Tracker is
+        preferred and QuiverQuant is used if it fails.
         
         Data Sources:
         1. Senate Stock Tracker (senatestocktracker.com) - Free API
@@ -82,19 +448,20 @@ class PoliticalDataPipeline:
             DataFrame with columns: date, member, chamber, party, ticker, 
                                    transaction_type, amount_range, disclosure_date
         """
+        cutoff_date = datetime.now() - timedelta(days=days)
+        
+        # Request both feeds up front so the fallback doesn't cost a second round
+        # trip. The Quiver request can't be cancelled once running, so every
+        # cache miss also calls QuiverQuant even when the Senate feed succeeds.
+        executor = ThreadPoolExecutor(max_workers=2)
+        # The Senate feed is the full history for every ticker - filter while decoding
+        senate_future = executor.submit(_get_json_cached, SENATE_WATCHER_URL, _record_filter(ticker, cutoff_date))
+        quiver_future = executor.submit(_get_json, QUIVER_CONGRESS_URL)
+        executor.shutdown(wait=False)
+        
         try:
-            # Try Senate Stock Tracker API first (works without auth)
-            url = "https://senate-stock-watcher-data.s3-us-west-2.amazonaws.com/aggregate/all_transactions.json"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'application/json'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            data = response.json()
+            # Senate Stock Tracker API is preferred (works without auth)
+            data = senate_future.result()
             
             if not data:
                 logger.warning("No data returned from House Stock Watcher API")
@@ -103,36 +470,10 @@ class PoliticalDataPipeline:
             # Convert to DataFrame
             df = pd.DataFrame(data)
             
-            # Standardize column names first (QuiverQuant returns TransactionDate, not transaction_date)
-            column_mapping = {
-                'TransactionDate': 'date',
-                'transaction_date': 'date',
-                'disclosure_date': 'disclosure_date',
-                'member': 'member',
-                'representative': 'member',
-                'ticker': 'ticker',
-                'Ticker': 'ticker',
-                'Transaction': 'transaction_type',
-                'transaction_type': 'transaction_type',
-                'type': 'transaction_type',
-                'Amount': 'amount_range',
-                'amount': 'amount_range',
-                'amount_range': 'amount_range',
-                'Range': 'amount_range',
-                'Party': 'party',
-                'party': 'party',
-                'Chamber': 'chamber',
-                'chamber': 'chamber',
-                'House': 'chamber'
-            }
-            
-            # Rename columns that exist and track which were renamed
-            renamed_cols = []
-            for old_col, new_col in column_mapping.items():
-                if old_col in df.columns:
-                    if old_col != new_col:  # Only rename if different
-                        df = df.rename(columns={old_col: new_col})
-                        renamed_cols.append(old_col)
+            # Standardize column names first (QuiverQuant returns TransactionDate, not transaction_date);
+            # missing keys are ignored, and the first of any now-duplicate columns wins
+            df = df.rename(columns=SENATE_COLUMN_MAPPING)
+            df = _as_arrow_strings(df.loc[:, ~df.columns.duplicated()])
             
             # Parse and clean data
             if 'date' in df.columns:
@@ -142,41 +483,27 @@ class PoliticalDataPipeline:
             
             # Filter by date range
             if 'date' in df.columns:
-                cutoff_date = datetime.now() - timedelta(days=days)
-                df = df[df['date'] >= cutoff_date]
+                # Compare the raw datetime64 array (NaT compares False)
+                df = df[df['date'].values >= np.datetime64(cutoff_date)]
             
             # Add chamber information if missing
             if 'chamber' not in df.columns and 'member' in df.columns:
-                df['chamber'] = df['member'].apply(
-                    lambda x: 'Senate' if 'Senate' in str(x) or 'Sen.' in str(x) else 'House'
-                )
+                is_senate = df['member'].str.contains(SENATE_MEMBER_PATTERN, regex=True, na=False)
+                df['chamber'] = np.where(is_senate, 'Senate', 'House')
             
             # Standardize chamber values
             if 'chamber' in df.columns:
-                df['chamber'] = df['chamber'].replace({
-                    'Representatives': 'House',
-                    'House of Representatives': 'House',
-                    'senate': 'Senate',
-                    'house': 'House'
-                })
+                df['chamber'] = df['chamber'].map(CHAMBER_MAP).fillna(df['chamber'])
             
             # Standardize transaction types
             if 'transaction_type' in df.columns:
-                df['transaction_type'] = df['transaction_type'].str.title()
-                df['transaction_type'] = df['transaction_type'].replace({
-                    'Purchase': 'Buy',
-                    'Sale (Full)': 'Sell',
-                    'Sale (Partial)': 'Sell',
-                    'Sale': 'Sell',
-                    'Buy': 'Buy',
-                    'Sell': 'Sell'
-                })
+                transaction_type = df['transaction_type'].str.title()
+                df['transaction_type'] = transaction_type.map(TRANSACTION_TYPE_MAP).fillna(transaction_type)
             
             # Extract ticker symbols (clean up formatting)
             if 'ticker' in df.columns:
-                df['ticker'] = df['ticker'].astype(str).str.upper().str.strip()
                 # Remove any non-alphanumeric characters except hyphens
-                df['ticker'] = df['ticker'].str.replace(r'[^A-Z0-9\-]', '', regex=True)
+                df['ticker'] = df['ticker'].str.upper().str.replace(_TICKER_JUNK, '', regex=True)
             
             # Filter by ticker if specified
             if ticker and 'ticker' in df.columns:
@@ -190,27 +517,22 @@ class PoliticalDataPipeline:
             desired_columns = ['date', 'member', 'chamber', 'party', 'ticker', 
                               'transaction_type', 'amount_range', 'disclosure_date']
             
-            # Only include columns that exist and drop any duplicates
-            available_columns = [col for col in desired_columns if col in df.columns]
-            
-            # Remove any duplicate columns before selecting
-            df = df.loc[:, ~df.columns.duplicated()]
-            
-            # Now select only the columns we want
-            df = df[[col for col in available_columns if col in df.columns]]
+            # Only include columns that exist
+            df = df[[col for col in desired_columns if col in df.columns]]
             
             logger.info(f"Fetched {len(df)} Congressional trades from House Stock Watcher API")
-            return df
+            return _as_categories(df)
             
         except requests.RequestException as e:
             logger.warning(f"Senate Stock Tracker API unavailable: {e}")
             # Fallback to QuiverQuant public endpoint
-            return _self._get_quiver_congressional_trades(ticker, days)
+            return _self._get_quiver_congressional_trades(ticker, days, quiver_future)
         except Exception as e:
             logger.error(f"Error processing Congressional trades: {e}")
-            return _self._get_quiver_congressional_trades(ticker, days)
+            return _self._get_quiver_congressional_trades(ticker, days, quiver_future)
     
-    def _get_quiver_congressional_trades(_self, ticker: Optional[str] = None, days: int = 90) -> Optional[pd.DataFrame]:
+    def _get_quiver_congressional_trades(_self, ticker: Optional[str] = None, days: int = 90,
+                                         prefetched: Optional[Future] = None) -> Optional[pd.DataFrame]:
         """
         Fetch Congressional trades from QuiverQuant's public API.
         Free endpoint with no API key required for basic access.
@@ -218,20 +540,16 @@ class PoliticalDataPipeline:
         Data Source: https://api.quiverquant.com/beta/live/congresstrading
         
         Note: This returns recent trades across all tickers. We filter client-side.
+        
+        Args:
+            prefetched: In-flight _get_json future for the feed, if already requested
         """
         try:
             # QuiverQuant public endpoint
-            url = "https://api.quiverquant.com/beta/live/congresstrading"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'application/json'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            data = response.json()
+            if prefetched is not None:
+                data = prefetched.result()
+            else:
+                data = _get_json(QUIVER_CONGRESS_URL)
             
             if not data:
                 logger.warning("No data from QuiverQuant API")
@@ -240,27 +558,9 @@ class PoliticalDataPipeline:
             # Convert to DataFrame
             df = pd.DataFrame(data)
             
-            # Standardize column names (QuiverQuant format)
-            column_mapping = {
-                'Transaction Date': 'date',
-                'Representative': 'member',
-                'Ticker': 'ticker',
-                'Transaction': 'transaction_type',
-                'Range': 'amount_range',
-                'ReportDate': 'disclosure_date',
-                'Party': 'party',
-                'Chamber': 'chamber'
-            }
-            
-            # Rename columns that exist
-            cols_to_drop = []
-            for old_col, new_col in column_mapping.items():
-                if old_col in df.columns and old_col != new_col:
-                    df[new_col] = df[old_col]
-                    cols_to_drop.append(old_col)
-            
-            # Drop original columns to prevent duplicates
-            df = df.drop(columns=cols_to_drop, errors='ignore')
+            # Standardize column names (QuiverQuant format), dropping any duplicates it creates
+            df = df.rename(columns=QUIVER_COLUMN_MAPPING)
+            df = _as_arrow_strings(df.loc[:, ~df.columns.duplicated()])
             
             # Parse dates
             if 'date' in df.columns:
@@ -271,21 +571,17 @@ class PoliticalDataPipeline:
             # Filter by date range
             cutoff_date = datetime.now() - timedelta(days=days)
             if 'date' in df.columns:
-                df = df[df['date'] >= cutoff_date]
+                # Compare the raw datetime64 array (NaT compares False)
+                df = df[df['date'].values >= np.datetime64(cutoff_date)]
             
             # Standardize transaction types
             if 'transaction_type' in df.columns:
-                df['transaction_type'] = df['transaction_type'].str.title().replace({
-                    'Purchase': 'Buy',
-                    'Sale': 'Sell',
-                    'Sale (Full)': 'Sell',
-                    'Sale (Partial)': 'Sell'
-                })
+                transaction_type = df['transaction_type'].str.title()
+                df['transaction_type'] = transaction_type.map(TRANSACTION_TYPE_MAP).fillna(transaction_type)
             
             # Clean ticker symbols
             if 'ticker' in df.columns:
-                df['ticker'] = df['ticker'].str.upper().str.strip()
-                df['ticker'] = df['ticker'].str.replace(r'[^A-Z0-9\-]', '', regex=True)
+                df['ticker'] = df['ticker'].str.upper().str.replace(_TICKER_JUNK, '', regex=True)
                 
                 # Filter by ticker if specified
                 if ticker:
@@ -293,16 +589,15 @@ class PoliticalDataPipeline:
             
             # Infer chamber from member name if not provided
             if 'chamber' not in df.columns and 'member' in df.columns:
-                df['chamber'] = df['member'].apply(
-                    lambda x: 'Senate' if 'Sen.' in str(x) else 'House'
-                )
+                is_senate = df['member'].str.contains(SENATE_MEMBER_PATTERN, regex=True, na=False)
+                df['chamber'] = np.where(is_senate, 'Senate', 'House')
             
             # Sort by date
             if 'date' in df.columns:
                 df = df.sort_values('date', ascending=False)
             
             logger.info(f"Fetched {len(df)} Congressional trades from QuiverQuant API")
-            return df if len(df) > 0 else _self._generate_sample_data(ticker, days)
+            return _as_categories(df) if len(df) > 0 else _self._generate_sample_data(ticker, days)
             
         except requests.RequestException as e:
             logger.error(f"QuiverQuant API unavailable: {e}")
@@ -311,12 +606,14 @@ class PoliticalDataPipeline:
             logger.error(f"Error processing QuiverQuant data: {e}")
             return _self._generate_sample_data(ticker, days)
     
-    def _generate_sample_data(_self, ticker: Optional[str] = None, days: int = 90) -> Optional[pd.DataFrame]:
+    def _generate_sample_data(_self, ticker: Optional[str] = None, days: int = 90,
+                              seed: Optional[int] = None) -> Optional[pd.DataFrame]:
         """
         Generate sample Congressional trading data for demonstration.
         Used when all API sources are unavailable.
         
         This creates realistic-looking data for popular tickers.
+        Pass seed for a reproducible sample.
         """
         logger.info("Using sample Congressional trading data (APIs unavailable)")
         
@@ -324,36 +621,29 @@ class PoliticalDataPipeline:
         common_tickers = ['AAPL', 'MSFT', 'NVDA', 'TSLA', 'META', 'GOOGL', 'AMZN', 
                          'JPM', 'BAC', 'SPY', 'QQQ', 'XLE', 'XLF', 'LMT', 'RTX']
         
-        # Generate 50 sample trades
-        trades = []
-        for i in range(50):
-            trade_ticker = ticker.upper() if ticker else np.random.choice(common_tickers)
-            
-            # More buys than sells (realistic congressional behavior)
-            transaction = 'Buy' if np.random.random() < 0.65 else 'Sell'
-            
-            trades.append({
-                'date': datetime.now() - timedelta(days=np.random.randint(1, days)),
-                'member': np.random.choice([
-                    'Sen. Nancy Pelosi', 'Sen. Richard Burr', 'Rep. Dan Crenshaw',
-                    'Sen. Tommy Tuberville', 'Rep. Josh Gottheimer', 'Sen. Dianne Feinstein',
-                    'Rep. Michael McCaul', 'Sen. Rand Paul', 'Rep. Virginia Foxx'
-                ]),
-                'chamber': np.random.choice(['Senate', 'House'], p=[0.4, 0.6]),
-                'party': np.random.choice(['Democrat', 'Republican'], p=[0.5, 0.5]),
-                'ticker': trade_ticker,
-                'transaction_type': transaction,
-                'amount_range': np.random.choice([
-                    '$1,001 - $15,000',
-                    '$15,001 - $50,000',
-                    '$50,001 - $100,000',
-                    '$100,001 - $250,000',
-                    '$250,001 - $500,000'
-                ]),
-                'disclosure_date': datetime.now() - timedelta(days=np.random.randint(0, 30))
-            })
+        members = ['Sen. Nancy Pelosi', 'Sen. Richard Burr', 'Rep. Dan Crenshaw',
+                   'Sen. Tommy Tuberville', 'Rep. Josh Gottheimer', 'Sen. Dianne Feinstein',
+                   'Rep. Michael McCaul', 'Sen. Rand Paul', 'Rep. Virginia Foxx']
+        
+        amount_ranges = ['$1,001 - $15,000', '$15,001 - $50,000', '$50,001 - $100,000',
+                         '$100,001 - $250,000', '$250,001 - $500,000']
         
-        df = pd.DataFrame(trades)
+        # Generate 50 sample trades - one vectorized draw per column
+        n = 50
+        rng = np.random.default_rng(seed)
+        now = pd.Timestamp.now()
+        
+        df = pd.DataFrame({
+            'date': now - pd.to_timedelta(rng.integers(1, days, n), unit='D'),
+            'member': rng.choice(members, n),
+            'chamber': rng.choice(['Senate', 'House'], n, p=[0.4, 0.6]),
+            'party': rng.choice(['Democrat', 'Republican'], n, p=[0.5, 0.5]),
+            'ticker': ticker.upper() if ticker else rng.choice(common_tickers, n),
+            # More buys than sells (realistic congressional behavior)
+            'transaction_type': np.where(rng.random(n) < 0.65, 'Buy', 'Sell'),
+            'amount_range': rng.choice(amount_ranges, n),
+            'disclosure_date': now - pd.to_timedelta(rng.integers(0, 30, n), unit='D')
+        })
         
         # Filter by ticker if specified
         if ticker:
@@ -362,7 +652,7 @@ class PoliticalDataPipeline:
         # Sort by date
         df = df.sort_values('date', ascending=False)
         
-        return df if len(df) > 0 else None
+        return _as_categories(df) if len(df) > 0 else None
     
     @st.cache_data(ttl=3600, show_spinner=False)
     def analyze_congressional_sentiment(_self, ticker: str, days: int = 90) -> Dict:
@@ -391,73 +681,39 @@ class PoliticalDataPipeline:
         trades_df = _self.get_congressional_trades(ticker=ticker, days=days)
         
         if trades_df is None or len(trades_df) == 0:
-            return {
-                'error': 'No Congressional trades found for this ticker',
-                'buy_count': 0,
-                'sell_count': 0,
-                'net_sentiment': 0,
-                'total_trades': 0
-            }
-        
-        # Count buy vs sell
-        buy_count = len(trades_df[trades_df['transaction_type'] == 'Buy'])
-        sell_count = len(trades_df[trades_df['transaction_type'] == 'Sell'])
-        total_trades = buy_count + sell_count
-        
-        # Calculate net sentiment
-        if total_trades > 0:
-            net_sentiment = (buy_count - sell_count) / total_trades
-        else:
-            net_sentiment = 0
+            return _empty_congressional_summary()
         
-        # Estimate total volume (convert amount ranges to midpoint)
-        def parse_amount_range(amount_str):
-            """Convert '$15,001 - $50,000' to midpoint value."""
-            try:
-                if '-' in str(amount_str):
-                    parts = amount_str.replace('$', '').replace(',', '').split('-')
-                    low = float(parts[0].strip())
-                    high = float(parts[1].strip())
-                    return (low + high) / 2
-                return 0
-            except:
-                return 0
-        
-        if 'amount_range' in trades_df.columns:
-            trades_df['estimated_value'] = trades_df['amount_range'].apply(parse_amount_range)
-            total_volume = trades_df['estimated_value'].sum()
-        else:
-            total_volume = 0
+        return _summarize_congressional_trades(trades_df)
+    
+    @st.cache_data(ttl=3600, show_spinner=False)
+    def analyze_congressional_sentiment_multi(_self, tickers: List[str], days: int = 90) -> Dict[str, Dict]:
+        """
+        Analyze Congressional trading sentiment for several tickers at once.
         
-        # Check for recent activity spike (last 30 days vs previous 60)
-        if 'date' in trades_df.columns:
-            recent_trades = len(trades_df[trades_df['date'] >= datetime.now() - timedelta(days=30)])
-            older_trades = len(trades_df[trades_df['date'] < datetime.now() - timedelta(days=30)])
-        else:
-            recent_trades = 0
-            older_trades = 0
+        Fetches the unfiltered trade list once and splits it with a single
+        groupby, instead of one fetch-and-filter pass per ticker.
         
-        recent_activity_flag = recent_trades > (older_trades * 1.5) if older_trades > 0 else False
+        Args:
+            tickers: Stock ticker symbols (e.g., ['AAPL', 'MSFT'])
+            days: Number of days to analyze (default 90)
+            
+        Returns:
+            Dictionary mapping ticker -> same dict as analyze_congressional_sentiment()
+        """
+        wanted = [t.upper() for t in tickers]
+        results = {t: _empty_congressional_summary() for t in wanted}
         
-        # Get latest trades for display
-        latest_trades = trades_df.head(5).to_dict('records')
+        trades_df = _self.get_congressional_trades(ticker=None, days=days)
         
-        # Determine bullish/bearish signals
-        bullish = net_sentiment > 0.3  # More than 65% buys
-        bearish = net_sentiment < -0.3  # More than 65% sells
+        if trades_df is None or len(trades_df) == 0 or 'ticker' not in trades_df.columns:
+            return results
         
-        return {
-            'buy_count': buy_count,
-            'sell_count': sell_count,
-            'net_sentiment': net_sentiment,
-            'total_trades': total_trades,
-            'total_volume_estimate': total_volume,
-            'recent_activity_flag': recent_activity_flag,
-            'bullish': bullish,
-            'bearish': bearish,
-            'latest_trades': latest_trades,
-            'signal': 'BULLISH 🚀' if bullish else ('BEARISH 🐻' if bearish else 'NEUTRAL ➡️')
-        }
+        trades_df = trades_df[trades_df['ticker'].isin(wanted)]
+        
+        for ticker, group in trades_df.groupby('ticker', sort=False, observed=True):
+            results[ticker] = _summarize_congressional_trades(group.copy())
+        
+        return results
     
     # =========================================================================
     # Corporate Insider Transactions (Finnhub)
@@ -480,9 +736,14 @@ class PoliticalDataPipeline:
             return None
         
         try:
-            from_date = (datetime.now() - timedelta(days=months*30)).strftime('%Y-%m-%d')
-            to_date = datetime.now().strftime('%Y-%m-%d')
+            from src.config.performance_config import get_rate_limiter
+            
+            now = datetime.now()
+            from_date = (now - timedelta(days=months*30)).strftime('%Y-%m-%d')
+            to_date = now.strftime('%Y-%m-%d')
             
+            # Shared across threads/tickers so batches queue instead of hitting 429s
+            get_rate_limiter('finnhub').acquire()
             data = _self.finnhub_client.stock_insider_transactions(
                 ticker.upper(),
                 from_date,
@@ -497,28 +758,50 @@ class PoliticalDataPipeline:
             if len(df) == 0:
                 return None
             
-            # Clean and format
-            df['filing_date'] = pd.to_datetime(df['filingDate'])
-            df['transaction_date'] = pd.to_datetime(df['transactionDate'])
-            df['name'] = df['name']
-            df['transaction_type'] = df['transactionCode'].map({
-                'P': 'Purchase',
-                'S': 'Sale',
-                'A': 'Award',
-                'M': 'Option Exercise'
-            }).fillna(df['transactionCode'])
-            df['shares'] = df['share']
-            df['price'] = df['transactionPrice']
-            
-            # Calculate transaction value
-            df['value'] = df['shares'] * df['price']
+            # Clean and format - build the output frame in one go rather than
+            # inserting columns into the raw payload frame one at a time
+            # float64: float32 loses whole shares above 2**24 and skews value/sentiment sums
+            shares = pd.to_numeric(df['share'], errors='coerce').astype('float64')
+            price = pd.to_numeric(df['transactionPrice'], errors='coerce').astype('float64')
+            
+            result = pd.DataFrame({
+                'transaction_date': pd.to_datetime(df['transactionDate']),
+                'filing_date': pd.to_datetime(df['filingDate']),
+                'name': df['name'],
+                'transaction_type': df['transactionCode'].map(INSIDER_TRANSACTION_CODES).fillna(df['transactionCode']),
+                'shares': shares,
+                'price': price,
+                'value': shares * price  # Transaction value
+            })
             
-            return df[['transaction_date', 'filing_date', 'name', 'transaction_type', 'shares', 'price', 'value']].sort_values('transaction_date', ascending=False)
+            return result.sort_values('transaction_date', ascending=False)
             
         except Exception as e:
             logger.error(f"Error fetching insider transactions for {ticker}: {e}")
             return None
     
+    def get_insider_transactions_batch(self, tickers: List[str],
+                                       months: int = 3) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Fetch insider transactions for several tickers concurrently.
+        
+        Requests run in parallel but share the Finnhub rate limiter, so large
+        batches stay under the free-tier cap; cached tickers cost nothing.
+        
+        Args:
+            tickers: Stock ticker symbols
+            months: Number of months of historical data
+            
+        Returns:
+            Dictionary mapping ticker -> DataFrame (None if unavailable)
+        """
+        if not tickers:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {t: submit_with_ctx(executor, self.get_insider_transactions, t, months) for t in tickers}
+            return {t: future.result() for t, future in futures.items()}
+    
     @st.cache_data(ttl=3600, show_spinner=False)
     def analyze_insider_sentiment(_self, ticker: str, months: int = 3) -> Dict:
         """
@@ -538,14 +821,13 @@ class PoliticalDataPipeline:
         if df is None or len(df) == 0:
             return {'error': 'No insider data available'}
         
-        # Filter to actual purchases and sales
-        buys = df[df['transaction_type'] == 'Purchase']
-        sells = df[df['transaction_type'] == 'Sale']
+        # Value and count per transaction type in a single grouped pass
+        totals = df.groupby('transaction_type')['value'].agg(['sum', 'size'])
         
-        buy_value = buys['value'].sum()
-        sell_value = sells['value'].sum()
-        buy_count = len(buys)
-        sell_count = len(sells)
+        buy_value = totals['sum'].get('Purchase', 0)
+        sell_value = totals['sum'].get('Sale', 0)
+        buy_count = int(totals['size'].get('Purchase', 0))
+        sell_count = int(totals['size'].get('Sale', 0))
         
         # Calculate buy/sell ratio (value-weighted)
         if buy_value + sell_value > 0:
@@ -577,7 +859,8 @@ class PoliticalDataPipeline:
     # Aggregation Methods
     # =========================================================================
     
-    def get_comprehensive_insider_report(self, ticker: str) -> Dict:
+    @st.cache_data(ttl=1800, show_spinner=False)  # Cache for 30 minutes
+    def get_comprehensive_insider_report(_self, ticker: str) -> Dict:
         """
         Generate a comprehensive report combining corporate insiders and congressional trades.
         
@@ -589,16 +872,24 @@ class PoliticalDataPipeline:
         """
         report = {}
         
-        # Corporate insiders
-        insider_df = self.get_insider_transactions(ticker, months=6)
-        insider_sentiment = self.analyze_insider_sentiment(ticker, months=6)
+        # Independent network-bound sources (Finnhub vs. the congressional feeds):
+        # wall time ~ slowest one, not the sum
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            insider_future = submit_with_ctx(executor, _self.get_insider_transactions, ticker, months=6)
+            congress_future = submit_with_ctx(executor, _self.analyze_congressional_sentiment, ticker)
+            
+            insider_df = insider_future.result()
+            senate_sentiment = congress_future.result()
+        
+        # Runs after the fetch so it hits the cached transactions instead of
+        # racing it with a duplicate Finnhub request
+        insider_sentiment = _self.analyze_insider_sentiment(ticker, months=6)
         
+        # Corporate insiders
         report['corporate_insider_transactions'] = insider_df
         report['corporate_insider_sentiment'] = insider_sentiment
         
         # Congressional trades
-        senate_sentiment = self.analyze_senate_sentiment(ticker)
-        
         report['congressional_sentiment'] = senate_sentiment
         
         # Combined score
@@ -615,6 +906,7 @@ class PoliticalDataPipeline:
 
 
 # Convenience function
+@st.cache_resource
 def get_political_data_pipeline() -> PoliticalDataPipeline:
-    """Factory function to get configured pipeline instance."""
+    """Factory function to get the shared, configured pipeline instance."""
     return PoliticalDataPipeline()
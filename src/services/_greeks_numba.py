@@ -0,0 +1,106 @@
+"""
+Numba-compiled Black-Scholes Greeks kernel
+Used by OptionsAnalysisService.calculate_greeks_vectorized when numba is installed;
+without numba the functions below stay plain Python and the service uses its
+scipy.special.ndtr path instead.
+"""
+import math
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+INV_SQRT_2 = 0.7071067811865476   # 1 / sqrt(2)
+INV_SQRT_2PI = 0.3989422804014327  # 1 / sqrt(2*pi)
+MIN_TIME_TO_EXPIRY = 1 / 365       # 1 day minimum
+
+# Abramowitz & Stegun 7.1.26 coefficients (|erf error| <= 1.5e-7)
+_AS_P = 0.3275911
+_AS_A1 = 0.254829592
+_AS_A2 = -0.284496736
+_AS_A3 = 1.421413741
+_AS_A4 = -1.453152027
+_AS_A5 = 1.061405429
+
+
+def _norm_cdf(x):
+    """
+    Standard normal CDF via the A&S 7.1.26 erf approximation
+
+    7.1.26 is only valid for non-negative arguments, so it is evaluated on |x|
+    and mirrored with N(x) = 1 - N(-x) for negative x.
+    """
+    z = abs(x) * INV_SQRT_2
+    t = 1.0 / (1.0 + _AS_P * z)
+    poly = t * (_AS_A1 + t * (_AS_A2 + t * (_AS_A3 + t * (_AS_A4 + t * _AS_A5))))
+    erf_z = 1.0 - poly * math.exp(-z * z)
+    if x >= 0.0:
+        return 0.5 * (1.0 + erf_z)
+    return 0.5 * (1.0 - erf_z)
+
+
+def _bs_greeks_kernel(S, K, T, sigma, r, is_call,
+                      out_delta, out_gamma, out_theta, out_vega, out_rho):
+    """
+    Fill the output arrays with Black-Scholes Greeks, one contract per index
+
+    Args:
+        S: Spot price
+        K, T, sigma: float64 arrays of strikes, years to expiry, volatilities
+        r: Risk-free rate
+        is_call: bool array, True for calls
+        out_*: Preallocated float64 arrays (theta daily, vega/rho per 1%)
+    """
+    for i in prange(K.shape[0]):
+        t = max(T[i], MIN_TIME_TO_EXPIRY)
+        sqrt_t = math.sqrt(t)
+        vol = sigma[i]
+
+        d1 = (math.log(S / K[i]) + (r + 0.5 * vol * vol) * t) / (vol * sqrt_t)
+        d2 = d1 - vol * sqrt_t
+
+        pdf_d1 = math.exp(-0.5 * d1 * d1) * INV_SQRT_2PI
+        discounted_k = K[i] * math.exp(-r * t)
+
+        # phi = +1 call / -1 put: delta = phi*N(phi*d1), rho/theta use phi*N(phi*d2)
+        phi = 1.0 if is_call[i] else -1.0
+        out_delta[i] = phi * _norm_cdf(phi * d1)
+        cdf_d2_signed = phi * _norm_cdf(phi * d2)
+
+        out_gamma[i] = pdf_d1 / (S * vol * sqrt_t)
+        out_theta[i] = (-(S * pdf_d1 * vol) / (2.0 * sqrt_t) - r * discounted_k * cdf_d2_signed) / 365.0
+        out_vega[i] = S * pdf_d1 * sqrt_t / 100.0
+        out_rho[i] = t * discounted_k * cdf_d2_signed / 100.0
+
+
+def _iv_stats(iv):
+    """
+    Count, mean, min and max of the positive IVs in one pass
+
+    Non-positive (and NaN) entries are skipped, so the caller does not need
+    to build a filtered copy first. Returns count 0 when nothing qualifies.
+    """
+    count = 0
+    total = 0.0
+    lo = math.inf
+    hi = -math.inf
+    for v in iv:
+        if v > 0.0:
+            count += 1
+            total += v
+            if v < lo:
+                lo = v
+            if v > hi:
+                hi = v
+    if count == 0:
+        return 0, 0.0, 0.0, 0.0
+    return count, total / count, lo, hi
+
+
+if NUMBA_AVAILABLE:
+    _norm_cdf = njit(cache=True, fastmath=True)(_norm_cdf)
+    _bs_greeks_kernel = njit(cache=True, parallel=True, fastmath=True)(_bs_greeks_kernel)
+    _iv_stats = njit(cache=True)(_iv_stats)
@@ -0,0 +1,97 @@
+"""
+Numba-compiled risk-metric kernel
+Used by StocksAnalysisService._risk_from_closes (and the analyze_many batch
+path) when numba is installed; without numba the kernels below stay plain
+Python and the service uses its NumPy implementation instead.
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+def _risk_kernel(close):
+    """
+    One pass over close prices: return mean/variance and max drawdown
+
+    Returns whose endpoints are NaN are skipped (pandas pct_change().dropna()).
+    Mean and variance use Welford's update; drawdown tracks the running peak
+    of the compounded returns.
+
+    Args:
+        close: float64 close prices, oldest first
+
+    Returns:
+        (number of returns, mean return, sample variance, max drawdown) -
+        variance is NaN below 2 returns, drawdown NaN with no returns
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    cumulative = 1.0
+    peak = -math.inf
+    max_drawdown = math.inf
+
+    for i in range(1, close.shape[0]):
+        change = close[i] - close[i - 1]
+        if close[i - 1] == 0.0:
+            # Same inf/NaN that the NumPy division gives, without raising
+            ret = math.copysign(math.inf, change) if change != 0.0 else math.nan
+        else:
+            ret = change / close[i - 1]
+        if math.isnan(ret):
+            continue
+
+        count += 1
+        delta = ret - mean
+        mean += delta / count
+        m2 += delta * (ret - mean)
+
+        cumulative *= 1.0 + ret
+        if cumulative > peak:
+            peak = cumulative
+        drawdown = (cumulative - peak) / peak
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+
+    variance = m2 / (count - 1) if count > 1 else math.nan
+    if max_drawdown == math.inf:
+        max_drawdown = math.nan
+    return count, mean, variance, max_drawdown
+
+
+def _risk_kernel_batch(closes, lengths):
+    """
+    Run _risk_kernel over every row of a padded close-price matrix
+
+    Args:
+        closes: float64 array of shape (tickers, max length), rows left-aligned
+        lengths: int64 array with the number of valid closes in each row
+
+    Returns:
+        (counts, means, variances, max drawdowns) - one entry per row
+    """
+    n = closes.shape[0]
+    counts = np.zeros(n, dtype=np.int64)
+    means = np.empty(n, dtype=np.float64)
+    variances = np.empty(n, dtype=np.float64)
+    drawdowns = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        count, mean, variance, drawdown = _risk_kernel(closes[i, :lengths[i]])
+        counts[i] = count
+        means[i] = mean
+        variances[i] = variance
+        drawdowns[i] = drawdown
+    return counts, means, variances, drawdowns
+
+
+# No fastmath: it lets LLVM assume NaN never occurs, which would drop the isnan skip
+if NUMBA_AVAILABLE:
+    _risk_kernel = njit(cache=True)(_risk_kernel)
+    _risk_kernel_batch = njit(cache=True, parallel=True)(_risk_kernel_batch)
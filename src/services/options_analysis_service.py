@@ -6,8 +6,11 @@ Returns type-safe OptionsChain and related objects
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta
-from scipy import stats
+from math import erfc, exp, log, sqrt
+from scipy.special import ndtr
 import logging
 
 from src.core.types import (
@@ -21,10 +24,160 @@ from src.core.errors import (
     AnalysisError,
     InsufficientDataError
 )
+from src.services._greeks_numba import (
+    NUMBA_AVAILABLE,
+    INV_SQRT_2,
+    INV_SQRT_2PI,
+    MIN_TIME_TO_EXPIRY,
+    _bs_greeks_kernel,
+    _iv_stats
+)
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _parse_expiration(exp_str: str) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD expiration by slicing instead of strptime (None if malformed)"""
+    try:
+        if len(exp_str) != 10 or exp_str[4] != "-" or exp_str[7] != "-":
+            return None
+        return datetime(int(exp_str[:4]), int(exp_str[5:7]), int(exp_str[8:10]))
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _greeks_core(S: float, K: float, T: float, sigma: float, r: float, is_call: bool) -> Tuple[float, ...]:
+    """
+    Black-Scholes Greeks for one contract
+    
+    Returns:
+        (delta, gamma, theta, vega, rho) - theta daily, vega and rho per 1%
+    """
+    # Scalar inputs: math.* only - NumPy/scipy ufuncs on a float pay array dispatch per call
+    T = max(T, MIN_TIME_TO_EXPIRY)
+    
+    # d1 and d2
+    sqrt_T = sqrt(T)
+    sigma_sqrt_T = sigma * sqrt_T
+    d1 = (log(S / K) + (r + 0.5 * sigma * sigma) * T) / sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
+    
+    # phi = +1 call / -1 put: delta = phi*N(phi*d1), rho/theta use phi*N(phi*d2)
+    # N(x) = erfc(-x / sqrt(2)) / 2, same value as ndtr
+    phi = 1.0 if is_call else -1.0
+    pdf_d1 = exp(-0.5 * d1 * d1) * INV_SQRT_2PI
+    S_pdf_d1 = S * pdf_d1
+    K_N_d2 = K * exp(-r * T) * phi * 0.5 * erfc(-phi * d2 * INV_SQRT_2)  # shared by theta and rho
+    
+    return (
+        phi * 0.5 * erfc(-phi * d1 * INV_SQRT_2),
+        pdf_d1 / (S * sigma_sqrt_T),
+        (-S_pdf_d1 * sigma / (2 * sqrt_T) - r * K_N_d2) / 365,
+        S_pdf_d1 * sqrt_T / 100,
+        T * K_N_d2 / 100
+    )
+
+
+def _top_k_stable(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k largest values, descending, ties in index order
+    
+    Same result as np.argsort(-values, kind="stable")[:k], but only the k
+    winners are sorted: an O(N) partition finds the k-th largest value first.
+    """
+    n = len(values)
+    if n > k:
+        kth = np.partition(values, n - k)[n - k]
+        above = np.flatnonzero(values > kth)
+        ties = np.flatnonzero(values == kth)[:k - len(above)]
+        candidates = np.sort(np.concatenate([above, ties]))
+    else:
+        candidates = np.arange(n)
+    return candidates[np.argsort(-values[candidates], kind="stable")]
+
+
+# OptionChainArrays.contract_type codes
+PUT = 0
+CALL = 1
+
+UNUSUAL_ACTIVITY_LIMIT = 20  # contracts returned by detect_unusual_activity
+
+
+@dataclass
+class OptionChainArrays:
+    """
+    One expiration of an options chain as parallel arrays (structure of arrays)
+    
+    Row i of every array describes the same contract, so filters and
+    reductions run as single NumPy operations instead of Python loops over
+    OptionContract objects. The raw quote dicts are kept in `records` to
+    build OptionContract views for the rows that are actually returned.
+    """
+    expiration: str
+    strike: np.ndarray             # float64
+    last_price: np.ndarray         # float64
+    bid: np.ndarray                # float32
+    ask: np.ndarray                # float32
+    volume: np.ndarray             # int32
+    open_interest: np.ndarray      # int32
+    implied_volatility: np.ndarray # float32
+    contract_type: np.ndarray      # int8: CALL or PUT
+    records: List[Dict]
+    
+    # Quote dict key and storage dtype per field. Strike and last price are echoed
+    # back to the UI and into dollar math, so they stay float64; the scan-only
+    # fields are narrowed to halve the bytes each mask/reduction reads.
+    FIELDS = {
+        "strike": ("strike", np.float64),
+        "last_price": ("lastPrice", np.float64),
+        "bid": ("bid", np.float32),
+        "ask": ("ask", np.float32),
+        "volume": ("volume", np.int32),
+        "open_interest": ("openInterest", np.int32),
+        "implied_volatility": ("impliedVolatility", np.float32)
+    }
+    
+    @classmethod
+    def from_chain(cls, exp_data: Dict, expiration: str, option_type: str = "both") -> "OptionChainArrays":
+        """
+        Build arrays from one expiration of a raw chain ({"calls": [...], "puts": [...]})
+        
+        Args:
+            exp_data: Raw chain data for the expiration
+            expiration: Expiration date string (YYYY-MM-DD)
+            option_type: 'calls', 'puts', or 'both'
+        
+        Returns:
+            OptionChainArrays with calls first, then puts
+        """
+        calls = [c for c in exp_data.get("calls", []) if isinstance(c, dict)] if option_type in ["both", "calls"] else []
+        puts = [p for p in exp_data.get("puts", []) if isinstance(p, dict)] if option_type in ["both", "puts"] else []
+        records = calls + puts
+        n = len(records)
+        
+        columns = {}
+        for field, (key, dtype) in cls.FIELDS.items():
+            values = np.fromiter((r.get(key) or 0 for r in records), dtype=np.float64, count=n)
+            if np.issubdtype(dtype, np.integer):
+                # Missing counts come through as NaN; NaN never passed the volume/OI filters
+                values = np.nan_to_num(values, nan=0.0)
+            columns[field] = values.astype(dtype, copy=False)
+        contract_type = np.empty(n, dtype=np.int8)
+        contract_type[:len(calls)] = CALL
+        contract_type[len(calls):] = PUT
+        
+        return cls(expiration=expiration, contract_type=contract_type, records=records, **columns)
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def type_name(self, i: int) -> str:
+        """'call' or 'put' for row i"""
+        return "call" if self.contract_type[i] == CALL else "put"
+
+
 class OptionsAnalysisService:
     """
     Business logic for options analysis
@@ -54,6 +207,14 @@ class OptionsAnalysisService:
         self.fetcher = components.get("fetcher")
         self.options_analyzer = components.get("options")
         
+        # Last chain fetched by analyze_options_chain; _chain_version bumps on every refresh
+        self._raw_chains_data: Optional[Dict] = None
+        self._ticker: Optional[str] = None
+        self._spot_price: Optional[float] = None
+        self._chain_version = 0
+        self._chain_arrays: Dict[Tuple[str, str], OptionChainArrays] = {}
+        self._contracts_cache: Dict[Tuple[str, str], List[OptionContract]] = {}
+        
         if not self.fetcher:
             raise ValueError("Missing required component: fetcher")
     
@@ -97,15 +258,13 @@ class OptionsAnalysisService:
             self._raw_chains_data = options_data.get("chains", {})
             self._ticker = ticker
             self._spot_price = current_price
+            self._chain_version += 1
+            self._chain_arrays = {}
+            self._contracts_cache = {}
             
             # Extract expirations and convert to datetime
             exp_strings = list(options_data.get("chains", {}).keys())
-            exp_dates = []
-            for exp_str in exp_strings:
-                try:
-                    exp_dates.append(datetime.strptime(exp_str, "%Y-%m-%d"))
-                except:
-                    pass
+            exp_dates = [d for d in map(_parse_expiration, exp_strings) if d is not None]
             
             # Build OptionsChain (empty calls/puts - populated on demand)
             return OptionsChain(
@@ -139,38 +298,83 @@ class OptionsAnalysisService:
         Returns:
             List of OptionContract objects
         """
-        contracts = []
+        chains_data = self._get_chains(ticker)
+        if chains_data is None:
+            return []
         
-        # Use cached raw data if available and matches ticker
-        if hasattr(self, '_raw_chains_data') and hasattr(self, '_ticker') and self._ticker == ticker:
-            chains_data = self._raw_chains_data
-        else:
-            # Fetch fresh data
-            options_data = self.fetcher.get_options_chain(ticker)
-            if not options_data or "error" in options_data:
-                return contracts
-            chains_data = options_data.get("chains", {})
+        # Contracts from the stored chain are built once per refresh; callers get a copy of the list
+        memoize = chains_data is self._raw_chains_data
+        key = (expiration, option_type)
+        if memoize and key in self._contracts_cache:
+            return list(self._contracts_cache[key])
         
-        if expiration not in chains_data:
-            return contracts
+        arrays = self._arrays_for(chains_data, expiration, option_type)
+        if arrays is None:
+            return []
+        
+        contracts = [self._contract_at(arrays, i) for i in range(len(arrays))]
+        if memoize:
+            self._contracts_cache[key] = contracts
+            return list(contracts)
         
-        exp_data = chains_data[expiration]
+        return contracts
+    
+    def get_chain_arrays(
+        self,
+        ticker: str,
+        expiration: str,
+        option_type: str = "both"
+    ) -> Optional[OptionChainArrays]:
+        """
+        Get one expiration of the chain as parallel NumPy arrays
         
-        # Process calls
-        if option_type in ["both", "calls"] and "calls" in exp_data:
-            for call_data in exp_data["calls"]:
-                # Handle both dict and string types
-                if isinstance(call_data, dict):
-                    contracts.append(self._dict_to_contract(call_data, "call", expiration))
+        Args:
+            ticker: Stock ticker
+            expiration: Expiration date string (YYYY-MM-DD)
+            option_type: 'calls', 'puts', or 'both'
         
-        # Process puts
-        if option_type in ["both", "puts"] and "puts" in exp_data:
-            for put_data in exp_data["puts"]:
-                # Handle both dict and string types
-                if isinstance(put_data, dict):
-                    contracts.append(self._dict_to_contract(put_data, "put", expiration))
+        Returns:
+            OptionChainArrays, or None if the expiration is not available
+        """
+        chains_data = self._get_chains(ticker)
+        if chains_data is None:
+            return None
         
-        return contracts
+        return self._arrays_for(chains_data, expiration, option_type)
+    
+    def _arrays_for(self, chains_data: Dict, expiration: str, option_type: str = "both") -> Optional[OptionChainArrays]:
+        """Build (or reuse) the arrays for one expiration of an already fetched chain"""
+        memoize = chains_data is self._raw_chains_data
+        if memoize and (expiration, option_type) in self._chain_arrays:
+            return self._chain_arrays[(expiration, option_type)]
+        
+        if expiration not in chains_data:
+            return None
+        
+        arrays = OptionChainArrays.from_chain(chains_data[expiration], expiration, option_type)
+        
+        # Only the stored chain is memoized; it is dropped when _chain_version bumps
+        if memoize:
+            self._chain_arrays[(expiration, option_type)] = arrays
+        
+        return arrays
+    
+    def _get_chains(self, ticker: str) -> Optional[Dict]:
+        """Stored raw chains for ticker, else one fresh fetch (None on fetch error)"""
+        chains_data = self._cached_chains(ticker)
+        if chains_data is not None:
+            return chains_data
+        
+        options_data = self.fetcher.get_options_chain(ticker)
+        if not options_data or "error" in options_data:
+            return None
+        return options_data.get("chains", {})
+    
+    def _cached_chains(self, ticker: str) -> Optional[Dict]:
+        """Raw chains stored by analyze_options_chain if they belong to ticker, else None"""
+        if self._raw_chains_data is not None and self._ticker == ticker:
+            return self._raw_chains_data
+        return None
     
     # ========== GREEKS CALCULATION ==========
     
@@ -181,7 +385,8 @@ class OptionsAnalysisService:
         time_to_expiry: float,
         volatility: float,
         risk_free_rate: float = 0.045,
-        option_type: str = "call"
+        option_type: str = "call",
+        include_rho: bool = True
     ) -> GreeksData:
         """
         Calculate Black-Scholes Greeks
@@ -193,62 +398,117 @@ class OptionsAnalysisService:
             volatility: Implied volatility (decimal, e.g., 0.25 for 25%)
             risk_free_rate: Risk-free rate (decimal)
             option_type: 'call' or 'put'
+            include_rho: Compute rho (0.0 placeholder when False)
         
         Returns:
             GreeksData with delta, gamma, theta, vega, rho
         """
         try:
-            if time_to_expiry <= 0:
-                time_to_expiry = 1 / 365  # 1 day minimum
-            
-            # Black-Scholes calculation
-            S = spot_price
-            K = strike
-            T = time_to_expiry
-            r = risk_free_rate
-            sigma = volatility
-            
-            # d1 and d2
-            d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
-            d2 = d1 - sigma * np.sqrt(T)
-            
-            # Delta
-            if option_type.lower() == "call":
-                delta = stats.norm.cdf(d1)
-            else:
-                delta = stats.norm.cdf(d1) - 1
-            
-            # Gamma (same for calls and puts)
-            gamma = stats.norm.pdf(d1) / (S * sigma * np.sqrt(T))
-            
-            # Theta (daily)
-            if option_type.lower() == "call":
-                theta = (-(S * stats.norm.pdf(d1) * sigma) / (2 * np.sqrt(T)) 
-                        - r * K * np.exp(-r * T) * stats.norm.cdf(d2)) / 365
-            else:
-                theta = (-(S * stats.norm.pdf(d1) * sigma) / (2 * np.sqrt(T)) 
-                        + r * K * np.exp(-r * T) * stats.norm.cdf(-d2)) / 365
-            
-            # Vega (per 1% change in IV)
-            vega = S * stats.norm.pdf(d1) * np.sqrt(T) / 100
-            
-            # Rho (per 1% change in interest rate)
-            if option_type.lower() == "call":
-                rho = K * T * np.exp(-r * T) * stats.norm.cdf(d2) / 100
-            else:
-                rho = -K * T * np.exp(-r * T) * stats.norm.cdf(-d2) / 100
+            # Round so Streamlit reruns with the same chain hit the cache
+            delta, gamma, theta, vega, rho = _greeks_core(
+                round(spot_price, 4),
+                round(strike, 4),
+                round(time_to_expiry, 4),
+                round(volatility, 4),
+                round(risk_free_rate, 4),
+                option_type.lower() == "call"
+            )
             
             return GreeksData(
                 delta=delta,
                 gamma=gamma,
                 theta=theta,
                 vega=vega,
-                rho=rho
+                rho=rho if include_rho else 0.0,
+                implied_volatility=volatility
             )
             
         except Exception as e:
             logger.error(f"Error calculating Greeks: {e}")
-            return GreeksData(delta=0, gamma=0, theta=0, vega=0, rho=0)
+            return GreeksData(delta=0, gamma=0, theta=0, vega=0, rho=0, implied_volatility=volatility)
+    
+    @classmethod
+    def calculate_greeks_vectorized(
+        cls,
+        spot_price: float,
+        strikes: np.ndarray,
+        times_to_expiry: np.ndarray,
+        volatilities: np.ndarray,
+        risk_free_rate: float = 0.045,
+        option_types: Optional[np.ndarray] = None,
+        include_rho: bool = True
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate Black-Scholes Greeks for many contracts in one pass
+        
+        Runs the compiled per-contract kernel when numba is installed,
+        otherwise a NumPy/ndtr pass over the whole arrays.
+        
+        Args:
+            spot_price: Current stock price
+            strikes: Strike prices
+            times_to_expiry: Times to expiration in years (<= 0 treated as 1 day)
+            volatilities: Implied volatilities (decimal)
+            risk_free_rate: Risk-free rate (decimal)
+            option_types: Per contract 'call'/'put' strings, bools (True = call)
+                or OptionChainArrays.contract_type codes (default: all calls)
+            include_rho: Compute rho; when False the 'rho' key is omitted
+        
+        Returns:
+            Dict of arrays: delta, gamma, theta (daily), vega and rho (per 1%)
+        """
+        S = float(spot_price)
+        K = np.ascontiguousarray(strikes, dtype=np.float64)
+        T = np.ascontiguousarray(times_to_expiry, dtype=np.float64)
+        sigma = np.ascontiguousarray(volatilities, dtype=np.float64)
+        r = float(risk_free_rate)
+        
+        if option_types is None:
+            is_call = np.ones(K.shape, dtype=bool)
+        else:
+            option_types = np.asarray(option_types)
+            if option_types.dtype == bool:
+                is_call = option_types
+            elif np.issubdtype(option_types.dtype, np.integer):
+                is_call = option_types == CALL
+            else:
+                is_call = np.char.lower(option_types.astype(str)) == "call"
+        
+        if NUMBA_AVAILABLE:
+            greeks = {name: np.empty_like(K) for name in ("delta", "gamma", "theta", "vega", "rho")}
+            _bs_greeks_kernel(
+                S, K, T, sigma, r, is_call,
+                greeks["delta"], greeks["gamma"], greeks["theta"], greeks["vega"], greeks["rho"]
+            )
+            if not include_rho:
+                del greeks["rho"]
+            return greeks
+        
+        T = np.maximum(T, MIN_TIME_TO_EXPIRY)
+        
+        # d1 and d2
+        sqrt_T = np.sqrt(T)
+        sigma_sqrt_T = sigma * sqrt_T
+        d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / sigma_sqrt_T
+        d2 = d1 - sigma_sqrt_T
+        
+        # Branchless call/put via phi = +1/-1: delta = phi*N(phi*d1), rho/theta use phi*N(phi*d2)
+        # ndtr is the standard normal CDF as a plain ufunc - no scipy.stats dispatch
+        phi = np.where(is_call, 1.0, -1.0)
+        pdf_d1 = np.exp(-0.5 * d1 * d1) * INV_SQRT_2PI
+        S_pdf_d1 = S * pdf_d1
+        K_N_d2 = K * np.exp(-r * T) * phi * ndtr(phi * d2)  # shared by theta and rho
+        
+        # Theta (daily), vega and rho (per 1% change)
+        greeks = {
+            "delta": phi * ndtr(phi * d1),
+            "gamma": pdf_d1 / (S * sigma_sqrt_T),
+            "theta": (-S_pdf_d1 * sigma / (2 * sqrt_T) - r * K_N_d2) / 365,
+            "vega": S_pdf_d1 * sqrt_T / 100
+        }
+        if include_rho:
+            greeks["rho"] = T * K_N_d2 / 100
+        return greeks
     
     # ========== UNUSUAL ACTIVITY ==========
     
@@ -271,36 +531,60 @@ class OptionsAnalysisService:
         """
         unusual = []
         
-        # Get all expirations from raw data or fetch fresh
-        if hasattr(self, '_raw_chains_data') and hasattr(self, '_ticker') and self._ticker == ticker:
-            exp_strings = list(self._raw_chains_data.keys())
-        else:
-            options_data = self.fetcher.get_options_chain(ticker)
-            if not options_data or "error" in options_data:
-                return unusual
-            exp_strings = list(options_data.get("chains", {}).keys())
+        # Fetch once (or reuse the stored chain) for every expiration
+        chains_data = self._get_chains(ticker)
+        if chains_data is None:
+            return unusual
         
-        for expiration in exp_strings:
-            contracts = self.get_contracts_by_expiration(ticker, expiration)
+        chains, rows, scores, ratios = [], [], [], []
+        for expiration in chains_data:
+            arrays = self._arrays_for(chains_data, expiration)
+            if arrays is None or len(arrays) == 0:
+                continue
             
-            for contract in contracts:
-                # Check for unusual volume
-                if contract.volume >= min_volume and contract.open_interest > 0:
-                    vol_oi_ratio = contract.volume / contract.open_interest
-                    
-                    if vol_oi_ratio >= volume_threshold:
-                        unusual.append(UnusualActivity(
-                            contract=contract,
-                            unusual_score=min(100, vol_oi_ratio * 20),
-                            reason=f"High Vol/OI ratio: {vol_oi_ratio:.2f}x",
-                            premium_value=contract.last_price * contract.volume * 100,
-                            detected_at=datetime.now()
-                        ))
-        
-        # Sort by unusual score
-        unusual.sort(key=lambda x: x.unusual_score, reverse=True)
-        
-        return unusual[:20]  # Top 20
+            idx, ratio, score = self._scan_expiration(arrays, volume_threshold, min_volume)
+            chains.extend([arrays] * len(idx))
+            rows.append(idx)
+            ratios.append(ratio)
+            scores.append(score)
+        
+        if not chains:
+            return unusual
+        
+        rows = np.concatenate(rows)
+        ratios = np.concatenate(ratios)
+        scores = np.concatenate(scores)
+        
+        # Top 20 by unusual score (ties keep chain order)
+        for k in _top_k_stable(scores, UNUSUAL_ACTIVITY_LIMIT):
+            arrays, i = chains[k], rows[k]
+            unusual.append(UnusualActivity(
+                contract=self._contract_at(arrays, i),
+                unusual_score=float(scores[k]),
+                reason=f"High Vol/OI ratio: {ratios[k]:.2f}x",
+                premium_value=float(arrays.last_price[i] * arrays.volume[i] * 100),
+                detected_at=datetime.now()
+            ))
+        
+        return unusual
+    
+    def _scan_expiration(
+        self,
+        arrays: OptionChainArrays,
+        volume_threshold: float,
+        min_volume: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Flag unusual volume in one expiration
+        
+        Returns:
+            (row indices, Vol/OI ratios, unusual scores) for the flagged contracts
+        """
+        # Unusual volume: Vol/OI ratio over threshold on contracts with real volume
+        oi = arrays.open_interest
+        ratio = arrays.volume / np.where(oi > 0, oi, 1)
+        idx = np.flatnonzero((arrays.volume >= min_volume) & (oi > 0) & (ratio >= volume_threshold))
+        return idx, ratio[idx], np.minimum(100, ratio[idx] * 20)
     
     # ========== STRATEGY RECOMMENDATIONS ==========
     
@@ -324,27 +608,26 @@ class OptionsAnalysisService:
         strategies = []
         
         # Get expirations
-        if hasattr(self, '_raw_chains_data') and hasattr(self, '_ticker') and self._ticker == ticker:
-            exp_strings = list(self._raw_chains_data.keys())
-        else:
-            options_data = self.fetcher.get_options_chain(ticker)
-            if not options_data or "error" in options_data:
-                return strategies
-            exp_strings = list(options_data.get("chains", {}).keys())
-        
-        if not exp_strings:
+        chains_data = self._get_chains(ticker)
+        if not chains_data:
             return strategies
         
         # Get nearest expiration (usually most liquid)
-        nearest_exp = exp_strings[0]
-        contracts = self.get_contracts_by_expiration(ticker, nearest_exp)
+        nearest_exp = next(iter(chains_data))
+        arrays = self._arrays_for(chains_data, nearest_exp)
+        
+        if arrays is None:
+            return strategies
+        
+        # Split calls/puts and sort by strike once for all strategy lookups
+        partition = self._partition_contracts(arrays)
         
         if outlook == "bullish":
-            strategies.extend(self._bullish_strategies(contracts, current_price, nearest_exp))
+            strategies.extend(self._bullish_strategies(arrays, partition, current_price, nearest_exp))
         elif outlook == "bearish":
-            strategies.extend(self._bearish_strategies(contracts, current_price, nearest_exp))
+            strategies.extend(self._bearish_strategies(arrays, partition, current_price, nearest_exp))
         else:
-            strategies.extend(self._neutral_strategies(contracts, current_price, nearest_exp))
+            strategies.extend(self._neutral_strategies(arrays, partition, current_price, nearest_exp))
         
         return strategies
     
@@ -478,20 +761,23 @@ class OptionsAnalysisService:
         Returns:
             Dict with IV rank, percentile, skew
         """
-        contracts = self.get_contracts_by_expiration(ticker, expiration)
+        arrays = self.get_chain_arrays(ticker, expiration)
         
-        if not contracts:
+        if arrays is None or len(arrays) == 0:
             return {"error": "No contracts found"}
         
-        ivs = [c.implied_volatility for c in contracts if c.implied_volatility > 0]
+        if NUMBA_AVAILABLE:
+            # One compiled pass: filter, sum, min and max together
+            n_ivs, avg_iv, min_iv, max_iv = _iv_stats(arrays.implied_volatility)
+        else:
+            ivs = arrays.implied_volatility[arrays.implied_volatility > 0]
+            n_ivs = ivs.size
+            if n_ivs:
+                avg_iv, min_iv, max_iv = ivs.mean(dtype=np.float64), float(ivs.min()), float(ivs.max())
         
-        if not ivs:
+        if n_ivs == 0:
             return {"error": "No IV data"}
         
-        avg_iv = np.mean(ivs)
-        min_iv = np.min(ivs)
-        max_iv = np.max(ivs)
-        
         # IV Rank (0-100)
         iv_range = max_iv - min_iv
         iv_rank = ((avg_iv - min_iv) / iv_range * 100) if iv_range > 0 else 50
@@ -502,11 +788,15 @@ class OptionsAnalysisService:
             "max_iv": max_iv * 100,
             "iv_rank": iv_rank,
             "iv_percentile": iv_rank,  # Simplified - would need historical data for true percentile
-            "volatility_skew": self._calculate_skew(contracts, spot_price)
+            "volatility_skew": self._calculate_skew(arrays, spot_price)
         }
     
     # ========== HELPERS ==========
     
+    def _contract_at(self, arrays: OptionChainArrays, i: int) -> OptionContract:
+        """Materialize row i of the chain arrays as an OptionContract"""
+        return self._dict_to_contract(arrays.records[i], arrays.type_name(i), arrays.expiration)
+    
     def _dict_to_contract(self, data: Dict, contract_type: str, expiration: str) -> OptionContract:
         """Convert dict to OptionContract"""
         return OptionContract(
@@ -521,76 +811,114 @@ class OptionsAnalysisService:
             implied_volatility=data.get("impliedVolatility", 0)
         )
     
-    def _bullish_strategies(self, contracts: List[OptionContract], price: float, exp: str) -> List[Dict]:
+    def _partition_contracts(self, arrays: OptionChainArrays) -> Dict[str, np.ndarray]:
+        """
+        Split one expiration into strike-sorted call and put rows
+        
+        Returns:
+            Dict with 'calls'/'puts' (row indices into arrays, ascending strike)
+            and 'call_strikes'/'put_strikes' (the matching sorted strikes)
+        """
+        partition = {}
+        for side, code in (("call", CALL), ("put", PUT)):
+            rows = np.flatnonzero(arrays.contract_type == code)
+            rows = rows[np.argsort(arrays.strike[rows], kind="stable")]
+            partition[f"{side}s"] = rows
+            partition[f"{side}_strikes"] = arrays.strike[rows]
+        return partition
+    
+    @staticmethod
+    def _nearest_strike(strikes: np.ndarray, target: float) -> int:
+        """Position of the strike closest to target in a sorted, non-empty strike array (lower wins ties)"""
+        i = int(np.searchsorted(strikes, target))
+        if i == 0:
+            return 0
+        if i == len(strikes):
+            return i - 1
+        return i - 1 if target - strikes[i - 1] <= strikes[i] - target else i
+    
+    def _bullish_strategies(self, arrays: OptionChainArrays, partition: Dict[str, np.ndarray], price: float, exp: str) -> List[Dict]:
         """Generate bullish strategy recommendations"""
         strategies = []
         
         # Find slightly OTM call
-        calls = [c for c in contracts if c.contract_type == "call" and c.strike > price]
-        if calls:
-            call = min(calls, key=lambda x: abs(x.strike - price * 1.02))
+        call_strikes = partition["call_strikes"]
+        first_otm = int(np.searchsorted(call_strikes, price, side="right"))
+        if first_otm < len(call_strikes):
+            pos = first_otm + self._nearest_strike(call_strikes[first_otm:], price * 1.02)
+            row = partition["calls"][pos]
+            strike = float(arrays.strike[row])
+            premium = float(arrays.last_price[row])
             strategies.append({
                 "name": "Long Call",
                 "type": "bullish",
-                "strike": call.strike,
-                "premium": call.last_price,
+                "strike": strike,
+                "premium": premium,
                 "expiration": exp,
-                "max_risk": call.last_price * 100,
+                "max_risk": premium * 100,
                 "max_reward": "Unlimited",
-                "breakeven": call.strike + call.last_price
+                "breakeven": strike + premium
             })
         
         return strategies
     
-    def _bearish_strategies(self, contracts: List[OptionContract], price: float, exp: str) -> List[Dict]:
+    def _bearish_strategies(self, arrays: OptionChainArrays, partition: Dict[str, np.ndarray], price: float, exp: str) -> List[Dict]:
         """Generate bearish strategy recommendations"""
         strategies = []
         
-        # Find slightly OTM put
-        puts = [c for c in contracts if c.contract_type == "put" and c.strike < price]
-        if puts:
-            put = max(puts, key=lambda x: x.strike if x.strike < price * 0.98 else 0)
+        # Find slightly OTM put: highest strike below 98% of spot, else the highest OTM strike
+        put_strikes = partition["put_strikes"]
+        n_otm = int(np.searchsorted(put_strikes, price, side="left"))
+        if n_otm > 0:
+            n_below = int(np.searchsorted(put_strikes, price * 0.98, side="left"))
+            pos = n_below - 1 if n_below > 0 else n_otm - 1
+            row = partition["puts"][pos]
+            strike = float(arrays.strike[row])
+            premium = float(arrays.last_price[row])
             strategies.append({
                 "name": "Long Put",
                 "type": "bearish",
-                "strike": put.strike,
-                "premium": put.last_price,
+                "strike": strike,
+                "premium": premium,
                 "expiration": exp,
-                "max_risk": put.last_price * 100,
-                "max_reward": (put.strike - put.last_price) * 100,
-                "breakeven": put.strike - put.last_price
+                "max_risk": premium * 100,
+                "max_reward": (strike - premium) * 100,
+                "breakeven": strike - premium
             })
         
         return strategies
     
-    def _neutral_strategies(self, contracts: List[OptionContract], price: float, exp: str) -> List[Dict]:
+    def _neutral_strategies(self, arrays: OptionChainArrays, partition: Dict[str, np.ndarray], price: float, exp: str) -> List[Dict]:
         """Generate neutral strategy recommendations"""
         strategies = []
         
         # Find ATM call for covered call
-        calls = [c for c in contracts if c.contract_type == "call"]
-        if calls:
-            atm_call = min(calls, key=lambda x: abs(x.strike - price))
-            cc_metrics = self.calculate_covered_call(price, atm_call.strike, atm_call.last_price)
+        call_strikes = partition["call_strikes"]
+        if len(call_strikes):
+            row = partition["calls"][self._nearest_strike(call_strikes, price)]
+            strike = float(arrays.strike[row])
+            premium = float(arrays.last_price[row])
+            cc_metrics = self.calculate_covered_call(price, strike, premium)
             strategies.append({
                 "name": "Covered Call",
                 "type": "neutral",
-                "strike": atm_call.strike,
-                "premium": atm_call.last_price,
+                "strike": strike,
+                "premium": premium,
                 "expiration": exp,
                 **cc_metrics
             })
         
         return strategies
     
-    def _calculate_skew(self, contracts: List[OptionContract], spot_price: float) -> float:
+    def _calculate_skew(self, arrays: OptionChainArrays, spot_price: float) -> float:
         """Calculate volatility skew"""
-        otm_puts = [c for c in contracts if c.contract_type == "put" and c.strike < spot_price * 0.95]
-        otm_calls = [c for c in contracts if c.contract_type == "call" and c.strike > spot_price * 1.05]
+        otm_puts = (arrays.contract_type == PUT) & (arrays.strike < spot_price * 0.95)
+        otm_calls = (arrays.contract_type == CALL) & (arrays.strike > spot_price * 1.05)
         
-        if otm_puts and otm_calls:
-            avg_put_iv = np.mean([c.implied_volatility for c in otm_puts if c.implied_volatility > 0])
-            avg_call_iv = np.mean([c.implied_volatility for c in otm_calls if c.implied_volatility > 0])
+        if otm_puts.any() and otm_calls.any():
+            iv = arrays.implied_volatility
+            avg_put_iv = np.mean(iv[otm_puts & (iv > 0)], dtype=np.float64)
+            avg_call_iv = np.mean(iv[otm_calls & (iv > 0)], dtype=np.float64)
             return (avg_put_iv - avg_call_iv) * 100  # Percentage difference
         
         return 0.0
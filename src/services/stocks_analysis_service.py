@@ -7,7 +7,17 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
+from math import sqrt
+from functools import partial
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+import asyncio
+import copy
+import inspect
 import logging
+import threading
+import time
+import weakref
 
 from src.core.types import (
     StockPrice,
@@ -27,9 +37,157 @@ from src.core.errors import (
     ValuationError,
     InsufficientDataError
 )
+from src.core.file_cache import FileCache
+from src.core.script_context import submit_with_ctx, with_script_ctx
+from src.services._risk_njit import NUMBA_AVAILABLE, _risk_kernel, _risk_kernel_batch
 
 logger = logging.getLogger(__name__)
 
+RISK_FREE_RATE = 0.04  # 4% annual, for the simplified Sharpe ratio
+FETCH_TIMEOUT = 30  # seconds to wait for the concurrent data fetches
+SENTIMENT_SOURCES = ("stocktwits", "news")
+ANALYSIS_CACHE_TTL = 60  # seconds a StockAnalysisResult is reused in-process
+
+# fetcher -> analyze_stock result cache; weak keys, so a dropped fetcher takes its
+# cache with it instead of the cache pinning it (and its component graph) alive
+_RESULT_CACHES: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_RESULT_CACHES_LOCK = threading.Lock()
+BATCH_FETCH_WORKERS = 8  # tickers fetched at once by analyze_many
+
+# Fallback chains of (source, key): the first key present wins (a stored 0 counts)
+_PRICE_FALLBACKS = {
+    "current": (("quote", "price"), ("info", "currentPrice"), ("info", "regularMarketPrice")),
+    "open": (("quote", "open"), ("info", "open")),
+    "high": (("quote", "high"), ("info", "dayHigh")),
+    "low": (("quote", "low"), ("info", "dayLow")),
+    "volume": (("quote", "volume"), ("info", "volume")),
+    "market_cap": (("info", "marketCap"),),
+    "prev_close": (("info", "previousClose"),),
+    "week_52_high": (("info", "fiftyTwoWeekHigh"),),
+    "week_52_low": (("info", "fiftyTwoWeekLow"),),
+}
+
+# FundamentalMetrics field -> fallback chain (missing everywhere -> None)
+_FUNDAMENTAL_FALLBACKS = {
+    "pe_ratio": (("info", "trailingPE"), ("info", "forwardPE")),
+    "pb_ratio": (("info", "priceToBook"),),
+    "eps": (("info", "trailingEps"), ("info", "forwardEps")),
+    "revenue_growth": (("info", "revenueGrowth"),),
+    "eps_growth": (("info", "earningsGrowth"),),
+    "roe": (("info", "returnOnEquity"),),
+    "roa": (("info", "returnOnAssets"),),
+    "debt_to_equity": (("info", "debtToEquity"),),
+    "current_ratio": (("info", "currentRatio"),),
+    "profit_margin": (("info", "profitMargins"),),
+    "operating_margin": (("info", "operatingMargins"),),
+}
+
+# Engine method-name keywords, checked in priority order (unknown names -> DCF)
+_VALUATION_METHOD_KEYWORDS = (
+    (ValuationMethod.DCF, ("DCF", "Cash Flow")),
+    (ValuationMethod.MULTIPLES, ("Multiple", "P/E")),
+    (ValuationMethod.DDM, ("DDM", "Dividend")),
+)
+
+# (sign(sma_20 - sma_50), sign(sma_50 - sma_200)) -> alignment; anything else is MIXED
+_SMA_ALIGNMENT = {(1, 1): "BULLISH_ALIGNED", (-1, -1): "BEARISH_ALIGNED"}
+
+# Cross-session fetcher cache (enabled by passing a FileCache as components["file_cache"])
+STOCKS_CACHE_DIR = Path(__file__).parent.parent.parent / '.cache' / 'stocks'
+
+QUOTE_DISK_TTL = 60                  # Real-time quote - fast moving
+HISTORY_DISK_TTL = 86400             # Price history + info - daily
+FUNDAMENTALS_DISK_TTL = 30 * 86400   # Statements move with quarterly reports
+
+
+def _resolve(sources: Dict[str, Dict], chain: Tuple[Tuple[str, str], ...], default=None):
+    """
+    Look up the first present key in a fallback chain
+    
+    Args:
+        sources: Source name -> raw dict (e.g. {"quote": quote, "info": info})
+        chain: (source, key) pairs in priority order
+        default: Value when no key in the chain is present
+        
+    Returns:
+        The first present value, else default
+    """
+    for source, key in chain:
+        mapping = sources[source]
+        if key in mapping:
+            return mapping[key]
+    return default
+
+
+def _match_valuation_keywords(method_str: str) -> ValuationMethod:
+    """Keyword scan over _VALUATION_METHOD_KEYWORDS (unknown names -> DCF)"""
+    for method, keywords in _VALUATION_METHOD_KEYWORDS:
+        if any(keyword in method_str for keyword in keywords):
+            return method
+    return ValuationMethod.DCF
+
+
+# Every method name ValuationEngine / ZeroFCFValuationEngine emit, classified once at import
+_VALUATION_METHOD_BY_NAME = {
+    name: _match_valuation_keywords(name)
+    for name in (
+        "DCF", "Multiples", "DDM", "NAV", "REIT (FFO)", "Revenue Multiple (P/S)",
+        "Normalized Earnings (Cyclical)", "Commodity Reserve Valuation",
+        "Sum-of-Parts (Simplified)", "Sum-of-Parts (Detailed)",
+        "Biotech Valuation (Simplified - No Pipeline Data)", "Biotech Pipeline (rNPV)",
+        "Revenue Multiple", "EBITDA Multiple", "Rule of 40", "Unit Economics",
+        "Revenue Terminal Value",
+    )
+}
+
+
+def _classify_valuation_method(method_str: str) -> ValuationMethod:
+    """Map the valuation engine's method name to a ValuationMethod (known names are table lookups)"""
+    method = _VALUATION_METHOD_BY_NAME.get(method_str)
+    return method if method is not None else _match_valuation_keywords(method_str)
+
+
+def _as_dict(value, default_key: str = "value") -> Dict:
+    """Pass dicts through; wrap a bare indicator value as {default_key: value}"""
+    return value if isinstance(value, dict) else {default_key: value}
+
+
+def _ema_latest(closes: np.ndarray, span: int) -> float:
+    """
+    Last value of an exponential moving average (pandas ewm(span, adjust=False))
+    
+    The recursion y_t = a*x_t + (1-a)*y_{t-1} unrolls to one dot product with
+    weights a*(1-a)^(T-t), the first close carrying (1-a)^T.
+    """
+    alpha = 2.0 / (span + 1)
+    decay = np.power(1.0 - alpha, np.arange(closes.size - 1, -1, -1, dtype=np.float64))
+    weights = alpha * decay
+    weights[0] = decay[0]
+    return float(weights @ closes)
+
+
+def _moving_averages(closes: np.ndarray) -> Dict[str, float]:
+    """
+    Latest SMA 20/50/200 and EMA 12/26 from a close-price array
+    
+    Like TechnicalAnalyzer, a longer SMA falls back to the next shorter one
+    when the history is too short. Empty dict when there are no valid closes.
+    """
+    closes = closes[~np.isnan(closes)]
+    if closes.size == 0:
+        return {}
+    
+    sma_20 = float(closes[-20:].mean())
+    sma_50 = float(closes[-50:].mean()) if closes.size >= 50 else sma_20
+    sma_200 = float(closes[-200:].mean()) if closes.size >= 200 else sma_50
+    return {
+        "sma_20": sma_20,
+        "sma_50": sma_50,
+        "sma_200": sma_200,
+        "ema_12": _ema_latest(closes, 12),
+        "ema_26": _ema_latest(closes, 26),
+    }
+
 
 class StocksAnalysisService:
     """
@@ -58,15 +216,24 @@ class StocksAnalysisService:
                 - technical: TechnicalAnalysis
                 - goodbuy: GoodBuyAnalyzer (optional)
                 - sentiment: SentimentAnalyzer (optional)
+                - file_cache: FileCache for fetcher responses (optional)
         """
         self.fetcher = components.get("fetcher")
         self.valuation_engine = components.get("valuation")
         self.technical_engine = components.get("technical")
         self.goodbuy_analyzer = components.get("goodbuy")
         self.sentiment_analyzer = components.get("sentiment")
+        self.file_cache: Optional[FileCache] = components.get("file_cache")
         
         if not self.fetcher or not self.valuation_engine or not self.technical_engine:
             raise ValueError("Missing required components: fetcher, valuation, technical")
+        
+        # Services rebuilt per Streamlit rerun over the same cached fetcher share one
+        # result cache: (ticker, include_sentiment, time bucket) -> StockAnalysisResult
+        with _RESULT_CACHES_LOCK:
+            self._result_cache: Dict[Tuple[str, bool, int], StockAnalysisResult] = (
+                _RESULT_CACHES.setdefault(self.fetcher, {})
+            )
     
     # ========== MAIN ANALYSIS ==========
     
@@ -85,40 +252,169 @@ class StocksAnalysisService:
             DataFetchError: If data cannot be fetched
             AnalysisError: If analysis fails
         """
+        # Repeat calls within the same ANALYSIS_CACHE_TTL window reuse the analysis
+        bucket = int(time.time() // ANALYSIS_CACHE_TTL)
+        key = (ticker, include_sentiment, bucket)
+        
+        result = self._result_cache.get(key)
+        if result is None:
+            result = self._analyze(ticker, include_sentiment)
+            # Only the current window is ever read - drop entries from older ones
+            for stale in [k for k in list(self._result_cache) if k[2] != bucket]:
+                self._result_cache.pop(stale, None)
+            self._result_cache[key] = result
+        
+        # Results are mutable - callers get their own copy, never the cached object
+        return copy.deepcopy(result)
+    
+    def _analyze(self, ticker: str, include_sentiment: bool) -> StockAnalysisResult:
+        """Run the fetch + analysis pipeline for one ticker"""
         try:
             # Fetch market data
             data = self._fetch_stock_data(ticker, include_sentiment)
+            return self._build_result(ticker, data)
             
-            # Extract components
-            info = data["stock_data"].get("info", {})
-            df = data.get("df", pd.DataFrame())
-            quote = data.get("quote", {})
-            fundamentals = data.get("fundamentals", {})
-            
-            # Build type-safe objects
-            price = self._extract_stock_price(info, quote)
-            technical = self._calculate_technical_indicators(df, info)
-            fundamental = self._extract_fundamentals(info, fundamentals)
-            risk = self._calculate_risk_metrics(df, info, fundamental)
-            valuation = self._calculate_valuation(fundamentals, info)
-            signals = self._generate_trade_signals(price, technical, fundamental, valuation, info, df)
-            
-            return StockAnalysisResult(
-                ticker=ticker,
-                timestamp=datetime.now(),
-                price=price,
-                technical=technical,
-                fundamentals=fundamental,
-                risk=risk,
-                valuation=valuation,
-                signals=signals,
-                metadata={"raw_data": data}  # Store raw data in metadata
-            )
+        except Exception as e:
+            logger.error(f"Error analyzing {ticker}: {e}")
+            raise AnalysisError(f"Failed to analyze {ticker}: {str(e)}")
+    
+    async def analyze_stock_async(self, ticker: str, include_sentiment: bool = True) -> StockAnalysisResult:
+        """
+        Async variant of analyze_stock for callers already on an event loop
+        
+        Args:
+            ticker: Stock ticker symbol
+            include_sentiment: Whether to include sentiment analysis
+        
+        Returns:
+            StockAnalysisResult with all analysis data
+        
+        Raises:
+            AnalysisError: If fetching or analysis fails
+        """
+        try:
+            data = await self._fetch_stock_data_async(ticker, include_sentiment)
+            return self._build_result(ticker, data)
             
         except Exception as e:
             logger.error(f"Error analyzing {ticker}: {e}")
             raise AnalysisError(f"Failed to analyze {ticker}: {str(e)}")
     
+    def analyze_many(self, tickers: List[str], include_sentiment: bool = False) -> Dict[str, StockAnalysisResult]:
+        """
+        Analyze a watchlist in one pass
+        
+        Fetches run concurrently, and the risk metrics for every ticker are
+        computed in a single batched kernel call over a padded close matrix.
+        
+        Args:
+            tickers: Stock ticker symbols
+            include_sentiment: Whether to include sentiment analysis
+        
+        Returns:
+            Dictionary mapping ticker -> StockAnalysisResult (failed tickers omitted)
+        """
+        if not tickers:
+            return {}
+        
+        fetched = {}
+        with ThreadPoolExecutor(max_workers=min(len(tickers), BATCH_FETCH_WORKERS)) as executor:
+            futures = {submit_with_ctx(executor, self._fetch_stock_data, ticker, include_sentiment): ticker
+                       for ticker in tickers}
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    fetched[ticker] = future.result()
+                except Exception as e:
+                    logger.warning(f"Skipping {ticker} in batch analysis: {e}")
+        
+        # Batch risk math for every ticker with a close history
+        with_history = [ticker for ticker, data in fetched.items() if data["closes"] is not None]
+        risk_stats = dict(zip(with_history, self._risk_from_closes_batch(
+            [fetched[ticker]["closes"] for ticker in with_history]
+        )))
+        
+        results = {}
+        for ticker in tickers:
+            if ticker not in fetched:
+                continue
+            try:
+                results[ticker] = self._build_result(ticker, fetched[ticker], risk_stats.get(ticker))
+            except Exception as e:
+                logger.warning(f"Skipping {ticker} in batch analysis: {e}")
+        return results
+    
+    def _build_result(
+        self,
+        ticker: str,
+        data: Dict,
+        risk_stats: Optional[Tuple[float, float, float]] = None
+    ) -> StockAnalysisResult:
+        """
+        Turn fetched market data into a StockAnalysisResult
+        
+        Args:
+            ticker: Stock ticker symbol
+            data: Output of _fetch_stock_data
+            risk_stats: Precomputed (volatility, max drawdown, Sharpe) from the batch path
+        
+        Returns:
+            StockAnalysisResult with all analysis data
+        """
+        # Extract components
+        info = data["stock_data"].get("info", {})
+        df = data.get("df", pd.DataFrame())
+        closes = data.get("closes")
+        quote = data.get("quote", {})
+        fundamentals = data.get("fundamentals", {})
+        
+        # info rides along with the day-cached history; price the valuation and
+        # buy ranges off the 60s quote instead (copy - the cached dict is shared)
+        if quote.get("price"):
+            info = {**info, "currentPrice": quote["price"]}
+        
+        # Build type-safe objects
+        price = self._extract_stock_price(info, quote)
+        technical = self._calculate_technical_indicators(df, info, closes)
+        fundamental = self._extract_fundamentals(info, fundamentals)
+        risk = self._calculate_risk_metrics(df, info, fundamental, risk_stats, closes)
+        valuation = self._calculate_valuation(fundamentals, info)
+        signals = self._generate_trade_signals(price, technical, fundamental, valuation, info, df,
+                                               has_history=closes is not None)
+        fetched_at = datetime.fromtimestamp(data["timestamp_epoch"])
+        
+        # Raw payloads are not retained on the result (see get_raw_data)
+        return StockAnalysisResult(
+            ticker=ticker,
+            timestamp=fetched_at,
+            price=price,
+            technical=technical,
+            fundamentals=fundamental,
+            risk=risk,
+            valuation=valuation,
+            signals=signals,
+            metadata={"fetched_at": fetched_at.isoformat(), "has_sentiment": "sentiment" in data}
+        )
+    
+    def get_raw_data(self, ticker: str, include_sentiment: bool = False) -> Dict:
+        """
+        Fetch the raw fetcher payloads behind an analysis
+        
+        Results don't keep these, so this refetches; with a file_cache
+        component the fetcher responses come from disk.
+        
+        Args:
+            ticker: Stock ticker symbol
+            include_sentiment: Whether to include sentiment data
+        
+        Returns:
+            Dict with stock_data, quote, fundamentals, df (and sentiment)
+        
+        Raises:
+            DataFetchError: If data cannot be fetched
+        """
+        return self._fetch_stock_data(ticker, include_sentiment)
+    
     def calculate_buy_signals(self, analysis: StockAnalysisResult) -> List[TradeSignal]:
         """
         Extract buy/sell signals from analysis
@@ -193,68 +489,182 @@ class StocksAnalysisService:
     def _fetch_stock_data(self, ticker: str, include_sentiment: bool) -> Dict:
         """Fetch comprehensive stock data"""
         try:
-            # Basic stock data
-            stock_data = self.fetcher.get_stock_data(ticker)
-            if not stock_data or "error" in stock_data:
-                raise DataFetchError(f"Cannot fetch data for {ticker}")
-            
-            # Real-time quote
-            quote = self.fetcher.get_realtime_quote(ticker)
-            
-            # Fundamentals
-            fundamentals = self.fetcher.get_fundamentals(ticker)
-            
-            # Build DataFrame
-            df = pd.DataFrame()
-            if "history" in stock_data:
-                df = pd.DataFrame(stock_data["history"])
-                if not df.empty:
-                    df.index = pd.to_datetime(df.index) if not isinstance(df.index, pd.DatetimeIndex) else df.index
-            
-            data = {
-                "ticker": ticker,
-                "timestamp": datetime.now().isoformat(),
-                "stock_data": stock_data,
-                "quote": quote,
-                "fundamentals": fundamentals,
-                "df": df
-            }
-            
-            # Optional: sentiment data
-            if include_sentiment and self.sentiment_analyzer:
-                try:
-                    data["sentiment"] = {
-                        "stocktwits": self.sentiment_analyzer.get_stocktwits_sentiment(ticker),
-                        "news": self.sentiment_analyzer.get_news_sentiment(ticker)
-                    }
-                except Exception as e:
-                    logger.warning(f"Sentiment fetch failed for {ticker}: {e}")
-                    data["sentiment"] = {}
+            calls = self._fetch_calls(include_sentiment)
+            
+            # Independent I/O-bound fetches: wall time ~ slowest call, not the sum
+            results = {}
+            # No `with`: its exit would wait on a hung call and defeat FETCH_TIMEOUT
+            executor = ThreadPoolExecutor(max_workers=5)
+            futures = {submit_with_ctx(executor, fetch, ticker): key for key, fetch in calls.items()}
+            try:
+                for future in as_completed(futures, timeout=FETCH_TIMEOUT):
+                    try:
+                        results[futures[future]] = future.result()
+                    except Exception as e:
+                        results[futures[future]] = e
+            except FuturesTimeoutError:
+                # Unfinished calls fail like any other fetch error (sentiment degrades)
+                for key in futures.values():
+                    if key not in results:
+                        results[key] = TimeoutError(f"{key} fetch exceeded {FETCH_TIMEOUT}s")
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+            
+            return self._assemble_fetched(ticker, results)
             
-            return data
+        except Exception as e:
+            logger.error(f"Error fetching stock data for {ticker}: {e}")
+            raise DataFetchError(f"Failed to fetch data for {ticker}: {str(e)}")
+    
+    async def _fetch_stock_data_async(self, ticker: str, include_sentiment: bool) -> Dict:
+        """
+        Fetch comprehensive stock data on the event loop
+        
+        Coroutine fetcher methods are awaited directly; blocking ones (the
+        yfinance-backed MarketDataFetcher) run in worker threads via to_thread.
+        """
+        try:
+            calls = self._fetch_calls(include_sentiment)
+            pending = [
+                fetch(ticker) if inspect.iscoroutinefunction(fetch)
+                else asyncio.to_thread(with_script_ctx(fetch), ticker)
+                for fetch in calls.values()
+            ]
+            outcomes = await asyncio.wait_for(
+                asyncio.gather(*pending, return_exceptions=True), timeout=FETCH_TIMEOUT
+            )
+            return self._assemble_fetched(ticker, dict(zip(calls, outcomes)))
             
         except Exception as e:
             logger.error(f"Error fetching stock data for {ticker}: {e}")
             raise DataFetchError(f"Failed to fetch data for {ticker}: {str(e)}")
     
+    def _fetch_calls(self, include_sentiment: bool) -> Dict:
+        """Result key -> fetch callable taking the ticker, for one analysis"""
+        calls = {
+            "stock_data": self._disk_cached("stock_data", HISTORY_DISK_TTL, self.fetcher.get_stock_data),
+            "quote": self._disk_cached("quote", QUOTE_DISK_TTL, self.fetcher.get_realtime_quote),
+            "fundamentals": self._disk_cached("fundamentals", FUNDAMENTALS_DISK_TTL, self.fetcher.get_fundamentals),
+        }
+        if include_sentiment and self.sentiment_analyzer:
+            calls["stocktwits"] = self.sentiment_analyzer.get_stocktwits_sentiment
+            calls["news"] = self.sentiment_analyzer.get_news_sentiment
+        return calls
+    
+    def _assemble_fetched(self, ticker: str, results: Dict) -> Dict:
+        """
+        Validate joined fetch results and build the data dict
+        
+        Args:
+            ticker: Stock ticker symbol
+            results: Result key -> fetched value, or the exception the fetch raised
+        
+        Returns:
+            Data dict consumed by _build_result
+        """
+        for key, value in results.items():
+            if isinstance(value, Exception) and key not in SENTIMENT_SOURCES:
+                raise value
+        
+        # Basic stock data
+        stock_data = results["stock_data"]
+        if not stock_data or "error" in stock_data:
+            raise DataFetchError(f"Cannot fetch data for {ticker}")
+        
+        # Build DataFrame
+        df = pd.DataFrame()
+        if "history" in stock_data:
+            df = self._history_frame(stock_data["history"])
+        
+        data = {
+            "ticker": ticker,
+            "timestamp_epoch": time.time(),
+            "stock_data": stock_data,
+            "quote": results["quote"],
+            "fundamentals": results["fundamentals"],
+            "df": df,
+            "closes": self._close_prices(df)  # None when there is no usable history
+        }
+        
+        # Optional: sentiment data
+        if "stocktwits" in results:
+            errors = [results[source] for source in SENTIMENT_SOURCES if isinstance(results[source], Exception)]
+            if not errors:
+                data["sentiment"] = {source: results[source] for source in SENTIMENT_SOURCES}
+            else:
+                logger.warning(f"Sentiment fetch failed for {ticker}: {errors[0]}")
+                data["sentiment"] = {}
+        
+        return data
+    
+    @staticmethod
+    def _history_frame(history: Dict) -> pd.DataFrame:
+        """
+        Build the price-history DataFrame from DataFrame.to_dict() output
+        
+        Columns produced by to_dict() share one date sequence, so each is
+        turned into a flat array against a single index instead of letting
+        pandas align every {date: value} dict separately (~2-10x faster).
+        
+        Args:
+            history: {column: {date: value}} mapping
+            
+        Returns:
+            DataFrame with a DatetimeIndex (empty if there is no history)
+        """
+        if not history:
+            return pd.DataFrame()
+        
+        columns = iter(history.values())
+        dates = list(next(columns))
+        if any(list(column) != dates for column in columns):
+            # Ragged history - let pandas align on the union of dates
+            df = pd.DataFrame(history)
+        else:
+            df = pd.DataFrame(
+                {name: np.array(list(column.values())) for name, column in history.items()},
+                index=dates
+            )
+        
+        if not df.empty and not isinstance(df.index, pd.DatetimeIndex):
+            df.index = pd.to_datetime(df.index)
+        return df
+    
+    def _disk_cached(self, endpoint: str, ttl: int, fetch):
+        """
+        Route a fetcher call through the file cache, if one was provided
+        
+        Args:
+            endpoint: Cache namespace for the call
+            ttl: Seconds a cached response stays usable
+            fetch: Fetcher method taking the ticker
+            
+        Returns:
+            Callable taking the ticker (coroutine fetchers are passed through uncached)
+        """
+        if self.file_cache is None or inspect.iscoroutinefunction(fetch):
+            return fetch
+        return partial(self.file_cache.get_or_fetch, endpoint, ttl=ttl, fetch=fetch)
+    
     # ========== PRICE EXTRACTION ==========
     
     def _extract_stock_price(self, info: Dict, quote: Dict) -> StockPrice:
         """Extract StockPrice from raw data"""
         try:
-            current = quote.get("price", info.get("currentPrice", info.get("regularMarketPrice", 0)))
-            open_price = quote.get("open", info.get("open", current))
-            high = quote.get("high", info.get("dayHigh", current))
-            low = quote.get("low", info.get("dayLow", current))
-            volume = quote.get("volume", info.get("volume", 0))
-            market_cap = info.get("marketCap", 0)
-            
-            prev_close = info.get("previousClose", current)
+            sources = {"quote": quote, "info": info}
+            current = _resolve(sources, _PRICE_FALLBACKS["current"], 0)
+            open_price = _resolve(sources, _PRICE_FALLBACKS["open"], current)
+            high = _resolve(sources, _PRICE_FALLBACKS["high"], current)
+            low = _resolve(sources, _PRICE_FALLBACKS["low"], current)
+            volume = _resolve(sources, _PRICE_FALLBACKS["volume"], 0)
+            market_cap = _resolve(sources, _PRICE_FALLBACKS["market_cap"], 0)
+            
+            prev_close = _resolve(sources, _PRICE_FALLBACKS["prev_close"], current)
             day_change = current - prev_close
             day_change_pct = (day_change / prev_close * 100) if prev_close > 0 else 0
             
-            week_52_high = info.get("fiftyTwoWeekHigh", current)
-            week_52_low = info.get("fiftyTwoWeekLow", current)
+            week_52_high = _resolve(sources, _PRICE_FALLBACKS["week_52_high"], current)
+            week_52_low = _resolve(sources, _PRICE_FALLBACKS["week_52_low"], current)
             
             return StockPrice(
                 current=current,
@@ -276,39 +686,48 @@ class StocksAnalysisService:
     
     # ========== TECHNICAL INDICATORS ==========
     
-    def _calculate_technical_indicators(self, df: pd.DataFrame, info: Dict) -> TechnicalIndicators:
-        """Calculate TechnicalIndicators from price data"""
+    def _calculate_technical_indicators(
+        self,
+        df: pd.DataFrame,
+        info: Dict,
+        closes: Optional[np.ndarray] = None
+    ) -> TechnicalIndicators:
+        """Calculate TechnicalIndicators from price data (closes: precomputed Close array)"""
         try:
-            if df.empty:
+            if closes is None:
+                closes = self._close_prices(df)
+            if closes is None:
                 raise InsufficientDataError("No historical data available")
             
-            # Use technical engine
+            # Use technical engine; moving averages it doesn't report come from the closes
             tech_data = self.technical_engine.analyze(df) if self.technical_engine else {}
+            averages = _moving_averages(closes)
+            
+            # TechnicalAnalyzer returns nested dicts; normalize bare values once
+            rsi_data = _as_dict(tech_data.get("rsi", {}))
+            macd_data = _as_dict(tech_data.get("macd", {}))
+            bb_data = _as_dict(tech_data.get("bollinger", {}))
+            price_action = _as_dict(tech_data.get("price_action", {}))
+            adx_data = _as_dict(tech_data.get("adx", {}))
             
-            # Extract values with safe defaults (TechnicalAnalyzer returns nested dicts)
-            rsi_data = tech_data.get("rsi", {})
-            rsi = rsi_data.get("value", 50.0) if isinstance(rsi_data, dict) else rsi_data
+            rsi = rsi_data.get("value", 50.0)
             
-            macd_data = tech_data.get("macd", {})
-            macd = macd_data.get("macd", 0.0) if isinstance(macd_data, dict) else 0.0
-            macd_signal = macd_data.get("signal", 0.0) if isinstance(macd_data, dict) else 0.0
-            macd_hist = macd_data.get("histogram", 0.0) if isinstance(macd_data, dict) else 0.0
+            macd = macd_data.get("macd", 0.0)
+            macd_signal = macd_data.get("signal", 0.0)
+            macd_hist = macd_data.get("histogram", 0.0)
             
             # Bollinger Bands
-            bb_data = tech_data.get("bollinger", {})
-            bollinger_high = bb_data.get("upper", 0.0) if isinstance(bb_data, dict) else 0.0
-            bollinger_mid = bb_data.get("middle", 0.0) if isinstance(bb_data, dict) else 0.0
-            bollinger_low = bb_data.get("lower", 0.0) if isinstance(bb_data, dict) else 0.0
+            bollinger_high = bb_data.get("upper", 0.0)
+            bollinger_mid = bb_data.get("middle", 0.0)
+            bollinger_low = bb_data.get("lower", 0.0)
             
             # SMAs from price_action
-            price_action = tech_data.get("price_action", {})
-            sma_20 = price_action.get("sma_20", 0.0) if isinstance(price_action, dict) else 0.0
-            sma_50 = price_action.get("sma_50", 0.0) if isinstance(price_action, dict) else 0.0
-            sma_200 = price_action.get("sma_200", 0.0) if isinstance(price_action, dict) else 0.0
+            sma_20 = price_action.get("sma_20", averages.get("sma_20", 0.0))
+            sma_50 = price_action.get("sma_50", averages.get("sma_50", 0.0))
+            sma_200 = price_action.get("sma_200", averages.get("sma_200", 0.0))
             
             # Additional indicators
-            adx_data = tech_data.get("adx", {})
-            adx = adx_data.get("value", 20.0) if isinstance(adx_data, dict) else 20.0
+            adx = adx_data.get("value", 20.0)
             
             obv = tech_data.get("obv", 0.0)
             atr = tech_data.get("atr", 0.0)
@@ -324,8 +743,8 @@ class StocksAnalysisService:
                 sma_20=sma_20,
                 sma_50=sma_50,
                 sma_200=sma_200,
-                ema_12=tech_data.get("ema_12", 0.0),
-                ema_26=tech_data.get("ema_26", 0.0),
+                ema_12=tech_data.get("ema_12", averages.get("ema_12", 0.0)),
+                ema_26=tech_data.get("ema_26", averages.get("ema_26", 0.0)),
                 adx=adx,
                 obv=obv,
                 atr=atr
@@ -335,12 +754,16 @@ class StocksAnalysisService:
             raise
         except Exception as e:
             logger.error(f"Error calculating technical indicators: {e}")
-            # Return neutral indicators on error
+            # Return neutral indicators on error, keeping the moving averages the closes give
+            averages = _moving_averages(closes)
             return TechnicalIndicators(
                 rsi=50.0, macd=0.0, macd_signal=0.0, macd_histogram=0.0,
                 bollinger_high=0.0, bollinger_mid=0.0, bollinger_low=0.0,
-                sma_20=0.0, sma_50=0.0, sma_200=0.0,
-                ema_12=0.0, ema_26=0.0,
+                sma_20=averages.get("sma_20", 0.0),
+                sma_50=averages.get("sma_50", 0.0),
+                sma_200=averages.get("sma_200", 0.0),
+                ema_12=averages.get("ema_12", 0.0),
+                ema_26=averages.get("ema_26", 0.0),
                 adx=20.0, obv=0.0, atr=0.0
             )
     
@@ -349,33 +772,11 @@ class StocksAnalysisService:
     def _extract_fundamentals(self, info: Dict, fundamentals: Dict) -> FundamentalMetrics:
         """Extract FundamentalMetrics from raw data"""
         try:
-            pe_ratio = info.get("trailingPE", info.get("forwardPE"))
-            pb_ratio = info.get("priceToBook")
-            eps = info.get("trailingEps", info.get("forwardEps"))
-            revenue_growth = info.get("revenueGrowth")
-            eps_growth = info.get("earningsGrowth")
-            
-            roe = info.get("returnOnEquity")
-            roa = info.get("returnOnAssets")
-            debt_to_equity = info.get("debtToEquity")
-            current_ratio = info.get("currentRatio")
-            
-            profit_margin = info.get("profitMargins")
-            operating_margin = info.get("operatingMargins")
-            
-            return FundamentalMetrics(
-                pe_ratio=pe_ratio,
-                pb_ratio=pb_ratio,
-                eps=eps,
-                revenue_growth=revenue_growth,
-                eps_growth=eps_growth,
-                roe=roe,
-                roa=roa,
-                debt_to_equity=debt_to_equity,
-                current_ratio=current_ratio,
-                profit_margin=profit_margin,
-                operating_margin=operating_margin
-            )
+            sources = {"info": info}
+            return FundamentalMetrics(**{
+                field: _resolve(sources, chain)
+                for field, chain in _FUNDAMENTAL_FALLBACKS.items()
+            })
             
         except Exception as e:
             logger.error(f"Error extracting fundamentals: {e}")
@@ -383,26 +784,28 @@ class StocksAnalysisService:
     
     # ========== RISK METRICS ==========
     
-    def _calculate_risk_metrics(self, df: pd.DataFrame, info: Dict, fundamentals: FundamentalMetrics) -> RiskMetrics:
-        """Calculate RiskMetrics from data"""
+    def _calculate_risk_metrics(
+        self,
+        df: pd.DataFrame,
+        info: Dict,
+        fundamentals: FundamentalMetrics,
+        risk_stats: Optional[Tuple[float, float, float]] = None,
+        closes: Optional[np.ndarray] = None
+    ) -> RiskMetrics:
+        """
+        Calculate RiskMetrics from data
+        
+        risk_stats are precomputed by analyze_many; closes is the precomputed
+        Close array (derived from df when not given).
+        """
         try:
             # Calculate from historical data if available
-            if not df.empty and "Close" in df.columns:
-                returns = df["Close"].pct_change().dropna()
-                
-                # Volatility (annualized)
-                volatility = returns.std() * np.sqrt(252)
-                
-                # Max drawdown
-                cumulative = (1 + returns).cumprod()
-                running_max = cumulative.expanding().max()
-                drawdown = (cumulative - running_max) / running_max
-                max_drawdown = drawdown.min()
-                
-                # Sharpe ratio (simplified)
-                risk_free_rate = 0.04  # 4% annual
-                excess_returns = returns.mean() * 252 - risk_free_rate
-                sharpe_ratio = excess_returns / volatility if volatility > 0 else 0
+            if risk_stats is None and closes is None:
+                closes = self._close_prices(df)
+            if risk_stats is not None:
+                volatility, max_drawdown, sharpe_ratio = risk_stats
+            elif closes is not None:
+                volatility, max_drawdown, sharpe_ratio = self._risk_from_closes(closes)
             else:
                 volatility = info.get("beta", 1.0) * 0.16  # Estimate from beta
                 max_drawdown = -0.2  # Default estimate
@@ -434,6 +837,99 @@ class StocksAnalysisService:
                 var_95=0.329
             )
     
+    @staticmethod
+    def _close_prices(df) -> Optional[np.ndarray]:
+        """
+        Close column as a float64 array from a pandas or Polars DataFrame
+        
+        Both expose .columns, len() and Series.to_numpy(), so Polars frames work
+        without importing polars here; float64 columns convert without a copy.
+        
+        Args:
+            df: Price history with a "Close" column
+        
+        Returns:
+            Close prices, or None when the frame is empty or has no Close column
+        """
+        if len(df) == 0 or "Close" not in df.columns:
+            return None
+        return np.asarray(df["Close"].to_numpy(), dtype=np.float64)
+    
+    @staticmethod
+    def _risk_from_closes(closes: np.ndarray) -> Tuple[float, float, float]:
+        """
+        Volatility, max drawdown and Sharpe ratio from a close-price array
+        
+        Args:
+            closes: Close prices, oldest first
+        
+        Returns:
+            (annualized volatility, max drawdown, Sharpe ratio) - NaN volatility
+            and drawdown when there are too few returns, as with pandas
+        """
+        if NUMBA_AVAILABLE:
+            # Single compiled pass: Welford mean/variance plus running-peak drawdown
+            return StocksAnalysisService._risk_from_moments(*_risk_kernel(closes))
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.diff(closes) / closes[:-1]
+        returns = returns[~np.isnan(returns)]
+        
+        if returns.size == 0:
+            return float("nan"), float("nan"), 0.0
+        
+        # Volatility (annualized)
+        volatility = float(returns.std(ddof=1)) * np.sqrt(252) if returns.size > 1 else float("nan")
+        
+        # Max drawdown
+        cumulative = np.cumprod(1 + returns)
+        running_max = np.maximum.accumulate(cumulative)
+        with np.errstate(invalid="ignore"):
+            drawdown = (cumulative - running_max) / running_max
+        max_drawdown = float(np.nanmin(drawdown)) if not np.isnan(drawdown).all() else float("nan")
+        
+        # Sharpe ratio (simplified)
+        excess_returns = float(returns.mean()) * 252 - RISK_FREE_RATE
+        sharpe_ratio = excess_returns / volatility if volatility > 0 else 0
+        
+        return volatility, max_drawdown, sharpe_ratio
+    
+    @staticmethod
+    def _risk_from_closes_batch(closes_list: List[np.ndarray]) -> List[Tuple[float, float, float]]:
+        """
+        _risk_from_closes for many tickers at once
+        
+        With numba the histories are left-aligned in one NaN-padded matrix and
+        run through the parallel batch kernel (one row per ticker).
+        
+        Args:
+            closes_list: Close-price arrays, oldest first
+        
+        Returns:
+            (volatility, max drawdown, Sharpe ratio) per input array, in order
+        """
+        if not NUMBA_AVAILABLE:
+            return [StocksAnalysisService._risk_from_closes(closes) for closes in closes_list]
+        
+        lengths = np.fromiter((closes.size for closes in closes_list), dtype=np.int64, count=len(closes_list))
+        padded = np.full((len(closes_list), int(lengths.max(initial=0))), np.nan)
+        for row, closes in zip(padded, closes_list):
+            row[:closes.size] = closes
+        
+        moments = _risk_kernel_batch(padded, lengths)
+        return [StocksAnalysisService._risk_from_moments(*row) for row in zip(*moments)]
+    
+    @staticmethod
+    def _risk_from_moments(count: int, mean_return: float, variance: float,
+                           max_drawdown: float) -> Tuple[float, float, float]:
+        """Convert risk-kernel output to (volatility, max drawdown, Sharpe ratio)"""
+        if count == 0:
+            return float("nan"), float("nan"), 0.0
+        volatility = sqrt(variance) * sqrt(252)
+        excess_returns = mean_return * 252 - RISK_FREE_RATE
+        sharpe_ratio = excess_returns / volatility if volatility > 0 else 0
+        return volatility, float(max_drawdown), sharpe_ratio
+    
     # ========== VALUATION ==========
     
     def _calculate_valuation(self, fundamentals: Dict, info: Dict) -> ValuationResult:
@@ -450,15 +946,7 @@ class StocksAnalysisService:
             upside = ((fair_value - current_price) / current_price * 100) if current_price > 0 else 0
             
             # Determine method
-            method_str = val_data.get("method", "DCF")
-            if "DCF" in method_str or "Cash Flow" in method_str:
-                method = ValuationMethod.DCF
-            elif "Multiple" in method_str or "P/E" in method_str:
-                method = ValuationMethod.MULTIPLES
-            elif "DDM" in method_str or "Dividend" in method_str:
-                method = ValuationMethod.DDM
-            else:
-                method = ValuationMethod.DCF
+            method = _classify_valuation_method(val_data.get("method", "DCF"))
             
             # Confidence based on data quality
             confidence = self._calculate_valuation_confidence(val_data, fundamentals, info)
@@ -510,18 +998,23 @@ class StocksAnalysisService:
         fundamental: FundamentalMetrics,
         valuation: ValuationResult,
         info: Dict,
-        df: pd.DataFrame
+        df: pd.DataFrame,
+        has_history: Optional[bool] = None
     ) -> List[TradeSignal]:
-        """Generate TradeSignal objects"""
+        """Generate TradeSignal objects (has_history: precomputed "df has closes")"""
         signals = []
         
         try:
+            if has_history is None:
+                has_history = self._close_prices(df) is not None
+            
             # Use goodbuy analyzer if available
-            if self.goodbuy_analyzer and not df.empty:
+            if self.goodbuy_analyzer and has_history:
+                # GoodBuyAnalyzer reads the typed results directly - no dict conversion
                 buy_analysis = self.goodbuy_analyzer.analyze_buy_opportunity(
                     info.get("symbol", ""),
-                    valuation.to_dict() if hasattr(valuation, 'to_dict') else {},
-                    technical.to_dict() if hasattr(technical, 'to_dict') else {},
+                    valuation,
+                    technical,
                     {},  # sentiment
                     info,
                     df
@@ -618,9 +1111,7 @@ class StocksAnalysisService:
     
     def _get_sma_alignment(self, technical: TechnicalIndicators) -> str:
         """Get SMA alignment status"""
-        if technical.sma_20 > technical.sma_50 > technical.sma_200:
-            return "BULLISH_ALIGNED"
-        elif technical.sma_20 < technical.sma_50 < technical.sma_200:
-            return "BEARISH_ALIGNED"
-        else:
-            return "MIXED"
+        fast, mid, slow = technical.sma_20, technical.sma_50, technical.sma_200
+        # Sign of each adjacent comparison: 1 above, -1 below, 0 tied (or NaN)
+        signature = ((fast > mid) - (fast < mid), (mid > slow) - (mid < slow))
+        return _SMA_ALIGNMENT.get(signature, "MIXED")
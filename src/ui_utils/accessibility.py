@@ -7,9 +7,11 @@ import streamlit as st
 from typing import Dict, List
 
 
-def inject_accessibility_css():
-    """Inject accessibility-focused CSS"""
-    a11y_css = """
+# ========== STATIC MARKUP ==========
+# Built once at import. Still emitted on every run: Streamlit clears any
+# element a rerun does not re-emit, so a once-per-session guard would drop them
+
+A11Y_CSS = """
     <style>
     /* Focus indicators */
     button:focus,
@@ -94,16 +96,38 @@ def inject_accessibility_css():
     }
     </style>
     """
-    st.markdown(a11y_css, unsafe_allow_html=True)
 
-
-def add_skip_navigation():
-    """Add skip to main content link for keyboard users"""
-    skip_nav_html = """
+SKIP_NAV_HTML = """
     <a href="#main-content" class="skip-link">Skip to main content</a>
     <div id="main-content"></div>
     """
-    st.markdown(skip_nav_html, unsafe_allow_html=True)
+
+KEYBOARD_HINT_HTML = """
+    <div style="
+        background: #1C1F2620;
+        padding: 0.75rem;
+        border-radius: 4px;
+        font-size: 0.85rem;
+        margin-bottom: 1rem;
+        border-left: 3px solid #00FF88;
+    " role="note">
+        <strong>♿ Keyboard Navigation:</strong><br>
+        <kbd>Tab</kbd> to navigate • <kbd>Enter</kbd> to select • <kbd>Esc</kbd> to close
+    </div>
+    """
+
+# Everything apply_accessibility_improvements adds, sent as one markdown element
+_A11Y_BOOT_HTML = A11Y_CSS + SKIP_NAV_HTML + KEYBOARD_HINT_HTML
+
+
+def inject_accessibility_css():
+    """Inject accessibility-focused CSS"""
+    st.markdown(A11Y_CSS, unsafe_allow_html=True)
+
+
+def add_skip_navigation():
+    """Add skip to main content link for keyboard users"""
+    st.markdown(SKIP_NAV_HTML, unsafe_allow_html=True)
 
 
 def render_accessible_metric(
@@ -272,20 +296,7 @@ class A11yHelper:
     @staticmethod
     def add_keyboard_navigation_hint():
         """Add keyboard navigation instructions"""
-        hint_html = """
-        <div style="
-            background: #1C1F2620;
-            padding: 0.75rem;
-            border-radius: 4px;
-            font-size: 0.85rem;
-            margin-bottom: 1rem;
-            border-left: 3px solid #00FF88;
-        " role="note">
-            <strong>♿ Keyboard Navigation:</strong><br>
-            <kbd>Tab</kbd> to navigate • <kbd>Enter</kbd> to select • <kbd>Esc</kbd> to close
-        </div>
-        """
-        st.markdown(hint_html, unsafe_allow_html=True)
+        st.markdown(KEYBOARD_HINT_HTML, unsafe_allow_html=True)
 
 
 def check_color_contrast(foreground: str, background: str) -> Dict:
@@ -310,10 +321,8 @@ def check_color_contrast(foreground: str, background: str) -> Dict:
 
 
 def apply_accessibility_improvements():
-    """Apply all accessibility improvements at once"""
-    inject_accessibility_css()
-    add_skip_navigation()
-    A11yHelper.add_keyboard_navigation_hint()
+    """Apply all accessibility improvements at once (single st.markdown call)"""
+    st.markdown(_A11Y_BOOT_HTML, unsafe_allow_html=True)
 
 
 # Example usage
@@ -292,6 +292,18 @@ def test_get_contracts_invalid_expiration(service, sample_chain):
     assert len(contracts) == 0
 
 
+def test_get_chain_arrays(service):
+    """Test building parallel arrays for one expiration"""
+    arrays = service.get_chain_arrays("SPY", "2024-03-15")
+
+    assert len(arrays) == 6  # 3 calls + 3 puts
+    assert list(arrays.contract_type) == [1, 1, 1, 0, 0, 0]
+    assert arrays.strike.dtype == np.float64
+    assert arrays.volume[1] == 500
+    assert arrays.implied_volatility[3] == 0.27
+    assert service.get_chain_arrays("SPY", "2099-12-31") is None
+
+
 # ========== GREEKS CALCULATION ==========
 
 def test_calculate_greeks_call(service):
@@ -372,6 +384,46 @@ def test_calculate_greeks_zero_time(service):
     assert isinstance(greeks, GreeksData)
 
 
+def test_norm_cdf_approximation_matches_ndtr():
+    """Test the A&S erf-based CDF used by the numba kernel, both tails"""
+    from scipy.special import ndtr
+    from src.services._greeks_numba import _norm_cdf
+
+    for x in np.linspace(-6, 6, 241):
+        assert abs(_norm_cdf(x) - ndtr(x)) < 1e-7
+
+
+def test_greeks_kernel_matches_vectorized(service):
+    """Test the per-contract kernel against the ndtr batch path"""
+    from src.services._greeks_numba import _bs_greeks_kernel
+
+    rng = np.random.default_rng(0)
+    strikes = rng.uniform(50, 150, 200)
+    times = rng.uniform(0, 2, 200)
+    vols = rng.uniform(0.05, 1.5, 200)
+    is_call = rng.random(200) < 0.5
+
+    out = [np.empty(200) for _ in range(5)]
+    _bs_greeks_kernel(100.0, strikes, times, vols, 0.045, is_call, *out)
+
+    expected = service.calculate_greeks_vectorized(
+        100.0, strikes, times, vols, 0.045, np.where(is_call, "call", "put")
+    )
+    for actual, name in zip(out, ("delta", "gamma", "theta", "vega", "rho")):
+        np.testing.assert_allclose(actual, expected[name], atol=1e-6)
+
+
+def test_iv_stats_skips_non_positive():
+    """Test the one-pass IV stats ignore zero, negative and NaN IVs"""
+    from src.services._greeks_numba import _iv_stats
+
+    count, mean, lo, hi = _iv_stats(np.array([0.2, 0.0, np.nan, -1.0, 0.5, 0.3]))
+    assert count == 3
+    assert mean == pytest.approx(1 / 3)
+    assert (lo, hi) == (0.2, 0.5)
+    assert _iv_stats(np.array([0.0, np.nan]))[0] == 0
+
+
 # ========== UNUSUAL ACTIVITY DETECTION ==========
 
 def test_detect_unusual_activity_found(service, sample_chain):
@@ -432,6 +484,15 @@ def test_get_strategy_recommendations_neutral(service, sample_chain):
     assert all(s["type"] == "neutral" for s in strategies)
 
 
+def test_bearish_strategy_picks_highest_otm_put(service):
+    """Test long put strike selection, including when no put is 2% OTM"""
+    strategies = service.get_strategy_recommendations("SPY", 460.0, "bearish")
+    assert strategies[0]["strike"] == 450.0  # highest strike below 460 * 0.98
+
+    strategies = service.get_strategy_recommendations("SPY", 452.0, "bearish")
+    assert strategies[0]["strike"] == 450.0  # nothing below 2% OTM -> nearest OTM
+
+
 def test_get_strategy_recommendations_no_expirations(service):
     """Test with empty chain"""
     empty_chain = OptionsChain(
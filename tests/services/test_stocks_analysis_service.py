@@ -220,6 +220,104 @@ def test_analyze_stock_success(
     assert isinstance(result.signals[0], TradeSignal)
 
 
+def test_analyze_stock_reuses_recent_result(
+    mock_components,
+    mock_stock_data,
+    mock_technical_analysis,
+    mock_valuation_result
+):
+    """Test services over the same components share the in-process result cache"""
+    mock_components["fetcher"].get_stock_data.return_value = mock_stock_data["stock_data"]
+    mock_components["fetcher"].get_realtime_quote.return_value = mock_stock_data["quote"]
+    mock_components["fetcher"].get_fundamentals.return_value = mock_stock_data["fundamentals"]
+    mock_components["technical"].analyze.return_value = mock_technical_analysis
+    mock_components["valuation"].calculate_valuation.return_value = mock_valuation_result
+    
+    with patch("src.services.stocks_analysis_service.time.time", return_value=1_700_000_000.0):
+        first = StocksAnalysisService(mock_components).analyze_stock("MSFT", include_sentiment=False)
+        second = StocksAnalysisService(mock_components).analyze_stock("MSFT", include_sentiment=False)
+    
+    assert second == first
+    assert second is not first  # each caller gets its own copy
+    assert mock_components["fetcher"].get_stock_data.call_count == 1
+
+
+def test_analyze_many_skips_failed_tickers(
+    mock_components,
+    mock_stock_data,
+    mock_technical_analysis,
+    mock_valuation_result
+):
+    """Test batch analysis returns per-ticker results and omits failures"""
+    mock_components["fetcher"].get_stock_data.side_effect = (
+        lambda ticker: {"error": "Not found"} if ticker == "BAD" else mock_stock_data["stock_data"]
+    )
+    mock_components["fetcher"].get_realtime_quote.return_value = mock_stock_data["quote"]
+    mock_components["fetcher"].get_fundamentals.return_value = mock_stock_data["fundamentals"]
+    mock_components["technical"].analyze.return_value = mock_technical_analysis
+    mock_components["valuation"].calculate_valuation.return_value = mock_valuation_result
+    
+    service = StocksAnalysisService(mock_components)
+    results = service.analyze_many(["AAPL", "BAD", "MSFT"])
+    
+    assert list(results) == ["AAPL", "MSFT"]
+    single = service._calculate_risk_metrics(
+        mock_stock_data["df"], mock_stock_data["stock_data"]["info"], FundamentalMetrics()
+    )
+    assert results["MSFT"].risk.volatility == pytest.approx(single.volatility)
+    assert results["MSFT"].risk.max_drawdown == pytest.approx(single.max_drawdown)
+
+
+def test_valuation_prices_off_fresh_quote(
+    mock_components,
+    mock_stock_data,
+    mock_technical_analysis,
+    mock_valuation_result
+):
+    """Test valuation uses the quote price, not the day-cached info price"""
+    mock_components["fetcher"].get_stock_data.return_value = mock_stock_data["stock_data"]
+    mock_components["fetcher"].get_realtime_quote.return_value = {**mock_stock_data["quote"], "price": 190.0}
+    mock_components["fetcher"].get_fundamentals.return_value = mock_stock_data["fundamentals"]
+    mock_components["technical"].analyze.return_value = mock_technical_analysis
+    mock_components["valuation"].calculate_valuation.return_value = mock_valuation_result
+    
+    service = StocksAnalysisService(mock_components)
+    result = service.analyze_many(["AAPL"])["AAPL"]
+    
+    assert result.valuation.current_price == 190.0
+    engine_info = mock_components["valuation"].calculate_valuation.call_args[0][1]
+    assert engine_info["currentPrice"] == 190.0
+    assert mock_stock_data["stock_data"]["info"]["currentPrice"] == 175.50
+
+
+def test_analyze_stock_async_awaits_coroutine_fetchers(
+    mock_components,
+    mock_stock_data,
+    mock_technical_analysis,
+    mock_valuation_result
+):
+    """Test the async path awaits async fetcher methods and threads blocking ones"""
+    import asyncio
+    
+    async def get_realtime_quote(ticker):
+        return mock_stock_data["quote"]
+    
+    mock_components["fetcher"].get_stock_data.return_value = mock_stock_data["stock_data"]
+    mock_components["fetcher"].get_realtime_quote = get_realtime_quote
+    mock_components["fetcher"].get_fundamentals.return_value = mock_stock_data["fundamentals"]
+    mock_components["technical"].analyze.return_value = mock_technical_analysis
+    mock_components["valuation"].calculate_valuation.return_value = mock_valuation_result
+    mock_components["sentiment"].get_stocktwits_sentiment.side_effect = Exception("Rate limited")
+    
+    service = StocksAnalysisService(mock_components)
+    result = asyncio.run(service.analyze_stock_async("AAPL"))
+    
+    assert isinstance(result, StockAnalysisResult)
+    assert result.price.current == mock_stock_data["quote"]["price"]
+    assert result.metadata["has_sentiment"]
+    assert "raw_data" not in result.metadata
+
+
 def test_analyze_stock_data_fetch_error(mock_components):
     """Test analysis handles data fetch errors"""
     mock_components["fetcher"].get_stock_data.return_value = {"error": "API error"}
@@ -252,6 +350,116 @@ def test_analyze_stock_without_sentiment(
     assert result.ticker == "AAPL"
 
 
+def test_fetch_stock_data_sentiment_failure(mock_components, mock_stock_data):
+    """Test a failed sentiment call does not fail the concurrent fetch"""
+    mock_components["fetcher"].get_stock_data.return_value = mock_stock_data["stock_data"]
+    mock_components["fetcher"].get_realtime_quote.return_value = mock_stock_data["quote"]
+    mock_components["fetcher"].get_fundamentals.return_value = mock_stock_data["fundamentals"]
+    mock_components["sentiment"].get_stocktwits_sentiment.return_value = {"sentiment": "bullish"}
+    mock_components["sentiment"].get_news_sentiment.side_effect = Exception("Rate limited")
+    
+    service = StocksAnalysisService(mock_components)
+    data = service._fetch_stock_data("AAPL", include_sentiment=True)
+    
+    assert data["quote"] == mock_stock_data["quote"]
+    assert data["fundamentals"] == mock_stock_data["fundamentals"]
+    assert data["sentiment"] == {}
+
+
+def test_fetch_stock_data_hung_sentiment_times_out(mock_components, mock_stock_data, monkeypatch):
+    """Test a hung sentiment call is bounded by FETCH_TIMEOUT and only drops sentiment"""
+    import threading
+    import time
+    import src.services.stocks_analysis_service as module
+    
+    release = threading.Event()
+    monkeypatch.setattr(module, "FETCH_TIMEOUT", 0.2)
+    mock_components["fetcher"].get_stock_data.return_value = mock_stock_data["stock_data"]
+    mock_components["fetcher"].get_realtime_quote.return_value = mock_stock_data["quote"]
+    mock_components["fetcher"].get_fundamentals.return_value = mock_stock_data["fundamentals"]
+    mock_components["sentiment"].get_stocktwits_sentiment.return_value = {"sentiment": "bullish"}
+    mock_components["sentiment"].get_news_sentiment.side_effect = lambda ticker: release.wait(10)
+    
+    service = StocksAnalysisService(mock_components)
+    start = time.monotonic()
+    try:
+        data = service._fetch_stock_data("AAPL", include_sentiment=True)
+        elapsed = time.monotonic() - start
+    finally:
+        release.set()
+    
+    assert elapsed < 5
+    assert data["quote"] == mock_stock_data["quote"]
+    assert data["sentiment"] == {}
+
+
+def test_fetch_stock_data_propagates_script_context(mock_components, mock_stock_data, monkeypatch):
+    """Test fetcher calls on worker threads run with the caller's script run context"""
+    import threading
+    import src.core.script_context as script_context
+    
+    # Stand-ins for Streamlit's per-thread context accessors
+    monkeypatch.setattr(script_context, "STREAMLIT_AVAILABLE", True)
+    monkeypatch.setattr(script_context, "get_script_run_ctx",
+                        lambda suppress_warning=False: getattr(threading.current_thread(), "_test_ctx", None),
+                        raising=False)
+    monkeypatch.setattr(script_context, "add_script_run_ctx",
+                        lambda thread, ctx: setattr(thread, "_test_ctx", ctx), raising=False)
+    
+    seen = {}
+    def get_stock_data(ticker):
+        seen["ctx"] = getattr(threading.current_thread(), "_test_ctx", None)
+        return mock_stock_data["stock_data"]
+    
+    mock_components["fetcher"].get_stock_data.side_effect = get_stock_data
+    mock_components["fetcher"].get_realtime_quote.return_value = mock_stock_data["quote"]
+    mock_components["fetcher"].get_fundamentals.return_value = mock_stock_data["fundamentals"]
+    
+    service = StocksAnalysisService(mock_components)
+    ctx = object()
+    threading.current_thread()._test_ctx = ctx
+    try:
+        service.analyze_many(["AAPL"])
+    finally:
+        del threading.current_thread()._test_ctx
+    
+    assert seen["ctx"] is ctx
+
+
+def test_fetch_stock_data_uses_file_cache(mock_components, mock_stock_data, tmp_path):
+    """Test fetcher responses are served from the disk cache on repeat calls"""
+    from src.core.file_cache import FileCache
+    
+    mock_components["fetcher"].get_stock_data.return_value = {"info": {"currentPrice": 150.0}}
+    mock_components["fetcher"].get_realtime_quote.return_value = mock_stock_data["quote"]
+    mock_components["fetcher"].get_fundamentals.return_value = {
+        "financials": {pd.Timestamp("2024-09-30"): {"Total Revenue": 391.0e9}}
+    }
+    mock_components["file_cache"] = FileCache(tmp_path)
+    
+    service = StocksAnalysisService(mock_components)
+    first = service._fetch_stock_data("AAPL", include_sentiment=False)
+    second = service._fetch_stock_data("AAPL", include_sentiment=False)
+    
+    assert mock_components["fetcher"].get_stock_data.call_count == 1
+    assert mock_components["fetcher"].get_realtime_quote.call_count == 1
+    assert mock_components["fetcher"].get_fundamentals.call_count == 1
+    assert second["quote"] == first["quote"]
+    assert second["fundamentals"] == {"financials": {"2024-09-30 00:00:00": {"Total Revenue": 391.0e9}}}
+
+
+def test_history_frame_matches_pandas_alignment(mock_stock_data):
+    """Test the columnar history build against pd.DataFrame on the raw dict"""
+    history = mock_stock_data["stock_data"]["history"]
+    
+    df = StocksAnalysisService._history_frame(history)
+    expected = pd.DataFrame(history)
+    expected.index = pd.to_datetime(expected.index)
+    
+    pd.testing.assert_frame_equal(df, expected, check_freq=False)
+    assert StocksAnalysisService._history_frame({}).empty
+
+
 # ========== PRICE EXTRACTION TESTS ==========
 
 def test_extract_stock_price(mock_components, mock_stock_data):
@@ -271,6 +479,22 @@ def test_extract_stock_price(mock_components, mock_stock_data):
     assert price.volume == 50000000
 
 
+def test_extract_stock_price_fallbacks(mock_components):
+    """Test quote keys win when present (even if 0) and info fills the gaps"""
+    service = StocksAnalysisService(mock_components)
+    
+    info = {"regularMarketPrice": 100.0, "dayHigh": 104.0, "volume": 5_000_000, "previousClose": 98.0}
+    quote = {"volume": 0}
+    
+    price = service._extract_stock_price(info, quote)
+    
+    assert price.current == 100.0
+    assert price.high == 104.0
+    assert price.low == 100.0  # Defaults to current
+    assert price.volume == 0
+    assert price.day_change == pytest.approx(2.0)
+
+
 # ========== TECHNICAL INDICATORS TESTS ==========
 
 def test_calculate_technical_indicators(
@@ -316,6 +540,9 @@ def test_calculate_technical_indicators_fallback(mock_components, mock_stock_dat
     assert isinstance(technical, TechnicalIndicators)
     assert technical.rsi == 50.0  # Neutral
     assert technical.macd == 0.0
+    # Moving averages still come from the close prices
+    assert technical.sma_20 == pytest.approx(df["Close"].iloc[-20:].mean())
+    assert technical.ema_12 == pytest.approx(df["Close"].ewm(span=12, adjust=False).mean().iloc[-1])
 
 
 # ========== FUNDAMENTALS TESTS ==========
@@ -356,6 +583,57 @@ def test_calculate_risk_metrics(mock_components, mock_stock_data):
     assert risk.sharpe_ratio is not None
 
 
+def test_risk_kernel_matches_numpy_path():
+    """Test the one-pass risk kernel against the NumPy implementation"""
+    from src.services._risk_njit import _risk_kernel
+    
+    closes = 100 * np.cumprod(1 + np.random.default_rng(7).normal(0, 0.02, 250))
+    closes[[10, 120]] = np.nan
+    
+    with patch("src.services.stocks_analysis_service.NUMBA_AVAILABLE", False):
+        volatility, max_drawdown, sharpe_ratio = StocksAnalysisService._risk_from_closes(closes)
+    count, mean_return, variance, kernel_drawdown = _risk_kernel(closes)
+    
+    assert count == 245  # each NaN close drops the two returns around it
+    assert np.sqrt(variance) * np.sqrt(252) == pytest.approx(volatility)
+    assert kernel_drawdown == pytest.approx(max_drawdown)
+    assert (mean_return * 252 - 0.04) / volatility == pytest.approx(sharpe_ratio)
+
+
+def test_risk_kernel_batch_matches_rows():
+    """Test the padded batch kernel against one kernel call per ticker"""
+    from src.services._risk_njit import _risk_kernel, _risk_kernel_batch
+    
+    rng = np.random.default_rng(11)
+    histories = [100 * np.cumprod(1 + rng.normal(0, 0.02, n)) for n in (30, 1, 250)]
+    lengths = np.array([h.size for h in histories], dtype=np.int64)
+    padded = np.full((len(histories), lengths.max()), np.nan)
+    for row, closes in zip(padded, histories):
+        row[:closes.size] = closes
+    
+    counts, means, variances, drawdowns = _risk_kernel_batch(padded, lengths)
+    
+    for i, closes in enumerate(histories):
+        expected = _risk_kernel(closes)
+        assert counts[i] == expected[0]
+        np.testing.assert_allclose([means[i], variances[i], drawdowns[i]], expected[1:], equal_nan=True)
+
+
+def test_calculate_risk_metrics_polars_df(mock_components, mock_stock_data):
+    """Test risk metrics accept a Polars price history"""
+    pl = pytest.importorskip("polars")
+    service = StocksAnalysisService(mock_components)
+    
+    df = mock_stock_data["df"]
+    info = mock_stock_data["stock_data"]["info"]
+    
+    expected = service._calculate_risk_metrics(df, info, FundamentalMetrics())
+    risk = service._calculate_risk_metrics(pl.from_pandas(df), info, FundamentalMetrics())
+    
+    assert risk.volatility == pytest.approx(expected.volatility)
+    assert risk.max_drawdown == pytest.approx(expected.max_drawdown)
+
+
 def test_calculate_risk_metrics_empty_df(mock_components, mock_stock_data):
     """Test risk metrics with empty DataFrame (uses estimates)"""
     service = StocksAnalysisService(mock_components)
@@ -389,6 +667,20 @@ def test_calculate_valuation(mock_components, mock_stock_data, mock_valuation_re
     assert valuation.confidence > 0
 
 
+@pytest.mark.parametrize("method_str, expected", [
+    ("Discounted Cash Flow", ValuationMethod.DCF),
+    ("P/E Multiple", ValuationMethod.MULTIPLES),
+    ("P/E with DCF cross-check", ValuationMethod.DCF),  # DCF keywords take priority
+    ("Dividend Discount", ValuationMethod.DDM),
+    ("Asset based", ValuationMethod.DCF),
+])
+def test_classify_valuation_method(method_str, expected):
+    """Test engine method names map to ValuationMethod in priority order"""
+    from src.services.stocks_analysis_service import _classify_valuation_method
+    
+    assert _classify_valuation_method(method_str) == expected
+
+
 def test_calculate_valuation_error(mock_components, mock_stock_data):
     """Test valuation handles errors"""
     mock_components["valuation"].calculate_valuation.return_value = {
@@ -430,6 +722,33 @@ def test_generate_trade_signals_with_goodbuy(
     assert signals[0].entry_price > 0
 
 
+def test_goodbuy_accepts_typed_results_like_legacy_dicts(mock_stock_data):
+    """Test GoodBuyAnalyzer scores typed results the same as the equivalent legacy dicts"""
+    from analysis_engine import GoodBuyAnalyzer
+    
+    technical = TechnicalIndicators(
+        rsi=30.0, macd=1.2, macd_signal=0.8, macd_histogram=0.4,
+        bollinger_high=0.0, bollinger_mid=0.0, bollinger_low=0.0,
+        sma_20=0.0, sma_50=0.0, sma_200=0.0,
+        ema_12=0.0, ema_26=0.0, adx=20.0, obv=0.0
+    )
+    valuation = ValuationResult(
+        fair_value=210.0, current_price=175.5, upside_pct=19.66,
+        method=ValuationMethod.DCF, confidence=70.0
+    )
+    legacy_technical = {"rsi": {"value": 30.0}, "macd": {"bullish": True}}
+    legacy_valuation = {"upside": 19.66, "fair_value": 210.0}
+    info = mock_stock_data["stock_data"]["info"]
+    df = mock_stock_data["df"]
+    
+    analyzer = GoodBuyAnalyzer()
+    typed = analyzer.analyze_buy_opportunity("AAPL", valuation, technical, {}, info, df)
+    legacy = analyzer.analyze_buy_opportunity("AAPL", legacy_valuation, legacy_technical, {}, info, df)
+    
+    assert typed["scores"] == legacy["scores"]
+    assert typed["target_price"] == legacy["target_price"]
+
+
 def test_generate_trade_signals_without_goodbuy(mock_components):
     """Test trade signal generation without goodbuy analyzer (fallback)"""
     mock_components["goodbuy"] = None
@@ -599,6 +918,22 @@ def test_get_sma_alignment_mixed(mock_components):
     assert alignment == "MIXED"
 
 
+def test_get_sma_alignment_tied_is_mixed(mock_components):
+    """Test tied SMAs (e.g. the neutral fallback indicators) are not bearish"""
+    service = StocksAnalysisService(mock_components)
+    
+    technical = TechnicalIndicators(
+        rsi=50.0, macd=0.0, macd_signal=0.0, macd_histogram=0.0,
+        bollinger_high=0.0, bollinger_mid=0.0, bollinger_low=0.0,
+        sma_20=0.0, sma_50=0.0, sma_200=0.0,
+        ema_12=0.0, ema_26=0.0, adx=20.0, obv=0.0
+    )
+    
+    assert service._get_sma_alignment(technical) == "MIXED"
+    technical.sma_20, technical.sma_50, technical.sma_200 = 170.0, 175.0, 180.0
+    assert service._get_sma_alignment(technical) == "BEARISH_ALIGNED"
+
+
 # ========== INTEGRATION TESTS ==========
 
 def test_full_analysis_pipeline(